@@ -0,0 +1 @@
+"""Performance benchmarks for Praxis (not part of the test suite)."""
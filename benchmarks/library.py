@@ -0,0 +1,273 @@
+"""Research library benchmarks on synthetic libraries.
+
+Generates libraries of a given size in the same shape ``praxis library
+catalog`` produces (artifacts with HTML-comment metadata blocks, a
+``catalog.jsonl`` store and a rendered CATALOG.md), then times the
+librarian and cataloging operations against them.
+
+Usage:
+    python -m benchmarks.library --sizes 1000 10000 100000 --output bench.json
+    python -m benchmarks.library --sizes 1000 --compare bench.json
+
+Each operation is timed once cold (no ``.index/`` caches) and ``--repeat``
+times warm. Results are written as JSON so runs can be compared across
+commits with ``--compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from praxis.application.cataloging_service import find_orphans
+from praxis.application.library_service import check_stale
+from praxis.domain.catalog import CatalogEntry
+from praxis.infrastructure.catalog_store import CatalogStore, save_catalog_store
+from praxis.infrastructure.catalog_writer import update_catalog, write_catalog
+from praxis.infrastructure.librarian import query_library, search_library
+from praxis.infrastructure.library_index import INDEX_DIR
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+TOPICS = ["foundations", "patterns", "roles", "stages", "domains", "spec", "subagents"]
+VOCABULARY = """
+    adapters agile architecture backlog boundaries capture coaching cohesion consensus contracts coupling
+    delivery discovery domain estimation events facilitation feedback governance hexagonal iteration kanban
+    lifecycle metrics modularity ownership planning ports prioritization refactoring retrospective risk
+    roadmap scrum services stakeholders sustain testing validation workflow
+""".split()
+CONSENSUS = ["high", "medium", "low", "split"]
+EPOCH = date(2024, 1, 1)
+
+SEARCH_QUERY = "hexagonal ports"
+QUESTION = "How should ports and adapters handle domain boundaries?"
+
+
+def make_entry(number: int, rng: random.Random) -> CatalogEntry:
+    """Build a synthetic catalog entry."""
+    topic = TOPICS[number % len(TOPICS)]
+    day = (EPOCH + timedelta(days=rng.randrange(3 * 365))).isoformat()
+    keywords = rng.sample(VOCABULARY, rng.randint(3, 6))
+    artifact_id = f"{topic}-{keywords[0]}-{number:06d}-{day}"
+    return CatalogEntry(
+        id=artifact_id,
+        title=f"{keywords[0].title()} and {keywords[1].title()} Study {number}",
+        date=day,
+        status="approved",
+        topic=topic,
+        keywords=keywords,
+        consensus=rng.choice(CONSENSUS),
+        sources_count=rng.randint(1, 12),
+        path=Path(topic) / f"{artifact_id}.md",
+    )
+
+
+def render_artifact(entry: CatalogEntry) -> str:
+    """Render an artifact file with an HTML-comment metadata block."""
+    keywords = ", ".join(entry.keywords)
+    return (
+        f"# {entry.title}\n\n"
+        "<!--\n"
+        "metadata:\n"
+        f"  id: {entry.id}\n"
+        f"  title: {entry.title}\n"
+        f"  date: {entry.date}\n"
+        f"  status: {entry.status}\n"
+        f"  topic: {entry.topic}\n"
+        f"  keywords: [{keywords}]\n"
+        f"  consensus: {entry.consensus}\n"
+        f"  sources_count: {entry.sources_count}\n"
+        "-->\n\n"
+        "## Executive Summary\n\n"
+        f"Synthetic findings on {keywords}.\n\n"
+        "## Findings\n\n" + f"Evidence about {entry.keywords[0]} and {entry.keywords[-1]}. " * 20 + "\n"
+    )
+
+
+def generate_library(root: Path, count: int, seed: int = 0) -> list[CatalogEntry]:
+    """Write a synthetic research library.
+
+    Args:
+        root: Directory to create the library in.
+        count: Number of artifacts.
+        seed: Random seed, so a size always produces the same library.
+
+    Returns:
+        The library's catalog entries.
+    """
+    rng = random.Random(seed)
+    entries = [make_entry(number, rng) for number in range(count)]
+    for topic in TOPICS:
+        (root / topic).mkdir(parents=True, exist_ok=True)
+    for entry in entries:
+        (root / entry.path).write_text(render_artifact(entry), encoding="utf-8")
+
+    store = CatalogStore(entries)
+    catalog_path = root / "CATALOG.md"
+    write_catalog(catalog_path, store.entries)
+    save_catalog_store(store, catalog_path)
+    return store.entries
+
+
+def _clear_index(library: Path) -> None:
+    shutil.rmtree(library / INDEX_DIR, ignore_errors=True)
+
+
+def time_operation(
+    operation: Callable[[], object],
+    repeat: int,
+    reset: Callable[[], object] | None = None,
+) -> dict[str, Any]:
+    """Time an operation once cold and ``repeat`` times warm.
+
+    Args:
+        operation: The call to time.
+        repeat: Number of warm runs.
+        reset: Called (untimed) before every run, e.g. to undo a mutation.
+
+    Returns:
+        Cold time and warm min/median times in seconds.
+    """
+    runs: list[float] = []
+    for _ in range(repeat + 1):
+        if reset is not None:
+            reset()
+        start = time.perf_counter()
+        operation()
+        runs.append(time.perf_counter() - start)
+    warm = runs[1:] or runs
+    return {"cold_s": runs[0], "warm_min_s": min(warm), "warm_median_s": statistics.median(warm)}
+
+
+def benchmark_size(workdir: Path, count: int, repeat: int, seed: int = 0) -> dict[str, Any]:
+    """Generate a library of ``count`` artifacts and time each operation on it."""
+    library = workdir / f"library-{count}"
+    catalog_path = library / "CATALOG.md"
+
+    start = time.perf_counter()
+    generate_library(library, count, seed)
+    generate_s = time.perf_counter() - start
+
+    operations: dict[str, dict[str, Any]] = {}
+
+    _clear_index(library)
+    operations["search_library"] = time_operation(lambda: search_library(SEARCH_QUERY, catalog_path), repeat)
+    _clear_index(library)
+    # Uncached, so warm runs keep measuring query execution
+    operations["query_library"] = time_operation(lambda: query_library(QUESTION, library, use_cache=False), repeat)
+    _clear_index(library)
+    operations["query_library_cached"] = time_operation(lambda: query_library(QUESTION, library), repeat)
+    _clear_index(library)
+    operations["find_orphans"] = time_operation(lambda: find_orphans(library), repeat)
+    _clear_index(library)
+    operations["check_stale"] = time_operation(lambda: check_stale(365, library), repeat)
+
+    # update_catalog edits CATALOG.md in place; restore it before each run
+    catalog = catalog_path.read_text(encoding="utf-8")
+    new_entry = make_entry(count, random.Random(seed + 1))
+    operations["update_catalog"] = time_operation(
+        lambda: update_catalog(catalog_path, new_entry),
+        repeat,
+        reset=lambda: catalog_path.write_text(catalog, encoding="utf-8"),
+    )
+
+    return {"artifacts": count, "generate_s": generate_s, "operations": operations}
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run_benchmarks(sizes: list[int], repeat: int = 3, workdir: Path | None = None, seed: int = 0) -> dict[str, Any]:
+    """Run the benchmarks for each library size.
+
+    Args:
+        sizes: Library sizes (artifact counts).
+        repeat: Warm runs per operation.
+        workdir: Where to generate libraries (a temporary directory if None).
+        seed: Random seed for the synthetic libraries.
+
+    Returns:
+        JSON-serializable results keyed by library size.
+    """
+    results: dict[str, Any] = {
+        "version": RESULTS_VERSION,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "sizes": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="praxis-bench-") as temp_dir:
+        root = workdir if workdir is not None else Path(temp_dir)
+        for count in sizes:
+            results["sizes"][str(count)] = benchmark_size(root, count, repeat, seed)
+    return results
+
+
+def compare_results(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Describe warm median changes against a baseline run.
+
+    Returns:
+        One line per operation present in both runs, e.g.
+        ``10000 search_library: 0.0123s -> 0.0101s (0.82x)``.
+    """
+    lines = []
+    for size, result in current["sizes"].items():
+        before = baseline.get("sizes", {}).get(size)
+        if not before:
+            continue
+        for name, timing in result["operations"].items():
+            old = before["operations"].get(name)
+            if not old:
+                continue
+            new_s, old_s = timing["warm_median_s"], old["warm_median_s"]
+            ratio = new_s / old_s if old_s else float("inf")
+            lines.append(f"{size} {name}: {old_s:.4f}s -> {new_s:.4f}s ({ratio:.2f}x)")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Library sizes to benchmark.")
+    parser.add_argument("--repeat", type=int, default=3, help="Warm runs per operation.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic libraries.")
+    parser.add_argument("--workdir", type=Path, help="Keep generated libraries here instead of a temp dir.")
+    parser.add_argument("--output", "-o", type=Path, help="Write results JSON to this file.")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON to compare against.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, repeat=args.repeat, workdir=args.workdir, seed=args.seed)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        for line in compare_results(results, baseline):
+            print(line, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
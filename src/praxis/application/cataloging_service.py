@@ -6,15 +6,67 @@ Implements the Cataloger role operations.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import shutil
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
-
-from praxis.domain.catalog import CatalogResult
+from typing import Any
+
+from praxis.domain.catalog import (
+    ArtifactValidation,
+    BatchCatalogResult,
+    CatalogEntry,
+    CatalogResult,
+    ReindexResult,
+    SimilarArtifact,
+    ValidationError,
+)
+from praxis.infrastructure.catalog_graph import build_catalog_graph, save_catalog_graph
+from praxis.infrastructure.catalog_lock import CatalogLockTimeout, catalog_lock
 from praxis.infrastructure.catalog_metadata_parser import (
     parse_artifact_metadata,
     validate_artifact_metadata,
 )
-from praxis.infrastructure.catalog_writer import update_catalog
+from praxis.infrastructure.catalog_store import (
+    CatalogStore,
+    load_catalog_store,
+    open_catalog_store,
+    save_catalog_store,
+)
+from praxis.infrastructure.catalog_writer import (
+    add_catalog_entries,
+    sort_entries,
+    write_catalog,
+)
+from praxis.infrastructure.file_writer import atomic_write_text
+from praxis.infrastructure.librarian import (
+    extract_summary,
+    find_similar_artifacts_many,
+    parse_catalog_content,
+    parse_topic_headings,
+)
+from praxis.infrastructure.library_index import (
+    SummaryCache,
+    get_index_dir,
+    load_cataloged_paths,
+    load_summary_cache,
+    save_summary_cache,
+)
+
+# Number of similar existing artifacts reported when cataloging
+SIMILAR_TOP_K = 5
+
+# Reported when a hand-curated CATALOG.md is edited in place rather than
+# converted to the catalog store
+IN_PLACE_WARNING = (
+    "CATALOG.md was updated in place: converting it to the catalog store would drop "
+    "hand-written content; use 'praxis library catalog --import-catalog' to convert it anyway"
+)
 
 
 def validate_metadata(artifact_path: Path) -> CatalogResult:
@@ -29,16 +81,12 @@ def validate_metadata(artifact_path: Path) -> CatalogResult:
     try:
         metadata = parse_artifact_metadata(artifact_path)
     except Exception as e:
-        from praxis.domain.catalog import ValidationError
-
         return CatalogResult(
             success=False,
             errors=[ValidationError(field="metadata", message=str(e))],
         )
 
     if not metadata:
-        from praxis.domain.catalog import ValidationError
-
         return CatalogResult(
             success=False,
             errors=[
@@ -62,6 +110,10 @@ def check_duplicate_id(artifact_id: str, catalog_path: Path) -> bool:
     Returns:
         True if ID exists, False otherwise.
     """
+    store = load_catalog_store(catalog_path)
+    if store is not None:
+        return artifact_id in store
+
     if not catalog_path.exists():
         return False
 
@@ -74,11 +126,97 @@ def check_duplicate_id(artifact_id: str, catalog_path: Path) -> bool:
     return bool(re.search(pattern, content))
 
 
+def _commit_store(store: CatalogStore, catalog_path: Path) -> None:
+    """Render CATALOG.md from the store, then persist the store and its graph.
+
+    If the store cannot be written, the previous CATALOG.md is restored so
+    the rendered view never gets ahead of the source of truth.
+    """
+    previous = catalog_path.read_text(encoding="utf-8") if catalog_path.exists() else None
+    write_catalog(catalog_path, store.entries)
+    try:
+        save_catalog_store(store, catalog_path)
+    except Exception:
+        if previous is None:
+            catalog_path.unlink(missing_ok=True)
+        else:
+            atomic_write_text(catalog_path, previous)
+        raise
+    save_catalog_graph(build_catalog_graph(store.entries), catalog_path)
+
+
+def _keep_topic_headings(entries: list[CatalogEntry], catalog_path: Path) -> None:
+    """Carry the current catalog's topic display names over to rebuilt entries."""
+    try:
+        store = load_catalog_store(catalog_path)
+        if store is not None:
+            known = {entry.topic: entry.topic_heading for entry in store.entries if entry.topic_heading}
+        else:
+            content = catalog_path.read_text(encoding="utf-8")
+            by_id = parse_topic_headings(content)
+            known = {a["topic"]: by_id[a["id"]] for a in parse_catalog_content(content) if a["id"] in by_id}
+    except (OSError, ValueError):
+        return
+    for entry in entries:
+        if entry.topic_heading is None:
+            entry.topic_heading = known.get(entry.topic)
+
+
+def _is_cataloged(artifact_id: str, store: CatalogStore | None, catalog_path: Path) -> bool:
+    """Whether an ID is in the store, or in CATALOG.md for a library without one."""
+    if store is not None:
+        return artifact_id in store
+    return check_duplicate_id(artifact_id, catalog_path)
+
+
+def _add_to_catalog(store: CatalogStore | None, entries: list[CatalogEntry], catalog_path: Path) -> list[str]:
+    """Add entries through the store, or to CATALOG.md in place if there is none.
+
+    Returns:
+        Warnings for the caller to report.
+    """
+    if store is None:
+        add_catalog_entries(catalog_path, entries)
+        return [IN_PLACE_WARNING]
+    store.insert(entries)
+    _commit_store(store, catalog_path)
+    return []
+
+
+def _find_similar(artifact_paths: list[Path], catalog_path: Path) -> list[list[SimilarArtifact]]:
+    """Find the existing artifacts most similar to each artifact being cataloged.
+
+    Similarity is advisory, so an unreadable artifact or index yields no matches
+    rather than failing the cataloging.
+    """
+    try:
+        texts = [path.read_text(encoding="utf-8") for path in artifact_paths]
+        found = find_similar_artifacts_many(texts, catalog_path, SIMILAR_TOP_K)
+    except (OSError, ValueError):
+        return [[] for _ in artifact_paths]
+    return [[SimilarArtifact(id=m.id, path=m.path, score=m.relevance_score) for m in matches] for matches in found]
+
+
+def _cache_summaries(library_path: Path, entries: list[CatalogEntry]) -> None:
+    """Put newly cataloged artifacts' Executive Summaries in the summary cache."""
+    cache = load_summary_cache(library_path)
+    for entry in entries:
+        artifact_path = library_path / entry.path
+        try:
+            stat = artifact_path.stat()
+            content = artifact_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        cache.put(Path(entry.path).as_posix(), stat.st_mtime_ns, stat.st_size, extract_summary(content))
+    save_summary_cache(cache, library_path)
+
+
 def catalog_artifact(
     artifact_path: Path,
     topic: str,
     library_path: Path,
     catalog_path: Path | None = None,
+    import_existing: bool = False,
 ) -> CatalogResult:
     """Catalog a research artifact into the research library.
 
@@ -87,13 +225,19 @@ def catalog_artifact(
     2. Check for duplicate ID
     3. Create topic folder if needed
     4. Move artifact to topic folder
-    5. Update CATALOG.md
+    5. Add to the catalog store and re-render CATALOG.md
+
+    A library without a catalog store has its CATALOG.md imported first,
+    unless that would drop hand-written content; such a catalog is updated
+    in place (with a warning) until ``import_existing`` is set.
 
     Args:
         artifact_path: Path to the artifact to catalog.
         topic: Topic folder name (e.g., "patterns", "roles").
         library_path: Path to research-library directory.
         catalog_path: Optional path to CATALOG.md (defaults to library_path/CATALOG.md).
+        import_existing: Convert a hand-curated CATALOG.md to the store even
+            if re-rendering it loses content.
 
     Returns:
         CatalogResult with outcome.
@@ -110,55 +254,198 @@ def catalog_artifact(
     assert validation_result.entry is not None
     entry = validation_result.entry
 
-    # Step 2: Check for duplicate ID
-    if check_duplicate_id(entry.id, catalog_path):
-        from praxis.domain.catalog import ValidationError
+    # Similarity may tokenize the whole library on a cold index, so it is
+    # computed before taking the lock rather than holding other writers up
+    similar = _find_similar([artifact_path], catalog_path)[0]
 
-        return CatalogResult(
-            success=False,
-            errors=[ValidationError(field="id", message=f"duplicate ID: {entry.id}")],
-        )
+    # Steps 2-5 read and write the catalog, so they run under the catalog lock
+    try:
+        with catalog_lock(catalog_path):
+            # Step 2: Check for duplicate ID
+            try:
+                store = open_catalog_store(catalog_path, import_existing)
+            except ValueError as e:
+                return CatalogResult(success=False, errors=[ValidationError(field="catalog", message=str(e))])
+            if _is_cataloged(entry.id, store, catalog_path):
+                return CatalogResult(
+                    success=False,
+                    errors=[ValidationError(field="id", message=f"duplicate ID: {entry.id}")],
+                )
 
-    # Step 3: Create topic folder if needed
-    topic_path = library_path / topic
-    topic_path.mkdir(parents=True, exist_ok=True)
+            # Step 3: Create topic folder if needed
+            topic_path = library_path / topic
+            topic_path.mkdir(parents=True, exist_ok=True)
+
+            # Step 4: Move artifact to topic folder
+            destination = topic_path / artifact_path.name
+            shutil.copy2(artifact_path, destination)
+
+            # Update entry path to be relative to library
+            entry.path = Path(topic) / artifact_path.name
+
+            # Step 5: Add to the catalog store and re-render CATALOG.md
+            try:
+                warnings = _add_to_catalog(store, [entry], catalog_path)
+            except Exception as e:
+                # Rollback: remove copied file
+                if destination.exists():
+                    destination.unlink()
+
+                return CatalogResult(
+                    success=False,
+                    errors=[
+                        ValidationError(
+                            field="catalog",
+                            message=f"Failed to update catalog: {e}",
+                        )
+                    ],
+                )
+    except CatalogLockTimeout as e:
+        return CatalogResult(success=False, errors=[ValidationError(field="catalog", message=str(e))])
 
-    # Step 4: Move artifact to topic folder
-    destination = topic_path / artifact_path.name
-    shutil.copy2(artifact_path, destination)
+    _cache_summaries(library_path, [entry])
+    return CatalogResult(success=True, entry=entry, similar=similar, warnings=warnings)
 
-    # Update entry path to be relative to library
-    entry.path = Path(topic) / artifact_path.name
 
-    # Step 5: Update CATALOG.md
-    try:
-        update_catalog(catalog_path, entry)
-    except Exception as e:
-        # Rollback: remove copied file
-        if destination.exists():
-            destination.unlink()
+def list_batch_artifacts(batch_dir: Path) -> list[Path]:
+    """List the artifacts in a batch directory.
 
-        from praxis.domain.catalog import ValidationError
+    Only top-level markdown files are considered; catalog and index files
+    are skipped.
 
-        return CatalogResult(
+    Args:
+        batch_dir: Directory holding artifacts to catalog.
+
+    Returns:
+        Artifact paths sorted by file name.
+    """
+    return sorted(path for path in batch_dir.glob("*.md") if path.is_file() and path.name not in NON_ARTIFACT_FILES)
+
+
+def catalog_artifacts(
+    artifact_paths: list[Path],
+    library_path: Path,
+    catalog_path: Path | None = None,
+    import_existing: bool = False,
+) -> BatchCatalogResult:
+    """Catalog several research artifacts in one pass.
+
+    Every artifact is validated and checked for duplicate IDs (against the
+    catalog and within the batch) before anything is written. Each artifact
+    is filed under the topic from its metadata, then the batch is added to
+    the catalog store and CATALOG.md is rendered once. If any step fails,
+    copied files are removed and the catalog is left as it was.
+
+    A hand-curated CATALOG.md is updated in place rather than converted to
+    the store, as in :func:`catalog_artifact`.
+
+    Args:
+        artifact_paths: Paths to the artifacts to catalog.
+        library_path: Path to research-library directory.
+        catalog_path: Optional path to CATALOG.md (defaults to library_path/CATALOG.md).
+        import_existing: Convert a hand-curated CATALOG.md to the store even
+            if re-rendering it loses content.
+
+    Returns:
+        BatchCatalogResult with outcome.
+    """
+    if catalog_path is None:
+        catalog_path = library_path / "CATALOG.md"
+
+    if not artifact_paths:
+        return BatchCatalogResult(
             success=False,
-            errors=[
-                ValidationError(
-                    field="catalog",
-                    message=f"Failed to update catalog: {e}",
-                )
-            ],
+            errors=[ValidationError(field="batch", message="no artifacts to catalog")],
         )
 
-    return CatalogResult(success=True, entry=entry)
+    # Step 1: Validate every artifact before touching the library
+    validated: list[tuple[Path, CatalogEntry]] = []
+    errors: list[ValidationError] = []
+    for artifact_path in artifact_paths:
+        result = validate_metadata(artifact_path)
+        if result.success and result.entry is not None:
+            validated.append((artifact_path, result.entry))
+        else:
+            errors.extend(
+                ValidationError(field=e.field, message=f"{artifact_path.name}: {e.message}") for e in result.errors
+            )
+
+    # Computed before taking the lock (see catalog_artifact)
+    similar = _find_similar([artifact_path for artifact_path, _ in validated], catalog_path) if not errors else []
+
+    # Steps 2-5 read and write the catalog, so they run under the catalog lock
+    try:
+        with catalog_lock(catalog_path):
+            # Step 2: Check for duplicate IDs against the catalog and within the batch
+            try:
+                store = open_catalog_store(catalog_path, import_existing)
+            except ValueError as e:
+                return BatchCatalogResult(success=False, errors=[ValidationError(field="catalog", message=str(e))])
+            seen: set[str] = set()
+            for artifact_path, entry in validated:
+                if _is_cataloged(entry.id, store, catalog_path) or entry.id in seen:
+                    message = f"{artifact_path.name}: duplicate ID: {entry.id}"
+                    errors.append(ValidationError(field="id", message=message))
+                seen.add(entry.id)
+
+            if errors:
+                return BatchCatalogResult(success=False, errors=errors)
+
+            # Step 3: Copy artifacts into their topic folders
+            copied: list[Path] = []
+            try:
+                for artifact_path, entry in validated:
+                    topic_path = library_path / entry.topic
+                    topic_path.mkdir(parents=True, exist_ok=True)
+                    destination = topic_path / artifact_path.name
+                    if destination.exists() and not destination.samefile(artifact_path):
+                        raise FileExistsError(f"{destination} already exists")
+                    if not destination.exists():
+                        shutil.copy2(artifact_path, destination)
+                        copied.append(destination)
+                    entry.path = Path(entry.topic) / artifact_path.name
+
+                # Step 4: Add the batch to the store and render CATALOG.md once
+                warnings = _add_to_catalog(store, [entry for _, entry in validated], catalog_path)
+            except Exception as e:
+                # Rollback: remove every copied file
+                for destination in copied:
+                    destination.unlink(missing_ok=True)
+
+                return BatchCatalogResult(
+                    success=False,
+                    errors=[ValidationError(field="catalog", message=f"Failed to update catalog: {e}")],
+                )
+    except CatalogLockTimeout as e:
+        return BatchCatalogResult(success=False, errors=[ValidationError(field="catalog", message=str(e))])
+
+    entries = [entry for _, entry in validated]
+    _cache_summaries(library_path, entries)
+    return BatchCatalogResult(
+        success=True,
+        entries=entries,
+        similar={entry.id: matches for entry, matches in zip(entries, similar)},
+        warnings=warnings,
+    )
 
 
-def find_orphans(library_path: Path, catalog_path: Path | None = None) -> list[Path]:
-    """Find artifacts not listed in CATALOG.md.
+def find_orphans(
+    library_path: Path,
+    catalog_path: Path | None = None,
+    since_last_run: bool = False,
+) -> list[Path]:
+    """Find artifacts not listed in the catalog.
+
+    Cataloged paths come from a cached set that is only rebuilt when the
+    catalog changes. Each run records its start time; with
+    ``since_last_run`` only files modified or moved in after the previous
+    run are examined, plus the orphans that run reported. A changed catalog, or no
+    previous run, falls back to a full walk.
 
     Args:
         library_path: Path to research-library directory.
         catalog_path: Optional path to CATALOG.md (defaults to library_path/CATALOG.md).
+        since_last_run: Only check files modified since the previous run.
 
     Returns:
         List of relative paths to orphaned artifacts.
@@ -166,64 +453,349 @@ def find_orphans(library_path: Path, catalog_path: Path | None = None) -> list[P
     if catalog_path is None:
         catalog_path = library_path / "CATALOG.md"
 
-    if not catalog_path.exists():
+    cataloged = load_cataloged_paths(catalog_path)
+    if cataloged is None:
         return []
 
-    # Get all markdown files in library (excluding CATALOG.md and _index.md files)
-    all_artifacts: set[Path] = set()
-    for md_file in library_path.rglob("*.md"):
-        # Skip CATALOG.md and _index.md files
-        if md_file.name in ["CATALOG.md", "_index.md"]:
+    state_path = get_index_dir(catalog_path) / ORPHANS_STATE
+    catalog_key = [cataloged.source, cataloged.mtime_ns, cataloged.size]
+    started_ns = time.time_ns()
+
+    modified_after_ns: int | None = None
+    candidates: set[str] = set()
+    if since_last_run:
+        state = _load_orphans_state(state_path)
+        if state.get("catalog") == catalog_key and isinstance(state.get("last_run_ns"), int):
+            # Allow for filesystems with coarse timestamps
+            modified_after_ns = state["last_run_ns"] - MTIME_SLACK_NS
+            candidates = {p for p in state.get("orphans", []) if (library_path / p).is_file()}
+
+    candidates.update(_walk_artifacts(library_path, modified_after_ns))
+    orphans = sorted(p for p in candidates if p not in cataloged.paths)
+
+    try:
+        _save_orphans_state(state_path, {"last_run_ns": started_ns, "catalog": catalog_key, "orphans": orphans})
+    except OSError:
+        pass
+
+    return [Path(p) for p in orphans]
+
+
+# Markdown files in the library that are not research artifacts
+NON_ARTIFACT_FILES = {"CATALOG.md", "_index.md", "README.md"}
+
+# Reindex manifest, stored in the library's .index/ directory
+REINDEX_MANIFEST = "reindex-manifest.json"
+REINDEX_MANIFEST_VERSION = 1
+
+# Orphan check state (last run time and its findings), also in .index/
+ORPHANS_STATE = "orphans-state.json"
+ORPHANS_STATE_VERSION = 1
+MTIME_SLACK_NS = 2_000_000_000
+
+
+def _walk_artifacts(library_path: Path, modified_after_ns: int | None = None) -> Iterator[str]:
+    """Yield artifact paths relative to the library, in POSIX form.
+
+    Walks with ``os.scandir`` and prunes hidden directories (``.git``,
+    ``.index``) without descending into them. File timestamps are only
+    read when ``modified_after_ns`` is given.
+
+    Args:
+        library_path: Path to research-library directory.
+        modified_after_ns: If set, only yield files whose mtime or ctime is
+            after this time.
+    """
+    pending = [("", str(library_path))]
+    while pending:
+        prefix, directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((f"{prefix}{entry.name}/", entry.path))
+                    elif entry.name.endswith(".md") and entry.name not in NON_ARTIFACT_FILES and entry.is_file():
+                        if modified_after_ns is not None:
+                            stat = entry.stat()
+                            # Moves and copies that keep the mtime still update ctime
+                            if max(stat.st_mtime_ns, stat.st_ctime_ns) <= modified_after_ns:
+                                continue
+                        yield f"{prefix}{entry.name}"
+        except OSError:
             continue
-        # Get path relative to library_path
-        rel_path = md_file.relative_to(library_path)
-        all_artifacts.add(rel_path)
 
-    # Get all artifacts listed in catalog
-    content = catalog_path.read_text(encoding="utf-8")
 
-    # Parse Quick Reference table to get cataloged paths
-    import re
+def _list_artifacts(library_path: Path) -> list[Path]:
+    """List artifact files relative to the library, skipping hidden directories."""
+    return sorted(Path(rel_path) for rel_path in _walk_artifacts(library_path))
+
+
+def _load_orphans_state(state_path: Path) -> dict[str, Any]:
+    """Load the previous orphan check state, or an empty one."""
+    try:
+        data = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != ORPHANS_STATE_VERSION:
+        return {}
+    return data
+
+
+def _save_orphans_state(state_path: Path, state: dict[str, Any]) -> None:
+    """Persist the orphan check state atomically."""
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(state_path, json.dumps({"version": ORPHANS_STATE_VERSION, **state}))
 
-    # Pattern: | [id](path) | ...
-    pattern = r"\|\s*\[[^\]]+\]\(([^\)]+)\)\s*\|"
-    cataloged_paths: set[Path] = set()
 
-    for match in re.finditer(pattern, content):
-        path_str = match.group(1).strip()
-        cataloged_paths.add(Path(path_str))
+def _parse_artifact_file(artifact_path: str, rel_path: str, known_sha256: str | None) -> dict[str, Any]:
+    """Hash, parse and validate one artifact (runs in a worker process).
+
+    Returns a JSON-serializable manifest record. If the content hash equals
+    ``known_sha256`` the file is not parsed and ``unchanged`` is set. A file
+    that can't be read (deleted since the scan, unreadable) gets an error
+    record with no stat, so the next run reads it again.
+    """
+    path = Path(artifact_path)
+    try:
+        stat = path.stat()
+        raw = path.read_bytes()
+    except OSError as e:
+        return {
+            "mtime_ns": None,
+            "size": None,
+            "sha256": None,
+            "summary": None,
+            "errors": [{"field": "file", "message": f"Cannot read artifact: {e.strerror or e}"}],
+        }
+    sha256 = hashlib.sha256(raw).hexdigest()
+    record: dict[str, Any] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256}
+    # Not part of the manifest; collected into the summary cache
+    record["summary"] = extract_summary(raw.decode("utf-8", errors="replace"))
+    if sha256 == known_sha256:
+        record["unchanged"] = True
+        return record
+
+    result = validate_metadata(path)
+    if result.success and result.entry is not None:
+        entry = asdict(result.entry)
+        entry["path"] = rel_path
+        record["entry"] = entry
+    else:
+        record["errors"] = [{"field": e.field, "message": e.message} for e in result.errors]
+    return record
+
+
+def _load_manifest(manifest_path: Path) -> dict[str, dict[str, Any]]:
+    """Load the reindex manifest, or an empty one if missing or outdated."""
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != REINDEX_MANIFEST_VERSION:
+        return {}
+    files = data.get("files", {})
+    return files if isinstance(files, dict) else {}
 
-    # Find orphans: artifacts not in catalog
-    orphans = all_artifacts - cataloged_paths
 
-    return sorted(orphans)
+def _save_manifest(manifest_path: Path, files: dict[str, dict[str, Any]]) -> None:
+    """Persist the reindex manifest atomically."""
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": REINDEX_MANIFEST_VERSION, "files": dict(sorted(files.items()))}
+    atomic_write_text(manifest_path, json.dumps(data, indent=1))
 
 
-def reindex_library(library_path: Path, catalog_path: Path | None = None) -> bool:
+def _scan_artifacts(
+    library_path: Path,
+    previous: dict[str, dict[str, Any]],
+    max_workers: int | None,
+    summaries: SummaryCache,
+) -> Iterator[tuple[str, dict[str, Any], bool]]:
+    """Bring the manifest up to date, yielding each artifact's record when ready.
+
+    Records whose stat matches the previous manifest are yielded first. The
+    rest are hashed, and parsed only if their content hash changed, in a
+    process pool when worthwhile; they are yielded in path order as the
+    workers finish. Executive Summaries read along the way go into
+    ``summaries``.
+
+    Yields:
+        (library-relative path, manifest record, whether the previous
+        parse result was reused)
+    """
+    to_parse: list[str] = []
+    for rel_path in _list_artifacts(library_path):
+        key = rel_path.as_posix()
+        try:
+            stat = (library_path / rel_path).stat()
+        except OSError:
+            # Gone since the listing; the worker reports it
+            to_parse.append(key)
+            continue
+        record = previous.get(key)
+        if record and (record.get("mtime_ns"), record.get("size")) == (stat.st_mtime_ns, stat.st_size):
+            yield key, record, True
+        else:
+            to_parse.append(key)
+
+    jobs = [
+        (str(library_path / key), key, previous[key].get("sha256") if key in previous else None) for key in to_parse
+    ]
+    if len(jobs) > 1 and max_workers != 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            records: Iterator[dict[str, Any]] = pool.map(_parse_artifact_file, *zip(*jobs))
+            for key, record in zip(to_parse, records):
+                yield _merge_record(key, record, previous, summaries)
+    else:
+        for key, job in zip(to_parse, jobs):
+            yield _merge_record(key, _parse_artifact_file(*job), previous, summaries)
+
+
+def _merge_record(
+    key: str,
+    record: dict[str, Any],
+    previous: dict[str, dict[str, Any]],
+    summaries: SummaryCache,
+) -> tuple[str, dict[str, Any], bool]:
+    """Fold a worker's record into the manifest, reusing an unchanged parse."""
+    summary = record.pop("summary")
+    if summary is not None:
+        summaries.put(key, record["mtime_ns"], record["size"], summary)
+    if record.pop("unchanged", False):
+        return key, {**previous[key], **record}, True
+    return key, record, False
+
+
+def reindex_library(
+    library_path: Path,
+    catalog_path: Path | None = None,
+    max_workers: int | None = None,
+) -> ReindexResult:
     """Rebuild CATALOG.md from all artifacts in the library.
 
     This is a complete rebuild operation. It:
     1. Scans all artifacts in the library
-    2. Validates their metadata
-    3. Rebuilds CATALOG.md from scratch
+    2. Parses and validates their metadata in a process pool
+    3. Rebuilds the catalog store and CATALOG.md from scratch, ordered
+       by date then ID
 
-    Note: This is currently a placeholder. Full implementation would require
-    reading all artifacts and reconstructing the entire CATALOG.md file.
-    For MVP, we rely on incremental updates via catalog_artifact().
+    A content-hash manifest under ``.index/`` records each file's parse
+    result, so later runs only re-parse artifacts whose content changed.
+    CATALOG.md is left untouched if any artifact fails validation.
 
     Args:
         library_path: Path to research-library directory.
         catalog_path: Optional path to CATALOG.md (defaults to library_path/CATALOG.md).
+        max_workers: Worker processes for parsing (defaults to CPU count).
 
     Returns:
-        True if successful, False otherwise.
+        ReindexResult with the rebuilt entries or validation errors.
+    """
+    if catalog_path is None:
+        catalog_path = library_path / "CATALOG.md"
+
+    # The scan and the rebuild run under the catalog lock, so an artifact
+    # cataloged concurrently is either seen by the scan or waits for it.
+    try:
+        with catalog_lock(catalog_path):
+            return _reindex(library_path, catalog_path, max_workers)
+    except CatalogLockTimeout as e:
+        return ReindexResult(success=False, errors=[ValidationError(field="catalog", message=str(e))])
+
+
+def _reindex(library_path: Path, catalog_path: Path, max_workers: int | None) -> ReindexResult:
+    """Scan the library and rebuild the catalog; the caller holds the catalog lock."""
+    manifest_path = get_index_dir(catalog_path) / REINDEX_MANIFEST
+    previous = _load_manifest(manifest_path)
+    summaries = load_summary_cache(library_path)
+    files: dict[str, dict[str, Any]] = {}
+    parsed = 0
+    reused = 0
+
+    for key, record, cached in _scan_artifacts(library_path, previous, max_workers, summaries):
+        files[key] = record
+        if cached:
+            reused += 1
+        else:
+            parsed += 1
+
+    try:
+        _save_manifest(manifest_path, files)
+    except OSError:
+        pass
+    save_summary_cache(summaries, library_path)
+
+    # Collect entries and errors in deterministic order
+    entries: list[CatalogEntry] = []
+    errors: list[ValidationError] = []
+    seen_ids: dict[str, str] = {}
+    for key in sorted(files):
+        record = files[key]
+        for error in record.get("errors", []):
+            errors.append(ValidationError(field=error["field"], message=f"{key}: {error['message']}"))
+        entry_data = record.get("entry")
+        if not entry_data:
+            continue
+        entry = CatalogEntry(**{**entry_data, "path": Path(entry_data["path"])})
+        if entry.id in seen_ids:
+            errors.append(
+                ValidationError(field="id", message=f"{key}: duplicate ID: {entry.id} (also in {seen_ids[entry.id]})")
+            )
+            continue
+        seen_ids[entry.id] = key
+        entries.append(entry)
+
+    entries = sort_entries(entries)
+    if errors:
+        return ReindexResult(success=False, entries=entries, parsed=parsed, reused=reused, errors=errors)
+
+    _keep_topic_headings(entries, catalog_path)
+    _commit_store(CatalogStore(entries), catalog_path)
+    return ReindexResult(success=True, entries=entries, parsed=parsed, reused=reused)
+
+
+def validate_library(
+    library_path: Path,
+    catalog_path: Path | None = None,
+    max_workers: int | None = None,
+) -> Iterator[ArtifactValidation]:
+    """Validate the metadata of every artifact in the library.
+
+    Shares the reindex manifest, so artifacts whose content hash is
+    unchanged since the last validate or reindex are not parsed again.
+    Results are yielded as they become available; the manifest is saved
+    once the iteration completes.
+
+    Args:
+        library_path: Path to research-library directory.
+        catalog_path: Optional path to CATALOG.md (defaults to library_path/CATALOG.md).
+        max_workers: Worker processes for parsing (defaults to CPU count).
+
+    Yields:
+        ArtifactValidation for each artifact, cached results first.
     """
-    # Placeholder for future implementation
-    # Full reindexing would:
-    # 1. Scan all .md files (excluding CATALOG.md, _index.md)
-    # 2. Parse and validate metadata from each
-    # 3. Rebuild CATALOG.md structure from scratch
-    # 4. Ensure deterministic ordering (by date, then by ID)
-
-    # For MVP, return False to indicate not yet implemented
-    return False
+    if catalog_path is None:
+        catalog_path = library_path / "CATALOG.md"
+
+    manifest_path = get_index_dir(catalog_path) / REINDEX_MANIFEST
+    previous = _load_manifest(manifest_path)
+    summaries = load_summary_cache(library_path)
+    files: dict[str, dict[str, Any]] = {}
+
+    for key, record, cached in _scan_artifacts(library_path, previous, max_workers, summaries):
+        files[key] = record
+        entry = record.get("entry")
+        yield ArtifactValidation(
+            path=key,
+            success=entry is not None,
+            artifact_id=entry["id"] if entry else None,
+            cached=cached,
+            errors=[ValidationError(field=e["field"], message=e["message"]) for e in record.get("errors", [])],
+        )
+
+    try:
+        _save_manifest(manifest_path, files)
+    except OSError:
+        pass
+    save_summary_cache(summaries, library_path)
@@ -8,14 +8,25 @@ from praxis.application.opinions_service import resolve_opinions
 from praxis.domain.domains import ARTIFACT_PATHS, Domain
 from praxis.domain.models import ContextBundle
 from praxis.domain.stages import REQUIRES_ARTIFACT, Stage
-from praxis.infrastructure.yaml_loader import load_praxis_config
+from praxis.infrastructure.project_snapshot import (
+    ProjectSnapshot,
+    path_exists,
+    take_project_snapshot,
+)
 
 
-def get_context(project_root: Path) -> ContextBundle:
+def get_context(
+    project_root: Path,
+    snapshot: ProjectSnapshot | None = None,
+    use_cache: bool = False,
+) -> ContextBundle:
     """Generate a deterministic context bundle for a Praxis project.
 
     Args:
         project_root: Path to the project directory
+        snapshot: Snapshot of the project taken by the caller (taken here
+            if not given)
+        use_cache: Use the project's compiled opinions cache
 
     Returns:
         ContextBundle with project metadata, opinions, and artifact excerpt
@@ -23,7 +34,9 @@ def get_context(project_root: Path) -> ContextBundle:
     errors: list[str] = []
 
     # Load praxis.yaml
-    config_result = load_praxis_config(project_root)
+    if snapshot is None:
+        snapshot = take_project_snapshot(project_root)
+    config_result = snapshot.config_result
 
     if not config_result.valid or config_result.config is None:
         # Collect error messages
@@ -47,6 +60,7 @@ def get_context(project_root: Path) -> ContextBundle:
         stage=config.stage.value,
         subtype=config.subtype,
         start_path=project_root,
+        use_cache=use_cache,
     )
 
     # Extract opinion file paths
@@ -54,7 +68,7 @@ def get_context(project_root: Path) -> ContextBundle:
 
     # Get formalize artifact info
     formalize_artifact = _get_formalize_artifact_info(
-        project_root, config.domain, config.stage
+        project_root, config.domain, config.stage, snapshot
     )
 
     return ContextBundle(
@@ -74,6 +88,7 @@ def _get_formalize_artifact_info(
     project_root: Path,
     domain: Domain,
     stage: Stage,
+    snapshot: ProjectSnapshot | None = None,
 ) -> dict[str, str | None]:
     """Get formalize artifact path and excerpt if applicable.
 
@@ -81,6 +96,7 @@ def _get_formalize_artifact_info(
         project_root: Project directory
         domain: Project domain
         stage: Current lifecycle stage
+        snapshot: Optional project snapshot to answer existence from
 
     Returns:
         Dict with 'path' and 'excerpt' keys
@@ -97,7 +113,7 @@ def _get_formalize_artifact_info(
 
     artifact_path = project_root / artifact_rel_path
 
-    if not artifact_path.exists():
+    if not path_exists(project_root, artifact_rel_path, snapshot):
         # Artifact required but not found - include path with null excerpt
         return {"path": str(artifact_rel_path), "excerpt": None}
 
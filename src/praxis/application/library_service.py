@@ -5,17 +5,30 @@ Wraps librarian infrastructure and cataloging_service for CLI usage.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from praxis.application.cataloging_service import find_orphans, reindex_library
+from praxis.application.cataloging_service import (
+    catalog_artifacts,
+    find_orphans,
+    list_batch_artifacts,
+    reindex_library,
+    validate_library,
+)
+from praxis.domain.catalog import ArtifactValidation
+from praxis.infrastructure.catalog_graph import load_catalog_graph
 from praxis.infrastructure.librarian import (
+    find_similar_artifacts,
     get_citations,
     query_library,
     search_library,
+    search_library_fulltext,
+    search_library_fuzzy,
 )
+from praxis.infrastructure.library_index import load_library_index
 
 
 @dataclass
@@ -24,12 +37,17 @@ class LibraryQueryResult:
 
     success: bool
     query: str = ""
+    fuzzy: bool = False
+    exclude_superseded: bool = False
     coverage_level: str = ""
     coverage_reasoning: str = ""
     match_count: int = 0
     summary: str = ""
     sources: list[dict[str, str]] = field(default_factory=list)
     gaps: list[str] = field(default_factory=list)
+    catalog_parses: int = 0
+    file_reads: int = 0
+    cache_hit: bool = False
     errors: list[str] = field(default_factory=list)
 
 
@@ -40,6 +58,8 @@ class LibrarySearchResult:
     success: bool
     keyword: str = ""
     topic: str | None = None
+    fulltext: bool = False
+    fuzzy: bool = False
     matches: list[dict[str, Any]] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
 
@@ -55,6 +75,29 @@ class LibraryCiteResult:
     errors: list[str] = field(default_factory=list)
 
 
+@dataclass
+class LibraryRelatedResult:
+    """Result of looking up related artifacts."""
+
+    success: bool
+    artifact_id: str = ""
+    depth: int = 1
+    superseded_by: str | None = None
+    current_id: str = ""
+    related: list[dict[str, Any]] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class LibrarySimilarResult:
+    """Result of finding artifacts similar to a file."""
+
+    success: bool
+    path: str = ""
+    matches: list[dict[str, Any]] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
 @dataclass
 class LibraryOrphansResult:
     """Result of checking for orphaned artifacts."""
@@ -73,6 +116,9 @@ class LibraryStaleResult:
     stale_artifacts: list[dict[str, str]] = field(default_factory=list)
     count: int = 0
     threshold_days: int = 0
+    before: str | None = None
+    after: str | None = None
+    topic: str | None = None
     errors: list[str] = field(default_factory=list)
 
 
@@ -82,9 +128,35 @@ class LibraryReindexResult:
 
     success: bool
     implemented: bool = False
+    artifact_count: int = 0
+    parsed: int = 0
+    reused: int = 0
     errors: list[str] = field(default_factory=list)
 
 
+@dataclass
+class LibraryValidateResult:
+    """Result of validating every artifact in the library."""
+
+    success: bool
+    total: int = 0
+    valid: int = 0
+    invalid: int = 0
+    cached: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class LibraryCatalogResult:
+    """Result of cataloging artifacts into the library."""
+
+    success: bool
+    cataloged: list[dict[str, Any]] = field(default_factory=list)
+    count: int = 0
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
 def _get_default_library_path() -> Path:
     """Get the default research library path.
 
@@ -114,12 +186,18 @@ def _get_default_library_path() -> Path:
 def query_library_service(
     question: str,
     library_path: Path | None = None,
+    fuzzy: bool = False,
+    exclude_superseded: bool = False,
+    use_cache: bool = True,
 ) -> LibraryQueryResult:
     """Query the research library with a question.
 
     Args:
         question: Natural language question.
         library_path: Path to research library (defaults to auto-detected).
+        fuzzy: Match question terms by trigram similarity (typo-tolerant).
+        exclude_superseded: Leave superseded artifacts out of the answer.
+        use_cache: Serve repeated questions from the query cache.
 
     Returns:
         LibraryQueryResult with coverage assessment and sources.
@@ -143,7 +221,16 @@ def query_library_service(
         )
 
     # Query library
-    response = query_library(question.strip(), library_path)
+    try:
+        response = query_library(
+            question.strip(),
+            library_path,
+            fuzzy=fuzzy,
+            exclude_superseded=exclude_superseded,
+            use_cache=use_cache,
+        )
+    except ValueError as e:
+        return LibraryQueryResult(success=False, query=question.strip(), errors=[str(e)])
 
     # Convert sources to serializable format
     sources = []
@@ -162,12 +249,17 @@ def query_library_service(
     return LibraryQueryResult(
         success=True,
         query=response.query,
+        fuzzy=fuzzy,
+        exclude_superseded=exclude_superseded,
         coverage_level=response.coverage.level,
         coverage_reasoning=response.coverage.reasoning,
         match_count=response.coverage.match_count,
         summary=response.summary,
         sources=sources,
         gaps=response.gaps,
+        catalog_parses=response.stats.catalog_parses,
+        file_reads=response.stats.file_reads,
+        cache_hit=response.stats.cache_hit,
     )
 
 
@@ -175,6 +267,8 @@ def search_library_service(
     keyword: str,
     topic: str | None = None,
     library_path: Path | None = None,
+    fulltext: bool = False,
+    fuzzy: bool = False,
 ) -> LibrarySearchResult:
     """Search the research library by keyword.
 
@@ -182,6 +276,8 @@ def search_library_service(
         keyword: Keyword to search for.
         topic: Optional topic to filter by.
         library_path: Path to research library (defaults to auto-detected).
+        fulltext: Rank artifact bodies with BM25 instead of catalog metadata.
+        fuzzy: Match catalog metadata by trigram similarity (typo-tolerant).
 
     Returns:
         LibrarySearchResult with matching artifacts.
@@ -193,6 +289,12 @@ def search_library_service(
             errors=["--keyword is required"],
         )
 
+    if fulltext and fuzzy:
+        return LibrarySearchResult(
+            success=False,
+            errors=["--fulltext and --fuzzy cannot be combined"],
+        )
+
     # Resolve library path
     if library_path is None:
         library_path = _get_default_library_path()
@@ -205,7 +307,13 @@ def search_library_service(
         )
 
     # Search library
-    matches = search_library(
+    if fulltext:
+        search = search_library_fulltext
+    elif fuzzy:
+        search = search_library_fuzzy
+    else:
+        search = search_library
+    matches = search(
         query=keyword.strip(),
         catalog_path=catalog_path,
         topic_filter=topic.strip() if topic else None,
@@ -230,6 +338,8 @@ def search_library_service(
         success=True,
         keyword=keyword.strip(),
         topic=topic.strip() if topic else None,
+        fulltext=fulltext,
+        fuzzy=fuzzy,
         matches=match_list,
     )
 
@@ -301,13 +411,160 @@ def cite_artifact(
     )
 
 
+def find_related(
+    artifact_id: str,
+    depth: int = 1,
+    library_path: Path | None = None,
+) -> LibraryRelatedResult:
+    """Find artifacts linked to an artifact through catalog metadata.
+
+    Answered from the catalog graph built when the library was last
+    cataloged or reindexed, so no artifact files are opened. A library
+    that has never been cataloged or reindexed gets its graph built once
+    from CATALOG.md and the listed artifacts' metadata.
+
+    Args:
+        artifact_id: Artifact to start from.
+        depth: Maximum number of links to follow (at least 1).
+        library_path: Path to research library (defaults to auto-detected).
+
+    Returns:
+        LibraryRelatedResult with linked artifacts (nearest first) and the
+        artifact that currently supersedes it, if any.
+    """
+    artifact_id = artifact_id.strip() if artifact_id else ""
+    if not artifact_id:
+        return LibraryRelatedResult(success=False, errors=["Artifact ID is required"])
+    if depth < 1:
+        return LibraryRelatedResult(success=False, artifact_id=artifact_id, errors=["Depth must be at least 1"])
+
+    if library_path is None:
+        library_path = _get_default_library_path()
+
+    catalog_path = library_path / "CATALOG.md"
+    if not catalog_path.exists():
+        return LibraryRelatedResult(
+            success=False,
+            artifact_id=artifact_id,
+            errors=[f"CATALOG.md not found at {catalog_path}"],
+        )
+
+    try:
+        graph = load_catalog_graph(catalog_path)
+        index = load_library_index(catalog_path)
+    except ValueError as e:
+        return LibraryRelatedResult(success=False, artifact_id=artifact_id, errors=[str(e)])
+    if graph is None:
+        return LibraryRelatedResult(
+            success=False,
+            artifact_id=artifact_id,
+            errors=[f"CATALOG.md not found at {catalog_path}"],
+        )
+    if index is None or index.get(artifact_id) is None:
+        return LibraryRelatedResult(
+            success=False,
+            artifact_id=artifact_id,
+            errors=[f"Artifact not found: {artifact_id}"],
+        )
+
+    related = []
+    for other_id, distance, relation in graph.neighbors(artifact_id, depth):
+        artifact = index.get(other_id)
+        related.append(
+            {
+                "id": other_id,
+                "title": artifact["title"] if artifact else "",
+                "topic": artifact["topic"] if artifact else "",
+                "distance": distance,
+                "relation": relation,
+                "superseded": graph.is_superseded(other_id),
+            }
+        )
+
+    return LibraryRelatedResult(
+        success=True,
+        artifact_id=artifact_id,
+        depth=depth,
+        superseded_by=graph.superseded_by.get(artifact_id),
+        current_id=graph.resolve(artifact_id),
+        related=related,
+    )
+
+
+def find_similar(
+    artifact_path: Path,
+    top_k: int = 5,
+    library_path: Path | None = None,
+) -> LibrarySimilarResult:
+    """Find cataloged artifacts whose content is similar to a file.
+
+    Args:
+        artifact_path: Markdown file to compare, inside or outside the library.
+        top_k: Maximum number of matches.
+        library_path: Path to research library (defaults to auto-detected).
+
+    Returns:
+        LibrarySimilarResult with matches, most similar first. A file that
+        is itself in the library is not reported as similar to itself.
+    """
+    if top_k < 1:
+        return LibrarySimilarResult(success=False, path=str(artifact_path), errors=["--top must be at least 1"])
+
+    try:
+        text = artifact_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        return LibrarySimilarResult(
+            success=False,
+            path=str(artifact_path),
+            errors=[f"Cannot read {artifact_path}: {e}"],
+        )
+
+    if library_path is None:
+        library_path = _get_default_library_path()
+
+    catalog_path = library_path / "CATALOG.md"
+    if not catalog_path.exists():
+        return LibrarySimilarResult(
+            success=False,
+            path=str(artifact_path),
+            errors=[f"CATALOG.md not found at {catalog_path}"],
+        )
+
+    try:
+        own_path: Path | None = artifact_path.resolve().relative_to(library_path.resolve())
+    except ValueError:
+        own_path = None
+
+    try:
+        matches = find_similar_artifacts(text, catalog_path, top_k, exclude_path=own_path)
+    except ValueError as e:
+        return LibrarySimilarResult(success=False, path=str(artifact_path), errors=[str(e)])
+
+    return LibrarySimilarResult(
+        success=True,
+        path=str(artifact_path),
+        matches=[
+            {
+                "id": match.id,
+                "title": match.title,
+                "path": str(match.path),
+                "topic": match.topic,
+                "score": round(match.relevance_score, 4),
+            }
+            for match in matches
+        ],
+    )
+
+
 def check_orphans(
     library_path: Path | None = None,
+    since_last_run: bool = False,
 ) -> LibraryOrphansResult:
     """Check for orphaned artifacts not in CATALOG.md.
 
     Args:
         library_path: Path to research library (defaults to auto-detected).
+        since_last_run: Only check files modified since the previous check.
 
     Returns:
         LibraryOrphansResult with list of orphaned artifacts.
@@ -323,7 +580,10 @@ def check_orphans(
         )
 
     # Find orphans
-    orphans = find_orphans(library_path)
+    try:
+        orphans = find_orphans(library_path, since_last_run=since_last_run)
+    except ValueError as e:
+        return LibraryOrphansResult(success=False, errors=[str(e)])
 
     return LibraryOrphansResult(
         success=True,
@@ -332,19 +592,45 @@ def check_orphans(
     )
 
 
+def _valid_date(value: str) -> bool:
+    """Check that a string is a YYYY-MM-DD date."""
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+
 def check_stale(
     days: int = 180,
     library_path: Path | None = None,
+    before: str | None = None,
+    after: str | None = None,
+    topic: str | None = None,
 ) -> LibraryStaleResult:
     """Check for stale artifacts older than threshold.
 
+    Artifacts are looked up in the index's date-ordered list, so the
+    query is a bisect plus a slice rather than a scan of the catalog.
+
     Args:
         days: Number of days before an artifact is considered stale.
         library_path: Path to research library (defaults to auto-detected).
+        before: Report artifacts dated before this YYYY-MM-DD date instead
+            of using ``days``.
+        after: Only report artifacts dated on or after this YYYY-MM-DD date.
+        topic: Only report artifacts in this topic.
 
     Returns:
-        LibraryStaleResult with list of stale artifacts.
+        LibraryStaleResult with list of stale artifacts, newest first.
     """
+    for option, value in (("--before", before), ("--after", after)):
+        if value is not None and not _valid_date(value):
+            return LibraryStaleResult(
+                success=False,
+                errors=[f"Invalid {option} date: {value} (expected YYYY-MM-DD)"],
+            )
+
     # Resolve library path
     if library_path is None:
         library_path = _get_default_library_path()
@@ -356,49 +642,54 @@ def check_stale(
             errors=[f"CATALOG.md not found at {catalog_path}"],
         )
 
-    # Parse catalog and check dates
-    from praxis.infrastructure.librarian import parse_catalog
-
-    artifacts = parse_catalog(catalog_path)
+    index = load_library_index(catalog_path)
+    if index is None:
+        return LibraryStaleResult(
+            success=False,
+            errors=[f"Could not read catalog at {catalog_path}"],
+        )
 
     # Calculate threshold date
-    from datetime import timedelta
-
-    threshold_date = datetime.now() - timedelta(days=days)
-    threshold_str = threshold_date.strftime("%Y-%m-%d")
-
-    stale_artifacts = []
-    for artifact in artifacts:
-        artifact_date = artifact.get("date", "")
-        # Simple string comparison works for YYYY-MM-DD format
-        if artifact_date and artifact_date < threshold_str:
-            stale_artifacts.append(
-                {
-                    "id": artifact["id"],
-                    "title": artifact["title"],
-                    "date": artifact_date,
-                    "path": artifact["path"],
-                }
-            )
+    if before is None:
+        from datetime import timedelta
+
+        threshold_date = datetime.now() - timedelta(days=days)
+        before = threshold_date.strftime("%Y-%m-%d")
+
+    topic = topic.strip() if topic else None
+    stale_artifacts = [
+        {
+            "id": artifact["id"],
+            "title": artifact["title"],
+            "date": artifact["date"],
+            "path": artifact["path"],
+        }
+        for artifact in reversed(index.dated(after=after, before=before, topic=topic))
+    ]
 
     return LibraryStaleResult(
         success=True,
         stale_artifacts=stale_artifacts,
         count=len(stale_artifacts),
         threshold_days=days,
+        before=before,
+        after=after,
+        topic=topic,
     )
 
 
 def reindex_library_service(
     library_path: Path | None = None,
+    max_workers: int | None = None,
 ) -> LibraryReindexResult:
     """Reindex the research library.
 
-    Note: This is currently a placeholder. Full reindexing requires
-    scanning all artifacts and rebuilding CATALOG.md.
+    Rebuilds CATALOG.md from artifact metadata. Unchanged artifacts are
+    served from the reindex manifest rather than re-parsed.
 
     Args:
         library_path: Path to research library (defaults to auto-detected).
+        max_workers: Worker processes for parsing (defaults to CPU count).
 
     Returns:
         LibraryReindexResult indicating status.
@@ -413,17 +704,137 @@ def reindex_library_service(
             errors=[f"Library path does not exist: {library_path}"],
         )
 
-    # Call the reindex function (currently returns False as not implemented)
-    success = reindex_library(library_path)
+    result = reindex_library(library_path, max_workers=max_workers)
 
-    if success:
-        return LibraryReindexResult(
-            success=True,
-            implemented=True,
+    return LibraryReindexResult(
+        success=result.success,
+        implemented=True,
+        artifact_count=len(result.entries),
+        parsed=result.parsed,
+        reused=result.reused,
+        errors=[error.message for error in result.errors],
+    )
+
+
+def validate_library_service(
+    library_path: Path | None = None,
+    max_workers: int | None = None,
+    on_artifact: Callable[[ArtifactValidation], None] | None = None,
+) -> LibraryValidateResult:
+    """Validate the metadata of every artifact in the library.
+
+    Artifacts whose content is unchanged since the last validate or
+    reindex reuse their earlier result.
+
+    Args:
+        library_path: Path to research library (defaults to auto-detected).
+        max_workers: Worker processes for parsing (defaults to CPU count).
+        on_artifact: Called with each artifact's result as soon as it is known.
+
+    Returns:
+        LibraryValidateResult with aggregate counts; successful only if every
+        artifact is valid.
+    """
+    if library_path is None:
+        library_path = _get_default_library_path()
+
+    if not library_path.exists():
+        return LibraryValidateResult(
+            success=False,
+            errors=[f"Library path does not exist: {library_path}"],
         )
-    else:
-        return LibraryReindexResult(
-            success=True,  # Not an error, just not implemented
-            implemented=False,
-            errors=["Reindex is not yet implemented. Use incremental cataloging."],
+
+    result = LibraryValidateResult(success=True)
+    for artifact in validate_library(library_path, max_workers=max_workers):
+        result.total += 1
+        result.cached += artifact.cached
+        if artifact.success:
+            result.valid += 1
+        else:
+            result.invalid += 1
+            result.errors.extend(f"{artifact.path}: {error.message}" for error in artifact.errors)
+        if on_artifact is not None:
+            on_artifact(artifact)
+
+    result.success = result.invalid == 0
+    return result
+
+
+def catalog_library_service(
+    artifacts: list[Path] | None = None,
+    batch_dir: Path | None = None,
+    library_path: Path | None = None,
+    import_existing: bool = False,
+) -> LibraryCatalogResult:
+    """Catalog artifacts into the research library as one batch.
+
+    Args:
+        artifacts: Artifact files to catalog.
+        batch_dir: Directory whose top-level markdown files are cataloged.
+        library_path: Path to research library (defaults to auto-detected).
+        import_existing: Convert a hand-curated CATALOG.md to the catalog
+            store even if regenerating it would drop content.
+
+    Returns:
+        LibraryCatalogResult with the cataloged artifacts.
+    """
+    paths = list(artifacts or [])
+    if batch_dir is not None:
+        if not batch_dir.is_dir():
+            return LibraryCatalogResult(
+                success=False,
+                errors=[f"Batch directory does not exist: {batch_dir}"],
+            )
+        paths.extend(list_batch_artifacts(batch_dir))
+
+    if not paths:
+        return LibraryCatalogResult(
+            success=False,
+            errors=["No artifacts to catalog (pass artifact paths or --batch)"],
+        )
+
+    missing = [str(path) for path in paths if not path.is_file()]
+    if missing:
+        return LibraryCatalogResult(
+            success=False,
+            errors=[f"Artifact not found: {path}" for path in missing],
+        )
+
+    # Resolve library path
+    if library_path is None:
+        library_path = _get_default_library_path()
+
+    catalog_path = library_path / "CATALOG.md"
+    if not catalog_path.exists():
+        return LibraryCatalogResult(
+            success=False,
+            errors=[f"CATALOG.md not found at {catalog_path}"],
+        )
+
+    result = catalog_artifacts(paths, library_path, catalog_path, import_existing=import_existing)
+    if not result.success:
+        return LibraryCatalogResult(
+            success=False,
+            errors=[error.message for error in result.errors],
         )
+
+    cataloged = [
+        {
+            "id": entry.id,
+            "title": entry.title,
+            "path": str(entry.path),
+            "topic": entry.topic,
+            "similar": [
+                {"id": match.id, "path": str(match.path), "score": round(match.score, 4)}
+                for match in result.similar.get(entry.id, [])
+            ],
+        }
+        for entry in result.entries
+    ]
+
+    return LibraryCatalogResult(
+        success=True,
+        cataloged=cataloged,
+        count=len(cataloged),
+        warnings=result.warnings,
+    )
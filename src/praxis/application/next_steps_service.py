@@ -13,6 +13,7 @@ from praxis.domain.next_steps import (
     NextStep,
 )
 from praxis.domain.stages import Stage
+from praxis.infrastructure.project_snapshot import ProjectSnapshot, path_exists
 
 # Maximum number of next steps to show
 MAX_NEXT_STEPS = 3
@@ -29,12 +30,12 @@ class StepGuidance(TypedDict, total=False):
     artifact: bool  # Mark as domain artifact
 
 
-def _artifact_exists(project_root: Path, domain: Domain) -> bool:
+def _artifact_exists(project_root: Path, domain: Domain, snapshot: ProjectSnapshot | None = None) -> bool:
     """Check if the domain artifact exists."""
     artifact_path = ARTIFACT_PATHS.get(domain)
     if artifact_path is None:
         return True  # Observe domain has no required artifact
-    return (project_root / artifact_path).exists()
+    return path_exists(project_root, artifact_path, snapshot)
 
 
 def _get_artifact_path(domain: Domain) -> str | None:
@@ -245,6 +246,7 @@ def get_next_steps(
     config: PraxisConfig | None,
     validation: ValidationResult,
     project_root: Path,
+    snapshot: ProjectSnapshot | None = None,
 ) -> list[NextStep]:
     """Generate next step recommendations based on project state.
 
@@ -252,6 +254,7 @@ def get_next_steps(
         config: The parsed praxis.yaml configuration (None if invalid).
         validation: Validation result for the project.
         project_root: Path to the project root directory.
+        snapshot: Optional project snapshot to answer file existence from.
 
     Returns:
         List of 1-3 NextStep recommendations, sorted by priority.
@@ -293,7 +296,7 @@ def get_next_steps(
 
         # For artifact steps, check if it already exists
         if is_artifact:
-            if _artifact_exists(project_root, domain):
+            if _artifact_exists(project_root, domain, snapshot):
                 # Artifact exists - suggest edit instead of create
                 steps.append(
                     NextStep(
@@ -317,7 +320,7 @@ def get_next_steps(
                 )
         elif guidance["action"] == ActionType.CREATE:
             # For non-artifact create steps, check if file exists
-            if target and (project_root / target).exists():
+            if target and path_exists(project_root, target, snapshot):
                 # File exists - suggest edit instead
                 steps.append(
                     NextStep(
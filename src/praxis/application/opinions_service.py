@@ -2,23 +2,47 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 from pathlib import Path
 from typing import Any
 
+from praxis.domain.domains import Domain
 from praxis.domain.opinions import (
+    OpinionChange,
+    OpinionChangeKind,
     OpinionFile,
+    OpinionsDelta,
+    OpinionSearchHit,
     OpinionsTree,
     ResolvedOpinions,
 )
+from praxis.domain.stages import Stage
+from praxis.domain.subtypes import VALID_SUBTYPES
 from praxis.infrastructure.manifest_loader import discover_extension_manifests
+from praxis.infrastructure.opinions_cache import (
+    bundle_cache_key,
+    fingerprint_sources,
+    get_opinions_cache_dir,
+    load_cached_bundle,
+    save_cached_bundle,
+)
+from praxis.infrastructure.opinions_index import (
+    get_opinions_index_path,
+    load_opinions_index,
+)
 from praxis.infrastructure.opinions_loader import (
+    OpinionReads,
     build_opinions_tree,
     build_opinions_tree_with_extensions,
+    discover_opinions,
     find_opinions_root,
-    load_opinion_file,
     merge_opinions_with_extensions,
+    opinion_source_paths,
+    opinion_sources,
+    read_opinion,
 )
+from praxis.infrastructure.text_index import extract_keywords
 from praxis.infrastructure.workspace_config_repo import load_workspace_config
 
 
@@ -125,16 +149,95 @@ def compute_resolution_chain(
     return paths
 
 
+def _resolve_chain(
+    domain: str,
+    stage: str | None,
+    subtype: str | None,
+    opinions_root: Path,
+    extension_manifests: list[tuple[Path, Any]],
+    reads: OpinionReads | None = None,
+) -> ResolvedOpinions:
+    """Resolve opinions from disk, loading only the files on the chain."""
+    warnings: list[str] = []
+
+    # Compute resolution chain first, then load only the files on it
+    chain = compute_resolution_chain(domain, stage, subtype)
+
+    # Merge core opinions and extension contributions for the chain
+    merged, merge_warnings = merge_opinions_with_extensions(
+        opinions_root, extension_manifests, paths=frozenset(chain), reads=reads
+    )
+    warnings.extend(merge_warnings)
+
+    # Load files in resolution order
+    files: list[OpinionFile] = []
+    for file_path in chain:
+        if file_path in merged:
+            opinion_file = merged[file_path]
+            if opinion_file.exists:
+                files.append(opinion_file)
+                # Check for parse errors
+                if opinion_file.parse_error:
+                    warnings.append(
+                        f"Parse error in {file_path}: {opinion_file.parse_error}"
+                    )
+                # Check for deprecated status
+                if (
+                    opinion_file.frontmatter
+                    and opinion_file.frontmatter.status.value == "deprecated"
+                ):
+                    warnings.append(f"Deprecated opinion file: {file_path}")
+
+    return ResolvedOpinions(
+        domain=domain,
+        stage=stage,
+        subtype=subtype,
+        files=files,
+        warnings=warnings,
+    )
+
+
+def _resolve_cached(
+    domain: str,
+    stage: str | None,
+    subtype: str | None,
+    opinions_root: Path,
+    extension_manifests: list[tuple[Path, Any]],
+    cache_dir: Path | None,
+) -> ResolvedOpinions:
+    """Resolve opinions through the compiled bundle cache (if cache_dir)."""
+    if cache_dir is None:
+        return _resolve_chain(domain, stage, subtype, opinions_root, extension_manifests)
+
+    key = bundle_cache_key(domain, stage, subtype, opinions_root, extension_manifests)
+    cached = load_cached_bundle(cache_dir, key)
+    if cached is not None:
+        return cached
+
+    chain = compute_resolution_chain(domain, stage, subtype)
+    sources = fingerprint_sources(
+        opinion_source_paths(opinions_root, extension_manifests, frozenset(chain))
+    )
+    resolved = _resolve_chain(domain, stage, subtype, opinions_root, extension_manifests)
+    save_cached_bundle(cache_dir, key, resolved, sources)
+    return resolved
+
+
 def resolve_opinions(
     domain: str,
     stage: str | None = None,
     subtype: str | None = None,
     opinions_root: Path | None = None,
     start_path: Path | None = None,
+    use_cache: bool = False,
 ) -> ResolvedOpinions:
     """Resolve applicable opinions for a project context.
 
-    Includes extension contributions if workspace is available.
+    Includes extension contributions if workspace is available. With
+    ``use_cache``, resolved bundles are cached under the project's
+    ``.praxis/cache/opinions/`` and reused while their source files are
+    unchanged; only the CLI turns this on, so library callers never write
+    into the project they resolve for.
 
     Args:
         domain: The domain (code, create, write, learn, observe)
@@ -142,12 +245,13 @@ def resolve_opinions(
         subtype: Optional subtype
         opinions_root: Explicit path to opinions/ directory
         start_path: Directory to search from (if opinions_root not provided)
+        use_cache: Use the compiled bundle cache of the project at
+            start_path (or the current directory if neither opinions_root
+            nor start_path is given)
 
     Returns:
         ResolvedOpinions with files in resolution order
     """
-    warnings: list[str] = []
-
     # Find opinions root
     if opinions_root is None:
         if start_path is None:
@@ -155,68 +259,155 @@ def resolve_opinions(
         opinions_root = find_opinions_root(start_path)
 
     if opinions_root is None or not opinions_root.exists():
-        warnings.append("No opinions directory found")
         return ResolvedOpinions(
             domain=domain,
             stage=stage,
             subtype=subtype,
             files=[],
-            warnings=warnings,
+            warnings=["No opinions directory found"],
         )
 
     # Get extension manifests (if workspace available)
-    extension_manifests = _get_extension_manifests(start_path or Path.cwd())
+    extension_manifests = _get_extension_manifests(start_path or Path.cwd()) or []
 
-    # Merge opinions from core and extensions
-    if extension_manifests:
-        merged, merge_warnings = merge_opinions_with_extensions(
-            opinions_root, extension_manifests
-        )
-        warnings.extend(merge_warnings)
-    else:
-        # No extensions - just load core opinions
-        merged = {}
-        for path in opinions_root.rglob("*.md"):
-            relative = path.relative_to(opinions_root)
-            parts = relative.parts
-            if "_templates" in parts:
-                continue
-            if parts[0].startswith("_") and parts[0] != "_shared":
-                continue
-            relative_str = relative.as_posix()
-            merged[relative_str] = load_opinion_file(
-                opinions_root, relative_str, source="core"
+    cache_dir = get_opinions_cache_dir(start_path) if use_cache and start_path else None
+    return _resolve_cached(
+        domain, stage, subtype, opinions_root, extension_manifests, cache_dir
+    )
+
+
+def resolve_opinions_many(
+    combinations: list[tuple[str, str | None, str | None]],
+    opinions_root: Path | None = None,
+    start_path: Path | None = None,
+) -> list[ResolvedOpinions]:
+    """Resolve opinions for many (domain, stage, subtype) combinations.
+
+    The opinions root and extension manifests are found once, and file
+    reads are shared across combinations, so each opinion file is read at
+    most once however many chains include it. Each result is identical to
+    what :func:`resolve_opinions` returns for that combination.
+
+    Args:
+        combinations: (domain, stage, subtype) tuples to resolve
+        opinions_root: Explicit path to opinions/ directory
+        start_path: Directory to search from (if opinions_root not provided)
+
+    Returns:
+        ResolvedOpinions for each combination, in the same order
+    """
+    if opinions_root is None:
+        if start_path is None:
+            start_path = Path.cwd()
+        opinions_root = find_opinions_root(start_path)
+
+    if opinions_root is None or not opinions_root.exists():
+        return [
+            ResolvedOpinions(
+                domain=domain,
+                stage=stage,
+                subtype=subtype,
+                files=[],
+                warnings=["No opinions directory found"],
             )
+            for domain, stage, subtype in combinations
+        ]
+
+    extension_manifests = _get_extension_manifests(start_path or Path.cwd()) or []
+    return _resolve_many(combinations, opinions_root, extension_manifests)
+
+
+def _resolve_many(
+    combinations: list[tuple[str, str | None, str | None]],
+    opinions_root: Path,
+    extension_manifests: list[tuple[Path, Any]],
+) -> list[ResolvedOpinions]:
+    """Resolve each combination, sharing file reads across all of them."""
+    reads: OpinionReads = {}
+    return [
+        _resolve_chain(
+            domain, stage, subtype, opinions_root, extension_manifests, reads
+        )
+        for domain, stage, subtype in combinations
+    ]
 
-    # Compute resolution chain
-    chain = compute_resolution_chain(domain, stage, subtype)
 
-    # Load files in resolution order
-    files: list[OpinionFile] = []
-    for file_path in chain:
-        if file_path in merged:
-            opinion_file = merged[file_path]
-            if opinion_file.exists:
-                files.append(opinion_file)
-                # Check for parse errors
-                if opinion_file.parse_error:
-                    warnings.append(
-                        f"Parse error in {file_path}: {opinion_file.parse_error}"
-                    )
-                # Check for deprecated status
-                if (
-                    opinion_file.frontmatter
-                    and opinion_file.frontmatter.status.value == "deprecated"
-                ):
-                    warnings.append(f"Deprecated opinion file: {file_path}")
+def matrix_bundle_name(domain: str, stage: str | None, subtype: str | None) -> str:
+    """Return the file stem for a combination's bundle in a matrix export.
 
-    return ResolvedOpinions(
-        domain=domain,
-        stage=stage,
-        subtype=subtype,
-        files=files,
-        warnings=warnings,
-    )
+    Missing stage or subtype is written as ``_`` (e.g. ``code-_-cli``).
+    """
+    return "-".join(part or "_" for part in (domain, stage, subtype))
+
+
+def opinion_combinations(
+    opinions_root: Path,
+    extension_manifests: list[tuple[Path, Any]],
+) -> list[tuple[str, str | None, str | None]]:
+    """List every (domain, stage, subtype) a project could resolve.
+
+    Subtypes are the valid subtypes of each domain plus any nested subtype
+    that has opinion files under ``{domain}/subtypes/`` in the core tree or
+    in extension contribution targets. Stage and subtype may each be None.
+
+    Args:
+        opinions_root: Path to core opinions/ directory
+        extension_manifests: List of (extension_path, manifest) tuples
+
+    Returns:
+        Sorted (domain, stage, subtype) combinations
+    """
+    targets = [
+        *discover_opinions(opinions_root).paths,
+        *(
+            contrib.target
+            for _, manifest in extension_manifests
+            for contrib in manifest.contributions.opinions
+        ),
+    ]
+    stages: list[str | None] = [None, *(s.value for s in Stage)]
+    combinations: list[tuple[str, str | None, str | None]] = []
+
+    for domain in Domain:
+        subtypes = set(VALID_SUBTYPES.get(domain, []))
+        prefix = f"{domain.value}/subtypes/"
+        for target in targets:
+            if target.startswith(prefix):
+                segments = target[len(prefix) :].split("/")[:-1]
+                # Every level of a nested subtype is a subtype of its own
+                for depth in range(1, len(segments) + 1):
+                    subtypes.add("-".join(segments[:depth]))
+
+        for stage in stages:
+            combinations.append((domain.value, stage, None))
+            for subtype in sorted(subtypes):
+                combinations.append((domain.value, stage, subtype))
+
+    return combinations
+
+
+def warm_opinions_cache(project_root: Path) -> tuple[int, Path | None]:
+    """Precompute the bundle cache for every opinion combination.
+
+    Args:
+        project_root: Project directory whose cache is warmed
+
+    Returns:
+        Tuple of (bundle count, cache directory). The count is 0 and the
+        directory None if no opinions directory was found.
+    """
+    opinions_root = find_opinions_root(project_root)
+    if opinions_root is None:
+        return 0, None
+
+    extension_manifests = _get_extension_manifests(project_root) or []
+    cache_dir = get_opinions_cache_dir(project_root)
+    combinations = opinion_combinations(opinions_root, extension_manifests)
+    for domain, stage, subtype in combinations:
+        _resolve_cached(
+            domain, stage, subtype, opinions_root, extension_manifests, cache_dir
+        )
+    return len(combinations), cache_dir
 
 
 def format_prompt_output(
@@ -332,6 +523,244 @@ def format_json_output(resolved: ResolvedOpinions) -> dict[str, Any]:
     }
 
 
+def opinion_content_hash(opinion: OpinionFile) -> str:
+    """Return the SHA-256 of an opinion's content as it appears in prompts."""
+    return hashlib.sha256((opinion.content or "").encode("utf-8")).hexdigest()
+
+
+def compute_opinions_delta(
+    previous: ResolvedOpinions, current: ResolvedOpinions
+) -> OpinionsDelta:
+    """Compare two resolved chains file by file.
+
+    Files are matched by path and compared by content hash. Only added and
+    changed files carry content; unchanged files carry just their hash, so
+    consumers can keep what they already have.
+
+    Args:
+        previous: Opinions resolved for the earlier stage
+        current: Opinions resolved for the current stage
+
+    Returns:
+        OpinionsDelta listing every file of either chain
+    """
+    before = {f.path: f for f in previous.existing_files}
+    after = {f.path for f in current.existing_files}
+    files: list[OpinionChange] = []
+
+    for opinion in current.existing_files:
+        sha256 = opinion_content_hash(opinion)
+        old = before.get(opinion.path)
+        change: OpinionChangeKind
+        if old is None:
+            change = "added"
+            previous_sha256 = None
+        else:
+            previous_sha256 = opinion_content_hash(old)
+            change = "unchanged" if previous_sha256 == sha256 else "changed"
+        files.append(
+            OpinionChange(
+                path=opinion.path,
+                change=change,
+                sha256=sha256,
+                previous_sha256=previous_sha256 if change == "changed" else None,
+                source=opinion.source,
+                content=opinion.content if change != "unchanged" else None,
+            )
+        )
+
+    for opinion in previous.existing_files:
+        if opinion.path not in after:
+            files.append(
+                OpinionChange(
+                    path=opinion.path,
+                    change="removed",
+                    sha256=opinion_content_hash(opinion),
+                    source=opinion.source,
+                )
+            )
+
+    return OpinionsDelta(
+        domain=current.domain,
+        subtype=current.subtype,
+        from_stage=previous.stage,
+        to_stage=current.stage,
+        files=files,
+        warnings=[*previous.warnings, *current.warnings],
+    )
+
+
+def format_delta_json(delta: OpinionsDelta) -> dict[str, Any]:
+    """Format an opinions delta as a JSON-serializable dict."""
+    return delta.model_dump(mode="json")
+
+
+def format_delta_prompt(
+    delta: OpinionsDelta, redact: bool = False
+) -> tuple[str, list[str]]:
+    """Format an opinions delta as an AI context update.
+
+    Only added and changed files are included in full; removed files are
+    listed so they can be dropped, and unchanged files are listed with
+    their hashes so cached copies can be kept.
+
+    Args:
+        delta: The opinions delta
+        redact: Whether to apply redaction to content
+
+    Returns:
+        Tuple of (markdown context update, list of redaction warnings)
+    """
+    from praxis.domain.privacy_guard import PrivacyGuard
+
+    lines: list[str] = []
+    redaction_warnings: list[str] = []
+
+    lines.append("# Praxis Opinions Context Update")
+    lines.append("")
+    lines.append(f"**Domain:** {delta.domain}")
+    lines.append(f"**Stage:** {delta.from_stage} → {delta.to_stage}")
+    if delta.subtype:
+        lines.append(f"**Subtype:** {delta.subtype}")
+    lines.append("")
+
+    removed = delta.with_change("removed")
+    if removed:
+        lines.append("## No Longer Applies")
+        lines.append("")
+        for f in removed:
+            lines.append(f"- `{f.path}`")
+        lines.append("")
+
+    unchanged = delta.with_change("unchanged")
+    if unchanged:
+        lines.append("## Unchanged (still applies)")
+        lines.append("")
+        for f in unchanged:
+            lines.append(f"- `{f.path}` (sha256 {f.sha256[:12]})")
+        lines.append("")
+
+    lines.append("---")
+    lines.append("")
+
+    for f in delta.files:
+        if f.change not in ("added", "changed"):
+            continue
+        lines.append(f"## {f.path} ({f.change})")
+        lines.append("")
+        if f.content:
+            content = f.content
+            if redact:
+                content, patterns_found = PrivacyGuard.redact_content(content)
+                redaction_warnings.extend(patterns_found)
+            lines.append(content)
+        else:
+            lines.append("*(No content)*")
+        lines.append("")
+        lines.append("---")
+        lines.append("")
+
+    return "\n".join(lines), redaction_warnings
+
+
+def format_delta_output(delta: OpinionsDelta) -> str:
+    """Format an opinions delta as a human-readable change list."""
+    symbols = {"added": "+", "removed": "-", "changed": "~"}
+    lines = [f"Opinion changes for {delta.domain}: {delta.from_stage} → {delta.to_stage}"]
+    if delta.subtype:
+        lines[0] += f" ({delta.subtype})"
+    lines[0] += ":"
+    lines.append("")
+
+    changes = [f for f in delta.files if f.change != "unchanged"]
+    if not changes:
+        lines.append("  (no changes)")
+    for f in changes:
+        lines.append(f"  {symbols[f.change]} {f.path}  {f.sha256[:12]}")
+
+    lines.append("")
+    lines.append(
+        f"Added: {len(delta.with_change('added'))}, "
+        f"changed: {len(delta.with_change('changed'))}, "
+        f"removed: {len(delta.with_change('removed'))}, "
+        f"unchanged: {len(delta.with_change('unchanged'))}"
+    )
+    return "\n".join(lines)
+
+
+def _matching_lines(path: Path, terms: list[str], limit: int = 3) -> list[str]:
+    """Return the first body lines of a file that mention any term."""
+    try:
+        _, content, _ = read_opinion(path)
+    except (OSError, UnicodeDecodeError):
+        return []
+    wanted = set(terms)
+    lines: list[str] = []
+    for line in (content or "").splitlines():
+        if wanted & set(extract_keywords(line)):
+            lines.append(line.strip())
+            if len(lines) == limit:
+                break
+    return lines
+
+
+def search_opinions(
+    query: str,
+    start_path: Path | None = None,
+) -> tuple[list[OpinionSearchHit], str | None]:
+    """Find the opinion files whose body mentions every query term.
+
+    Searches the files resolution would use (core, then extension
+    precedence) through the project's persistent opinions index, which is
+    updated first for any file added, removed or edited since it was built.
+
+    Args:
+        query: Search terms (stop words and words under 3 characters are
+            ignored)
+        start_path: Project directory to search from
+
+    Returns:
+        Tuple of (hits ranked by BM25, warning). The warning is set if no
+        opinions directory was found.
+    """
+    if start_path is None:
+        start_path = Path.cwd()
+    opinions_root = find_opinions_root(start_path)
+    if opinions_root is None:
+        return [], "No opinions directory found"
+
+    extension_manifests = _get_extension_manifests(start_path) or []
+    sources = opinion_sources(opinions_root, extension_manifests)
+    index = load_opinions_index(get_opinions_index_path(start_path), sources)
+
+    terms = extract_keywords(query)
+    return [
+        OpinionSearchHit(
+            path=path,
+            source=sources[path][0],
+            score=score,
+            lines=_matching_lines(sources[path][1], terms),
+        )
+        for path, score in index.search(terms)
+    ], None
+
+
+def format_search_output(query: str, hits: list[OpinionSearchHit]) -> str:
+    """Format opinion search hits as a human-readable list."""
+    lines = [f"Search: {query}", ""]
+    if not hits:
+        lines.append("No matching opinions found.")
+        return "\n".join(lines)
+
+    lines.append(f"Found {len(hits)} match(es):")
+    for hit in hits:
+        source = "" if hit.source == "core" else f" [{hit.source}]"
+        lines.append(f"  • {hit.path}{source} (relevance: {hit.score:.2f})")
+        for line in hit.lines:
+            lines.append(f"      {line}")
+    return "\n".join(lines)
+
+
 def format_list_output(tree: OpinionsTree) -> str:
     """Format opinions tree as a human-readable tree structure.
 
@@ -391,6 +820,90 @@ def format_list_output(tree: OpinionsTree) -> str:
     return "\n".join(lines)
 
 
+def build_opinions_matrix(
+    start_path: Path,
+    domain: str | None = None,
+    stage: str | None = None,
+    subtype: str | None = None,
+) -> list[ResolvedOpinions] | None:
+    """Resolve every opinion combination for a matrix export.
+
+    Args:
+        start_path: Directory to search for opinions/ and the workspace from
+        domain: Only include this domain
+        stage: Only include this stage
+        subtype: Only include this subtype
+
+    Returns:
+        Resolved bundles in combination order, or None if no opinions
+        directory was found.
+    """
+    opinions_root = find_opinions_root(start_path)
+    if opinions_root is None:
+        return None
+
+    extension_manifests = _get_extension_manifests(start_path) or []
+    combinations = [
+        (d, s, t)
+        for d, s, t in opinion_combinations(opinions_root, extension_manifests)
+        if (domain is None or d == domain)
+        and (stage is None or s == stage)
+        and (subtype is None or t == subtype)
+    ]
+    return _resolve_many(combinations, opinions_root, extension_manifests)
+
+
+def format_matrix_json(
+    bundles: list[ResolvedOpinions], redact: bool = False
+) -> dict[str, Any]:
+    """Format a matrix export as one JSON-serializable document.
+
+    Each bundle is the ``--json`` schema plus its ``--prompt`` text.
+
+    Args:
+        bundles: Resolved bundles
+        redact: Whether to apply redaction to prompt content
+
+    Returns:
+        Dict with the bundle count and the bundles
+    """
+    return {
+        "count": len(bundles),
+        "bundles": [
+            {
+                **format_json_output(resolved),
+                "prompt": format_prompt_output(resolved, redact=redact)[0],
+            }
+            for resolved in bundles
+        ],
+    }
+
+
+def write_matrix_prompts(
+    bundles: list[ResolvedOpinions], output_dir: Path, redact: bool = False
+) -> list[Path]:
+    """Write each bundle's prompt context to its own markdown file.
+
+    Args:
+        bundles: Resolved bundles
+        output_dir: Directory to write into (created if missing)
+        redact: Whether to apply redaction to prompt content
+
+    Returns:
+        Paths of the files written, named by :func:`matrix_bundle_name`
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    for resolved in bundles:
+        name = matrix_bundle_name(resolved.domain, resolved.stage, resolved.subtype)
+        prompt_path = output_dir / f"{name}.md"
+        prompt_path.write_text(
+            format_prompt_output(resolved, redact=redact)[0], encoding="utf-8"
+        )
+        written.append(prompt_path)
+    return written
+
+
 def get_opinions_tree(
     opinions_root: Path | None = None,
     start_path: Path | None = None,
@@ -16,7 +16,11 @@ from praxis.domain.stages import (
     get_allowed_stages,
     get_next_stage,
 )
-from praxis.infrastructure.yaml_loader import load_praxis_config
+from praxis.infrastructure.project_snapshot import (
+    ProjectSnapshot,
+    path_exists,
+    take_project_snapshot,
+)
 
 
 class StageHistoryDisplay(BaseModel):
@@ -97,6 +101,7 @@ def get_next_stage_requirements(
     next_stage: Stage | None,
     config: PraxisConfig,
     project_root: Path,
+    snapshot: ProjectSnapshot | None = None,
 ) -> list[str]:
     """Get requirements to advance to the next stage.
 
@@ -105,6 +110,7 @@ def get_next_stage_requirements(
         next_stage: Next stage (or None if at Close).
         config: Current project config.
         project_root: Project directory.
+        snapshot: Optional project snapshot to answer file existence from.
 
     Returns:
         List of requirement descriptions.
@@ -118,8 +124,7 @@ def get_next_stage_requirements(
     if next_stage in REQUIRES_ARTIFACT:
         artifact_path = ARTIFACT_PATHS.get(config.domain)
         if artifact_path:
-            full_path = project_root / artifact_path
-            if not full_path.exists():
+            if not path_exists(project_root, artifact_path, snapshot):
                 requirements.append(f"Create {artifact_path}")
 
     # Stage-specific guidance
@@ -167,6 +172,9 @@ def resolve_checklist_paths(
 def get_status(path: Path) -> ProjectStatus:
     """Get complete project status.
 
+    praxis.yaml is parsed and the project listed once, in a snapshot that
+    validation and next steps share.
+
     Args:
         path: Project directory.
 
@@ -179,7 +187,8 @@ def get_status(path: Path) -> ProjectStatus:
     project_root = path.resolve()
 
     # Load config first to get project name from config if available
-    load_result = load_praxis_config(project_root)
+    snapshot = take_project_snapshot(project_root)
+    load_result = snapshot.config_result
 
     # Use config.name if present, otherwise fall back to directory name
     if load_result.valid and load_result.config and load_result.config.name:
@@ -189,7 +198,7 @@ def get_status(path: Path) -> ProjectStatus:
 
     if not load_result.valid or load_result.config is None:
         # Generate next steps even for invalid config
-        next_steps = get_next_steps(None, load_result, project_root)
+        next_steps = get_next_steps(None, load_result, project_root, snapshot)
         return ProjectStatus(
             project_name=project_name,
             config=None,
@@ -218,7 +227,7 @@ def get_status(path: Path) -> ProjectStatus:
     artifact_path = str(artifact_path_obj) if artifact_path_obj else None
     artifact_exists = False
     if artifact_path_obj:
-        artifact_exists = (project_root / artifact_path_obj).exists()
+        artifact_exists = snapshot.exists(artifact_path_obj)
 
     # Checklist info
     checklist_base, checklist_addendum = resolve_checklist_paths(
@@ -227,14 +236,14 @@ def get_status(path: Path) -> ProjectStatus:
 
     # Requirements
     requirements = get_next_stage_requirements(
-        config.stage, next_stage_value, config, project_root
+        config.stage, next_stage_value, config, project_root, snapshot
     )
 
     # Validation
-    validation = validate(project_root)
+    validation = validate(project_root, snapshot)
 
     # Next steps guidance
-    next_steps = get_next_steps(config, validation, project_root)
+    next_steps = get_next_steps(config, validation, project_root, snapshot)
 
     # History from praxis.yaml
     history = get_stage_history_from_config(config)
@@ -12,10 +12,13 @@ from praxis.infrastructure.git_history import (
     check_regression,
     get_previous_config,
 )
-from praxis.infrastructure.yaml_loader import load_praxis_config
+from praxis.infrastructure.project_snapshot import (
+    ProjectSnapshot,
+    take_project_snapshot,
+)
 
 
-def validate(path: Path) -> ValidationResult:
+def validate(path: Path, snapshot: ProjectSnapshot | None = None) -> ValidationResult:
     """Validate a praxis.yaml configuration.
 
     Performs all validation checks:
@@ -27,18 +30,18 @@ def validate(path: Path) -> ValidationResult:
 
     Args:
         path: Path to praxis.yaml file or project directory.
+        snapshot: Snapshot of the project taken by the caller; praxis.yaml
+            is loaded and the project listed here if not given.
 
     Returns:
         ValidationResult with all issues found.
     """
-    # Resolve project root
-    if path.is_dir():
-        project_root = path
-    else:
-        project_root = path.parent
+    if snapshot is None:
+        snapshot = take_project_snapshot(path)
+    project_root = snapshot.root
 
     # Step 1: Load and validate schema
-    result = load_praxis_config(path)
+    result = snapshot.config_result
     if not result.valid or result.config is None:
         return result
 
@@ -58,7 +61,7 @@ def validate(path: Path) -> ValidationResult:
         )
 
     # Step 3: Check artifact existence
-    artifact_issue = check_artifact_exists(config, project_root)
+    artifact_issue = check_artifact_exists(config, project_root, snapshot)
     if artifact_issue is not None:
         issues.append(artifact_issue)
 
@@ -6,6 +6,7 @@ from pathlib import Path
 
 import click
 import typer
+from typer.core import TyperGroup
 
 from praxis import __version__
 from praxis.application.audit_service import audit_project
@@ -21,11 +22,22 @@ from praxis.application.extension_service import (
 from praxis.application.init_service import init_project
 from praxis.application.next_steps_service import format_next_steps_human
 from praxis.application.opinions_service import (
+    build_opinions_matrix,
+    compute_opinions_delta,
+    format_delta_json,
+    format_delta_output,
+    format_delta_prompt,
     format_json_output,
     format_list_output,
+    format_matrix_json,
     format_prompt_output,
+    format_search_output,
     get_opinions_tree,
     resolve_opinions,
+    resolve_opinions_many,
+    search_opinions,
+    warm_opinions_cache,
+    write_matrix_prompts,
 )
 from praxis.application.stage_service import transition_stage
 from praxis.application.status_service import get_status
@@ -55,12 +67,33 @@ app = typer.Typer(
     rich_markup_mode=None,  # Disable Rich formatting boxes
 )
 
+
+class _OpinionsGroup(TyperGroup):
+    """Opinions group whose PATH argument may be omitted before a subcommand.
+
+    Without this, ``praxis opinions search ...`` would bind "search" to
+    PATH. A leading subcommand name always runs the subcommand with the
+    default PATH; a path of the same name must be passed as ``./search``.
+    """
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if args and args[0] in self.commands:
+            if Path(args[0]).exists():
+                typer.echo(
+                    f"⚠ '{args[0]}' runs the opinions {args[0]} subcommand; "
+                    f"pass ./{args[0]} to use the path of that name as PATH",
+                    err=True,
+                )
+            args = [".", *args]
+        return super().parse_args(ctx, args)
+
+
 # Sub-apps for command groups (inherit rich_markup_mode from parent)
 workspace_app = typer.Typer(help="Workspace management commands.")
 extensions_app = typer.Typer(help="Extension management commands.")
 examples_app = typer.Typer(help="Example management commands.")
 templates_app = typer.Typer(help="Template rendering commands.")
-opinions_app = typer.Typer(help="Opinions resolution and export.")
+opinions_app = typer.Typer(help="Opinions resolution and export.", cls=_OpinionsGroup)
 guide_app = typer.Typer(help="In-terminal documentation guides.")
 research_app = typer.Typer(help="Research session management commands.")
 library_app = typer.Typer(help="Research library query and maintenance commands.")
@@ -1292,7 +1325,7 @@ def context_cmd(
 
     Use --json for machine-readable output with stable schema.
     """
-    bundle = get_context(path.resolve())
+    bundle = get_context(path.resolve(), use_cache=True)
 
     # Handle errors
     if bundle.errors:
@@ -2262,6 +2295,27 @@ def opinions_cmd(
         "--redact",
         help="Apply pattern-based redaction to sensitive content (defense-in-depth).",
     ),
+    warm_cache: bool = typer.Option(
+        False,
+        "--warm-cache",
+        help="Precompute cached opinion bundles for every domain/stage/subtype.",
+    ),
+    matrix: bool = typer.Option(
+        False,
+        "--matrix",
+        help="Resolve every domain/stage/subtype combination in one run.",
+    ),
+    output_path: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="With --matrix: write a JSON document (*.json) or a directory of prompt files.",
+    ),
+    delta_from: str | None = typer.Option(
+        None,
+        "--delta-from",
+        help="Only show opinion files added, removed or changed since this stage.",
+    ),
 ) -> None:
     """Resolve and display applicable opinions for a project.
 
@@ -2274,6 +2328,10 @@ def opinions_cmd(
         praxis opinions --prompt           # AI-ready context
         praxis opinions --json             # Machine-readable
         praxis opinions --list             # All available files
+        praxis opinions --warm-cache       # Precompute the bundle cache
+        praxis opinions --matrix -o ctx/   # Prompt file per combination
+        praxis opinions --delta-from shape --prompt  # Context update
+        praxis opinions search hexagonal   # Files mentioning a term
         praxis opinions --domain code --stage capture
     """
     import json as json_module
@@ -2289,6 +2347,33 @@ def opinions_cmd(
         typer.echo(format_list_output(tree))
         return
 
+    if warm_cache:
+        count, cache_dir = warm_opinions_cache(path.resolve())
+        if cache_dir is None:
+            typer.echo("Warning: No opinions directory found", err=True)
+            raise typer.Exit(0)
+        typer.echo(f"✓ Cached {count} opinion bundles in {cache_dir}")
+        return
+
+    if matrix:
+        bundles = build_opinions_matrix(path.resolve(), domain, stage, subtype)
+        if bundles is None:
+            typer.echo("Warning: No opinions directory found", err=True)
+            raise typer.Exit(0)
+        if output_path is None:
+            typer.echo(json_module.dumps(format_matrix_json(bundles, redact=redact), indent=2))
+        elif output_path.suffix == ".json":
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(
+                json_module.dumps(format_matrix_json(bundles, redact=redact), indent=2) + "\n",
+                encoding="utf-8",
+            )
+            typer.echo(f"✓ Wrote {len(bundles)} opinion bundles to {output_path}")
+        else:
+            written = write_matrix_prompts(bundles, output_path, redact=redact)
+            typer.echo(f"✓ Wrote {len(written)} prompt files to {output_path}")
+        return
+
     # If subcommand was invoked, let it handle
     if ctx.invoked_subcommand is not None:
         return
@@ -2323,12 +2408,46 @@ def opinions_cmd(
         )
         raise typer.Exit(1)
 
+    if delta_from is not None:
+        from praxis.domain.stages import Stage
+
+        valid_stages = [s.value for s in Stage]
+        if delta_from not in valid_stages:
+            typer.echo(
+                f"Error: invalid stage '{delta_from}'. Valid: {', '.join(valid_stages)}",
+                err=True,
+            )
+            raise typer.Exit(1)
+
+        previous, current = resolve_opinions_many(
+            [
+                (resolved_domain, delta_from, resolved_subtype),
+                (resolved_domain, resolved_stage, resolved_subtype),
+            ],
+            start_path=path.resolve(),
+        )
+        delta = compute_opinions_delta(previous, current)
+        for warning in dict.fromkeys(delta.warnings):
+            typer.echo(f"Warning: {warning}", err=True)
+
+        if json_output:
+            typer.echo(json_module.dumps(format_delta_json(delta), indent=2))
+        elif prompt:
+            output, redaction_warnings = format_delta_prompt(delta, redact=redact)
+            if redaction_warnings:
+                typer.echo(f"ℹ️  Redaction applied: {', '.join(set(redaction_warnings))}", err=True)
+            typer.echo(output)
+        else:
+            typer.echo(format_delta_output(delta))
+        return
+
     # Resolve opinions
     resolved = resolve_opinions(
         domain=resolved_domain,
         stage=resolved_stage,
         subtype=resolved_subtype,
         start_path=path.resolve(),
+        use_cache=True,
     )
 
     # Output warnings
@@ -2384,6 +2503,49 @@ def opinions_cmd(
         typer.echo(f"Total: {len(resolved.existing_files)} files")
 
 
+@opinions_app.command("search")
+def opinions_search_cmd(
+    ctx: typer.Context,
+    terms: list[str] = typer.Argument(
+        ...,
+        help="Terms that must all appear in an opinion file's body.",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output as JSON.",
+    ),
+) -> None:
+    """Search opinion bodies, including extension contributions.
+
+    Only the files resolution would use are searched: a core file hides
+    extension contributions to the same path. The index is kept under
+    .praxis/cache/ and updated for files edited since the last search.
+
+    Examples:
+        praxis opinions search hexagonal
+        praxis opinions search test coverage --json
+        praxis opinions ../other-project search ports
+
+    A leading "search" is always this subcommand; to use a directory named
+    "search" as PATH, pass it as "praxis opinions ./search".
+    """
+    import json as json_module
+
+    query = " ".join(terms)
+    project_path = Path(ctx.parent.params["path"]) if ctx.parent else Path(".")
+    hits, warning = search_opinions(query, start_path=project_path.resolve())
+    if warning:
+        typer.echo(f"Warning: {warning}", err=True)
+
+    if json_output:
+        data = {"query": query, "hits": [hit.model_dump() for hit in hits]}
+        typer.echo(json_module.dumps(data, indent=2))
+        return
+
+    typer.echo(format_search_output(query, hits))
+
+
 @guide_app.command("lifecycle")
 def guide_lifecycle_cmd() -> None:
     """Show lifecycle stages and Formalize hinge concept."""
@@ -2757,6 +2919,21 @@ def library_query_cmd(
         ...,
         help="Natural language question to answer from the library.",
     ),
+    fuzzy: bool = typer.Option(
+        False,
+        "--fuzzy",
+        help="Tolerate typos by matching on character-trigram similarity.",
+    ),
+    exclude_superseded: bool = typer.Option(
+        False,
+        "--exclude-superseded",
+        help="Leave superseded artifacts out of the answer.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Answer from the library even if the question is in the query cache.",
+    ),
     library_path: Path | None = typer.Option(
         None,
         "--library-path",
@@ -2780,18 +2957,31 @@ def library_query_cmd(
 
     from praxis.application.library_service import query_library_service
 
-    result = query_library_service(question, library_path)
+    result = query_library_service(
+        question,
+        library_path,
+        fuzzy=fuzzy,
+        exclude_superseded=exclude_superseded,
+        use_cache=not no_cache,
+    )
 
     if json_output:
         data = {
             "success": result.success,
             "query": result.query,
+            "fuzzy": result.fuzzy,
+            "exclude_superseded": result.exclude_superseded,
             "coverage_level": result.coverage_level,
             "coverage_reasoning": result.coverage_reasoning,
             "match_count": result.match_count,
             "summary": result.summary,
             "sources": result.sources,
             "gaps": result.gaps,
+            "stats": {
+                "catalog_parses": result.catalog_parses,
+                "file_reads": result.file_reads,
+                "cache_hit": result.cache_hit,
+            },
             "errors": result.errors,
         }
         typer.echo(json.dumps(data, indent=2))
@@ -2840,6 +3030,16 @@ def library_search_cmd(
         "-t",
         help="Optional topic to filter results.",
     ),
+    fulltext: bool = typer.Option(
+        False,
+        "--fulltext",
+        help="Search artifact bodies, ranked with BM25.",
+    ),
+    fuzzy: bool = typer.Option(
+        False,
+        "--fuzzy",
+        help="Tolerate typos by matching on character-trigram similarity.",
+    ),
     library_path: Path | None = typer.Option(
         None,
         "--library-path",
@@ -2863,13 +3063,15 @@ def library_search_cmd(
 
     from praxis.application.library_service import search_library_service
 
-    result = search_library_service(keyword, topic, library_path)
+    result = search_library_service(keyword, topic, library_path, fulltext=fulltext, fuzzy=fuzzy)
 
     if json_output:
         data = {
             "success": result.success,
             "keyword": result.keyword,
             "topic": result.topic,
+            "fulltext": result.fulltext,
+            "fuzzy": result.fuzzy,
             "matches": result.matches,
             "errors": result.errors,
         }
@@ -2887,6 +3089,10 @@ def library_search_cmd(
     typer.echo(f"Search: {result.keyword}")
     if result.topic:
         typer.echo(f"  Topic filter: {result.topic}")
+    if result.fulltext:
+        typer.echo("  Mode: full-text (BM25)")
+    if result.fuzzy:
+        typer.echo("  Mode: fuzzy (trigram similarity)")
     typer.echo("")
 
     if not result.matches:
@@ -2957,6 +3163,154 @@ def library_cite_cmd(
     raise typer.Exit(0)
 
 
+@library_app.command("related")
+def library_related_cmd(
+    artifact_id: str = typer.Argument(
+        ...,
+        help="Artifact ID to start from.",
+    ),
+    depth: int = typer.Option(
+        1,
+        "--depth",
+        "-d",
+        help="Number of links to follow.",
+    ),
+    library_path: Path | None = typer.Option(
+        None,
+        "--library-path",
+        "-l",
+        help="Path to research library (defaults to auto-detected).",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output as JSON.",
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Suppress non-error output.",
+    ),
+) -> None:
+    """List artifacts linked through related/supersedes metadata."""
+    import json
+
+    from praxis.application.library_service import find_related
+
+    result = find_related(artifact_id, depth, library_path)
+
+    if json_output:
+        data = {
+            "success": result.success,
+            "artifact_id": result.artifact_id,
+            "depth": result.depth,
+            "superseded_by": result.superseded_by,
+            "current_id": result.current_id,
+            "related": result.related,
+            "errors": result.errors,
+        }
+        typer.echo(json.dumps(data, indent=2))
+        raise typer.Exit(0 if result.success else 1)
+
+    if not result.success:
+        for err in result.errors:
+            typer.echo(f"✗ {err}", err=True)
+        raise typer.Exit(1)
+
+    if quiet:
+        raise typer.Exit(0)
+
+    typer.echo(f"Related to: {result.artifact_id}")
+    if result.superseded_by:
+        typer.echo(f"  Superseded by: {result.superseded_by}")
+        if result.current_id != result.superseded_by:
+            typer.echo(f"  Current version: {result.current_id}")
+    typer.echo("")
+
+    if not result.related:
+        typer.echo("No related artifacts found.")
+        raise typer.Exit(0)
+
+    typer.echo(f"Found {len(result.related)} related artifact(s):")
+    for artifact in result.related:
+        marker = " [superseded]" if artifact["superseded"] else ""
+        typer.echo(f"  • {artifact['id']} ({artifact['relation']}, distance {artifact['distance']}){marker}")
+        if artifact["title"]:
+            typer.echo(f"    {artifact['title']}")
+
+    raise typer.Exit(0)
+
+
+@library_app.command("similar")
+def library_similar_cmd(
+    artifact_path: Path = typer.Argument(
+        ...,
+        help="Markdown file to compare against the library.",
+    ),
+    top: int = typer.Option(
+        5,
+        "--top",
+        "-k",
+        help="Maximum number of similar artifacts to list.",
+    ),
+    library_path: Path | None = typer.Option(
+        None,
+        "--library-path",
+        "-l",
+        help="Path to research library (defaults to auto-detected).",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output as JSON.",
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Suppress non-error output.",
+    ),
+) -> None:
+    """List cataloged artifacts with content similar to a file (TF-IDF cosine)."""
+    import json
+
+    from praxis.application.library_service import find_similar
+
+    result = find_similar(artifact_path, top, library_path)
+
+    if json_output:
+        data = {
+            "success": result.success,
+            "path": result.path,
+            "matches": result.matches,
+            "errors": result.errors,
+        }
+        typer.echo(json.dumps(data, indent=2))
+        raise typer.Exit(0 if result.success else 1)
+
+    if not result.success:
+        for err in result.errors:
+            typer.echo(f"✗ {err}", err=True)
+        raise typer.Exit(1)
+
+    if quiet:
+        raise typer.Exit(0)
+
+    typer.echo(f"Similar to: {result.path}")
+    typer.echo("")
+
+    if not result.matches:
+        typer.echo("No similar artifacts found.")
+        raise typer.Exit(0)
+
+    for match in result.matches:
+        typer.echo(f"  • {match['id']} (similarity: {match['score']:.2f})")
+        typer.echo(f"    {match['title']}")
+
+    raise typer.Exit(0)
+
+
 @library_app.command("check-orphans")
 def library_check_orphans_cmd(
     library_path: Path | None = typer.Option(
@@ -2965,6 +3319,16 @@ def library_check_orphans_cmd(
         "-l",
         help="Path to research library (defaults to auto-detected).",
     ),
+    since: bool = typer.Option(
+        False,
+        "--since",
+        help="Only check files modified since the last run (plus orphans it reported).",
+    ),
+    strict: bool = typer.Option(
+        False,
+        "--strict",
+        help="Exit with status 1 if orphans are found (for pre-commit hooks).",
+    ),
     json_output: bool = typer.Option(
         False,
         "--json",
@@ -2982,7 +3346,8 @@ def library_check_orphans_cmd(
 
     from praxis.application.library_service import check_orphans
 
-    result = check_orphans(library_path)
+    result = check_orphans(library_path, since_last_run=since)
+    exit_code = 1 if strict and result.count else 0
 
     if json_output:
         data = {
@@ -2992,7 +3357,7 @@ def library_check_orphans_cmd(
             "errors": result.errors,
         }
         typer.echo(json.dumps(data, indent=2))
-        raise typer.Exit(0 if result.success else 1)
+        raise typer.Exit(exit_code if result.success else 1)
 
     if not result.success:
         for err in result.errors:
@@ -3000,7 +3365,7 @@ def library_check_orphans_cmd(
         raise typer.Exit(1)
 
     if quiet:
-        raise typer.Exit(0)
+        raise typer.Exit(exit_code)
 
     if result.count == 0:
         typer.echo("✓ No orphaned artifacts found")
@@ -3009,7 +3374,7 @@ def library_check_orphans_cmd(
         for orphan in result.orphans:
             typer.echo(f"  • {orphan}")
 
-    raise typer.Exit(0)
+    raise typer.Exit(exit_code)
 
 
 @library_app.command("check-stale")
@@ -3020,6 +3385,22 @@ def library_check_stale_cmd(
         "-d",
         help="Number of days before an artifact is considered stale.",
     ),
+    before: str | None = typer.Option(
+        None,
+        "--before",
+        help="Report artifacts dated before this date (YYYY-MM-DD) instead of using --days.",
+    ),
+    after: str | None = typer.Option(
+        None,
+        "--after",
+        help="Only report artifacts dated on or after this date (YYYY-MM-DD).",
+    ),
+    topic: str | None = typer.Option(
+        None,
+        "--topic",
+        "-t",
+        help="Only report artifacts in this topic.",
+    ),
     library_path: Path | None = typer.Option(
         None,
         "--library-path",
@@ -3043,7 +3424,7 @@ def library_check_stale_cmd(
 
     from praxis.application.library_service import check_stale
 
-    result = check_stale(days, library_path)
+    result = check_stale(days, library_path, before=before, after=after, topic=topic)
 
     if json_output:
         data = {
@@ -3051,6 +3432,9 @@ def library_check_stale_cmd(
             "stale_artifacts": result.stale_artifacts,
             "count": result.count,
             "threshold_days": result.threshold_days,
+            "before": result.before,
+            "after": result.after,
+            "topic": result.topic,
             "errors": result.errors,
         }
         typer.echo(json.dumps(data, indent=2))
@@ -3064,10 +3448,19 @@ def library_check_stale_cmd(
     if quiet:
         raise typer.Exit(0)
 
+    if before is None:
+        threshold = f"older than {days} days"
+    else:
+        threshold = f"dated before {result.before}"
+    if result.after:
+        threshold += f", on or after {result.after}"
+    if result.topic:
+        threshold += f", topic: {result.topic}"
+
     if result.count == 0:
-        typer.echo(f"✓ No stale artifacts found (threshold: {days} days)")
+        typer.echo(f"✓ No stale artifacts found ({threshold})")
     else:
-        typer.echo(f"Found {result.count} stale artifact(s) (older than {days} days):")
+        typer.echo(f"Found {result.count} stale artifact(s) ({threshold}):")
         for artifact in result.stale_artifacts:
             typer.echo(f"  • {artifact['id']} ({artifact['date']})")
             typer.echo(f"    {artifact['title']}")
@@ -3075,6 +3468,91 @@ def library_check_stale_cmd(
     raise typer.Exit(0)
 
 
+@library_app.command("catalog")
+def library_catalog_cmd(
+    artifacts: list[Path] | None = typer.Argument(
+        None,
+        help="Artifact files to catalog.",
+    ),
+    batch: Path | None = typer.Option(
+        None,
+        "--batch",
+        "-b",
+        help="Catalog every markdown artifact in this directory.",
+    ),
+    library_path: Path | None = typer.Option(
+        None,
+        "--library-path",
+        "-l",
+        help="Path to research library (defaults to auto-detected).",
+    ),
+    import_catalog: bool = typer.Option(
+        False,
+        "--import-catalog",
+        help="Convert a hand-curated CATALOG.md to the catalog store, "
+        "even if regenerating it drops content.",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output as JSON.",
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Suppress non-error output.",
+    ),
+) -> None:
+    """Catalog artifacts into the library, updating CATALOG.md once.
+
+    All artifacts are validated first; if any fails, nothing is cataloged.
+    A hand-curated CATALOG.md that the catalog store cannot regenerate
+    exactly is updated in place unless --import-catalog is given.
+    """
+    import json
+
+    from praxis.application.library_service import catalog_library_service
+
+    result = catalog_library_service(
+        artifacts,
+        batch_dir=batch,
+        library_path=library_path,
+        import_existing=import_catalog,
+    )
+
+    if json_output:
+        data = {
+            "success": result.success,
+            "count": result.count,
+            "cataloged": result.cataloged,
+            "errors": result.errors,
+            "warnings": result.warnings,
+        }
+        typer.echo(json.dumps(data, indent=2))
+        raise typer.Exit(0 if result.success else 1)
+
+    if not result.success:
+        for err in result.errors:
+            typer.echo(f"✗ {err}", err=True)
+        typer.echo("No artifacts were cataloged.", err=True)
+        raise typer.Exit(1)
+
+    for warning in result.warnings:
+        typer.echo(f"⚠ {warning}", err=True)
+
+    if quiet:
+        raise typer.Exit(0)
+
+    typer.echo(f"✓ Cataloged {result.count} artifact(s)")
+    for item in result.cataloged:
+        typer.echo(f"  {item['id']} → {item['path']}")
+        for match in item["similar"]:
+            typer.echo(f"    similar: {match['id']} ({match['score']:.2f})")
+
+    raise typer.Exit(0)
+
+
 @library_app.command("reindex")
 def library_reindex_cmd(
     library_path: Path | None = typer.Option(
@@ -3083,6 +3561,13 @@ def library_reindex_cmd(
         "-l",
         help="Path to research library (defaults to auto-detected).",
     ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=1,
+        help="Worker processes for parsing artifacts (defaults to CPU count).",
+    ),
     json_output: bool = typer.Option(
         False,
         "--json",
@@ -3100,12 +3585,15 @@ def library_reindex_cmd(
 
     from praxis.application.library_service import reindex_library_service
 
-    result = reindex_library_service(library_path)
+    result = reindex_library_service(library_path, max_workers=workers)
 
     if json_output:
         data = {
             "success": result.success,
             "implemented": result.implemented,
+            "artifact_count": result.artifact_count,
+            "parsed": result.parsed,
+            "reused": result.reused,
             "errors": result.errors,
         }
         typer.echo(json.dumps(data, indent=2))
@@ -3114,20 +3602,98 @@ def library_reindex_cmd(
     if not result.success:
         for err in result.errors:
             typer.echo(f"✗ {err}", err=True)
+        if result.implemented:
+            typer.echo("CATALOG.md was not modified.", err=True)
         raise typer.Exit(1)
 
     if quiet:
         raise typer.Exit(0)
 
-    if result.implemented:
-        typer.echo("✓ Library reindexed successfully")
-    else:
-        typer.echo("ℹ Reindex is not yet implemented")
-        typer.echo("  Use incremental cataloging via 'praxis research approve'")
+    typer.echo(f"✓ Library reindexed successfully ({result.artifact_count} artifacts)")
+    typer.echo(f"  Parsed: {result.parsed}, unchanged: {result.reused}")
 
     raise typer.Exit(0)
 
 
+@library_app.command("validate-all")
+def library_validate_all_cmd(
+    library_path: Path | None = typer.Option(
+        None,
+        "--library-path",
+        "-l",
+        help="Path to research library (defaults to auto-detected).",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=1,
+        help="Worker processes for parsing artifacts (defaults to CPU count).",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Stream one JSON object per artifact, then a summary object (NDJSON).",
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Suppress non-error output.",
+    ),
+) -> None:
+    """Validate the metadata of every artifact in the library."""
+    import json
+
+    from praxis.application.library_service import validate_library_service
+    from praxis.domain.catalog import ArtifactValidation
+
+    def report(artifact: ArtifactValidation) -> None:
+        if json_output:
+            data = {
+                "path": artifact.path,
+                "success": artifact.success,
+                "id": artifact.artifact_id,
+                "cached": artifact.cached,
+                "errors": [{"field": e.field, "message": e.message} for e in artifact.errors],
+            }
+            typer.echo(json.dumps(data))
+        elif not artifact.success:
+            for error in artifact.errors:
+                typer.echo(f"✗ {artifact.path}: {error.message}", err=True)
+        elif not quiet:
+            typer.echo(f"✓ {artifact.path}")
+
+    result = validate_library_service(library_path, max_workers=workers, on_artifact=report)
+
+    if json_output:
+        summary: dict[str, object] = {
+            "success": result.success,
+            "total": result.total,
+            "valid": result.valid,
+            "invalid": result.invalid,
+            "cached": result.cached,
+        }
+        if result.total == 0 and result.errors:
+            summary["errors"] = result.errors
+        typer.echo(json.dumps({"summary": summary}))
+        raise typer.Exit(0 if result.success else 1)
+
+    if result.total == 0 and not result.success:
+        for err in result.errors:
+            typer.echo(f"✗ {err}", err=True)
+        raise typer.Exit(1)
+
+    if not quiet or not result.success:
+        typer.echo("")
+        typer.echo(
+            f"Validated {result.total} artifact(s): {result.valid} valid, {result.invalid} invalid "
+            f"({result.cached} unchanged since last run)"
+        )
+
+    raise typer.Exit(0 if result.success else 1)
+
+
 # =============================================================================
 # Domain Commands
 # =============================================================================
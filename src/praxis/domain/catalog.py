@@ -31,6 +31,8 @@ class CatalogEntry:
         also_relevant: Optional list of secondary topics for cross-listing
         supersedes: Optional ID of artifact being replaced
         related: Optional list of related artifact IDs
+        topic_heading: Optional display name of the topic in CATALOG.md
+            (e.g. "AI Guards"), kept when a hand-written catalog is imported
     """
 
     id: str
@@ -45,6 +47,7 @@ class CatalogEntry:
     also_relevant: list[str] | None = None
     supersedes: str | None = None
     related: list[str] | None = None
+    topic_heading: str | None = None
 
 
 @dataclass
@@ -60,6 +63,21 @@ class ValidationError:
     message: str
 
 
+@dataclass
+class SimilarArtifact:
+    """An existing library artifact similar to one being cataloged.
+
+    Attributes:
+        id: Artifact ID
+        path: Path relative to the library
+        score: TF-IDF cosine similarity of the bodies (0.0-1.0)
+    """
+
+    id: str
+    path: Path
+    score: float
+
+
 @dataclass
 class CatalogResult:
     """Result of a cataloging operation.
@@ -68,8 +86,72 @@ class CatalogResult:
         success: Whether the operation succeeded
         entry: The catalog entry if successful
         errors: List of validation errors if unsuccessful
+        similar: Most similar existing artifacts, most similar first
+        warnings: Non-fatal notes about how the catalog was updated
     """
 
     success: bool
     entry: CatalogEntry | None = None
     errors: list[ValidationError] = field(default_factory=list)
+    similar: list[SimilarArtifact] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ReindexResult:
+    """Result of rebuilding the catalog from artifact metadata.
+
+    Attributes:
+        success: Whether CATALOG.md was rebuilt
+        entries: Catalog entries in catalog order (newest first, then by ID)
+        parsed: Number of artifacts parsed in this run
+        reused: Number of artifacts served from the reindex manifest
+        errors: Validation errors, messages prefixed with the artifact path
+    """
+
+    success: bool
+    entries: list[CatalogEntry] = field(default_factory=list)
+    parsed: int = 0
+    reused: int = 0
+    errors: list[ValidationError] = field(default_factory=list)
+
+
+@dataclass
+class BatchCatalogResult:
+    """Result of cataloging several artifacts as one batch.
+
+    The batch is all-or-nothing: on failure no artifact is copied into the
+    library and CATALOG.md is left untouched.
+
+    Attributes:
+        success: Whether every artifact was cataloged
+        entries: Catalog entries added, in batch order
+        errors: Validation errors, messages prefixed with the artifact file name
+        similar: Artifact ID -> most similar artifacts already in the library
+        warnings: Non-fatal notes about how the catalog was updated
+    """
+
+    success: bool
+    entries: list[CatalogEntry] = field(default_factory=list)
+    errors: list[ValidationError] = field(default_factory=list)
+    similar: dict[str, list[SimilarArtifact]] = field(default_factory=dict)
+    warnings: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ArtifactValidation:
+    """Validation outcome for one artifact in a library-wide check.
+
+    Attributes:
+        path: Artifact path relative to the library
+        success: Whether the artifact's metadata is valid
+        artifact_id: ID from the metadata if valid
+        cached: Whether the result was reused from an earlier run
+        errors: Validation errors if invalid
+    """
+
+    path: str
+    success: bool
+    artifact_id: str | None = None
+    cached: bool = False
+    errors: list[ValidationError] = field(default_factory=list)
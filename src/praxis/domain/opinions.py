@@ -99,3 +99,53 @@ class OpinionsTree(BaseModel):
         default_factory=dict,
         description="Map of file path to source ('core' or extension name)",
     )
+
+
+OpinionChangeKind = Literal["added", "removed", "changed", "unchanged"]
+
+
+class OpinionChange(BaseModel):
+    """How one opinion file differs between two resolution chains."""
+
+    path: str = Field(description="Relative path from opinions/ directory")
+    change: OpinionChangeKind
+    sha256: str = Field(description="Content hash in the new chain (old chain for removed files)")
+    previous_sha256: str | None = Field(
+        default=None,
+        description="Content hash in the old chain, for changed files",
+    )
+    source: str = Field(default="core", description="Provenance of the file")
+    content: str | None = Field(
+        default=None,
+        description="Markdown content, for added and changed files only",
+    )
+
+
+class OpinionsDelta(BaseModel):
+    """Difference between the opinions resolved for two stages."""
+
+    domain: str
+    subtype: str | None = None
+    from_stage: str | None = None
+    to_stage: str | None = None
+    files: list[OpinionChange] = Field(
+        default_factory=list,
+        description="Changes in new-chain order, then removed files",
+    )
+    warnings: list[str] = Field(default_factory=list)
+
+    def with_change(self, change: OpinionChangeKind) -> list[OpinionChange]:
+        """Return the files with the given change kind."""
+        return [f for f in self.files if f.change == change]
+
+
+class OpinionSearchHit(BaseModel):
+    """An opinion file whose body matches a search."""
+
+    path: str = Field(description="Relative path from opinions/ directory")
+    source: str = Field(default="core", description="Provenance of the file")
+    score: float = Field(description="BM25 relevance score")
+    lines: list[str] = Field(
+        default_factory=list,
+        description="First lines of the body that mention a search term",
+    )
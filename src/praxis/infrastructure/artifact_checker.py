@@ -7,17 +7,20 @@ from pathlib import Path
 from praxis.domain.domains import ARTIFACT_PATHS
 from praxis.domain.models import PraxisConfig, ValidationIssue
 from praxis.domain.stages import REQUIRES_ARTIFACT
+from praxis.infrastructure.project_snapshot import ProjectSnapshot, path_exists
 
 
 def check_artifact_exists(
     config: PraxisConfig,
     project_root: Path,
+    snapshot: ProjectSnapshot | None = None,
 ) -> ValidationIssue | None:
     """Check if the required formalization artifact exists.
 
     Args:
         config: The parsed praxis.yaml configuration.
         project_root: Path to the project root directory.
+        snapshot: Optional project snapshot to answer existence from.
 
     Returns:
         A ValidationIssue if the artifact is missing, None otherwise.
@@ -32,8 +35,7 @@ def check_artifact_exists(
         # Observe domain has no required artifact
         return None
 
-    full_path = project_root / artifact_path
-    if not full_path.exists():
+    if not path_exists(project_root, artifact_path, snapshot):
         # Determine checklist reference based on stage
         # For missing artifacts, reference the Formalize checklist
         checklist_ref = "core/checklists/formalize.md"
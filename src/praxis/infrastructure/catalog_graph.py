@@ -0,0 +1,209 @@
+"""Related-artifact graph for the research library.
+
+Links between artifacts come from catalog metadata: ``related`` (treated
+as undirected) and ``supersedes`` (newer -> older). The graph is built
+from the catalog store whenever the catalog is written and cached under
+``.index/``, keyed by the store's mtime and size, so traversals and
+superseded checks never open artifact files.
+
+A library that has never been cataloged or reindexed has no store. Its
+graph is built on demand by importing CATALOG.md, which reads the links
+from each listed artifact's metadata, and is cached keyed by CATALOG.md
+instead.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from praxis.domain.catalog import CatalogEntry
+from praxis.infrastructure.catalog_store import get_store_path, import_catalog, load_catalog_store
+from praxis.infrastructure.file_writer import atomic_write_text
+from praxis.infrastructure.library_index import INDEX_DIR
+
+GRAPH_FILE = "graph.json"
+GRAPH_VERSION = 2
+
+
+@dataclass
+class CatalogGraph:
+    """Adjacency index over catalog entries.
+
+    Attributes:
+        related: Artifact ID -> IDs it is related to (both directions).
+        supersedes: Artifact ID -> ID of the artifact it replaces.
+        superseded_by: Artifact ID -> ID of the artifact that replaces it.
+        retired: IDs whose status is ``superseded`` (even without a successor).
+    """
+
+    related: dict[str, list[str]] = field(default_factory=dict)
+    supersedes: dict[str, str] = field(default_factory=dict)
+    superseded_by: dict[str, str] = field(default_factory=dict)
+    retired: set[str] = field(default_factory=set)
+
+    def is_superseded(self, artifact_id: str) -> bool:
+        """Whether an artifact has been replaced or retired."""
+        return artifact_id in self.superseded_by or artifact_id in self.retired
+
+    def resolve(self, artifact_id: str) -> str:
+        """Follow superseded-by links to the current version of an artifact.
+
+        Args:
+            artifact_id: Any version's ID.
+
+        Returns:
+            ID of the newest artifact in the chain (``artifact_id`` itself
+            if it has not been superseded).
+        """
+        current = artifact_id
+        seen = {current}
+        while current in self.superseded_by:
+            current = self.superseded_by[current]
+            if current in seen:
+                break
+            seen.add(current)
+        return current
+
+    def neighbors(self, artifact_id: str, depth: int = 1) -> list[tuple[str, int, str]]:
+        """Breadth-first walk of the links around an artifact.
+
+        Args:
+            artifact_id: Starting artifact.
+            depth: Maximum number of links to follow.
+
+        Returns:
+            (artifact ID, distance, relation of the link that reached it)
+            for every artifact within ``depth`` links, nearest first. The
+            relation is ``related``, ``supersedes`` or ``superseded-by``.
+        """
+        found: list[tuple[str, int, str]] = []
+        seen = {artifact_id}
+        queue = deque([(artifact_id, 0)])
+        while queue:
+            current, distance = queue.popleft()
+            if distance >= depth:
+                continue
+            links = [(other, "related") for other in self.related.get(current, [])]
+            if current in self.supersedes:
+                links.append((self.supersedes[current], "supersedes"))
+            if current in self.superseded_by:
+                links.append((self.superseded_by[current], "superseded-by"))
+            for other, relation in links:
+                if other in seen:
+                    continue
+                seen.add(other)
+                found.append((other, distance + 1, relation))
+                queue.append((other, distance + 1))
+        return found
+
+
+def build_catalog_graph(entries: list[CatalogEntry]) -> CatalogGraph:
+    """Build the graph from catalog entries.
+
+    Args:
+        entries: All catalog entries.
+
+    Returns:
+        CatalogGraph with related lists sorted by ID.
+    """
+    related: dict[str, set[str]] = {}
+    graph = CatalogGraph()
+    for entry in entries:
+        for other in entry.related or []:
+            other_id = str(other)
+            if other_id and other_id != entry.id:
+                related.setdefault(entry.id, set()).add(other_id)
+                related.setdefault(other_id, set()).add(entry.id)
+        if entry.supersedes:
+            graph.supersedes[entry.id] = str(entry.supersedes)
+            graph.superseded_by[str(entry.supersedes)] = entry.id
+        if entry.status == "superseded":
+            graph.retired.add(entry.id)
+    graph.related = {artifact_id: sorted(ids) for artifact_id, ids in sorted(related.items())}
+    return graph
+
+
+def _graph_path(catalog_path: Path) -> Path:
+    return catalog_path.parent / INDEX_DIR / GRAPH_FILE
+
+
+def _graph_source(catalog_path: Path) -> dict[str, Any] | None:
+    """Key of the file the graph is built from: the store if present, else CATALOG.md."""
+    store_path = get_store_path(catalog_path)
+    source_path = store_path if store_path.exists() else catalog_path
+    try:
+        stat = source_path.stat()
+    except OSError:
+        return None
+    return {"name": source_path.name, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def save_catalog_graph(graph: CatalogGraph, catalog_path: Path) -> None:
+    """Persist the graph, keyed by its current source file, ignoring write failures.
+
+    Args:
+        graph: Graph built from the store's entries (or CATALOG.md's, if
+            the library has no store).
+        catalog_path: Path to CATALOG.md.
+    """
+    source = _graph_source(catalog_path)
+    if source is None:
+        return
+    data = {
+        "version": GRAPH_VERSION,
+        "source": source,
+        "related": graph.related,
+        "supersedes": graph.supersedes,
+        "retired": sorted(graph.retired),
+    }
+    graph_path = _graph_path(catalog_path)
+    try:
+        graph_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(graph_path, json.dumps(data))
+    except OSError:
+        pass
+
+
+def load_catalog_graph(catalog_path: Path) -> CatalogGraph | None:
+    """Load the graph for a library, rebuilding it if stale or missing.
+
+    The graph is rebuilt from the catalog store, or, for a library without
+    a store, from CATALOG.md and the metadata of the artifacts it lists.
+
+    Args:
+        catalog_path: Path to CATALOG.md.
+
+    Returns:
+        CatalogGraph, or None if the library has neither a store nor a
+        CATALOG.md.
+
+    Raises:
+        ValueError: If the catalog store is malformed.
+    """
+    source = _graph_source(catalog_path)
+    if source is None:
+        return None
+
+    try:
+        data = json.loads(_graph_path(catalog_path).read_text(encoding="utf-8"))
+        if data["version"] == GRAPH_VERSION and data["source"] == source:
+            supersedes = {str(k): str(v) for k, v in data["supersedes"].items()}
+            return CatalogGraph(
+                related={str(k): [str(i) for i in v] for k, v in data["related"].items()},
+                supersedes=supersedes,
+                superseded_by={old: new for new, old in supersedes.items()},
+                retired={str(i) for i in data["retired"]},
+            )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
+    store = load_catalog_store(catalog_path)
+    if store is None:
+        store = import_catalog(catalog_path)
+    graph = build_catalog_graph(store.entries)
+    save_catalog_graph(graph, catalog_path)
+    return graph
@@ -0,0 +1,106 @@
+"""Inter-process lock around research library catalog mutation.
+
+Cataloging reads the catalog store, adds entries and writes the store,
+CATALOG.md and the graph back. Two workers doing that at the same time
+would each write their own view and one batch would be lost, so every
+read-modify-write of the catalog runs under an exclusive lock on
+``.index/catalog.lock``.
+
+The lock is an advisory OS lock (``fcntl.flock`` on POSIX,
+``msvcrt.locking`` on Windows) held on an open file, so it is released
+when the holder exits or crashes; there are no stale lock files to clean
+up. Acquisition is non-blocking and retried with exponential backoff and
+jitter until a timeout.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+from praxis.infrastructure.library_index import INDEX_DIR
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+LOCK_FILE = "catalog.lock"
+LOCK_TIMEOUT = 30.0
+LOCK_INITIAL_DELAY = 0.01
+LOCK_MAX_DELAY = 0.5
+
+
+class CatalogLockTimeout(TimeoutError):
+    """Raised when the catalog lock cannot be acquired in time."""
+
+
+def get_lock_path(catalog_path: Path) -> Path:
+    """Return the lock file path for a catalog."""
+    return catalog_path.parent / INDEX_DIR / LOCK_FILE
+
+
+def _try_lock(handle: IO[bytes]) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:  # pragma: no cover - Windows
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(handle: IO[bytes]) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def catalog_lock(
+    catalog_path: Path,
+    timeout: float = LOCK_TIMEOUT,
+    initial_delay: float = LOCK_INITIAL_DELAY,
+    max_delay: float = LOCK_MAX_DELAY,
+) -> Iterator[None]:
+    """Hold the exclusive catalog lock for the duration of the block.
+
+    The lock is not reentrant: do not acquire it again while holding it.
+
+    Args:
+        catalog_path: Path to CATALOG.md.
+        timeout: Seconds to keep retrying before giving up.
+        initial_delay: First backoff delay in seconds; doubled after each
+            failed attempt, up to ``max_delay``, with random jitter.
+        max_delay: Longest single backoff delay in seconds.
+
+    Raises:
+        CatalogLockTimeout: If another process holds the lock for longer
+            than ``timeout``.
+    """
+    lock_path = get_lock_path(catalog_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+
+    with open(lock_path, "a+b") as handle:
+        while not _try_lock(handle):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise CatalogLockTimeout(
+                    f"catalog is locked by another process (gave up after {timeout:g}s): {lock_path}"
+                )
+            time.sleep(min(remaining, delay * random.uniform(0.5, 1.0)))
+            delay = min(delay * 2, max_delay)
+        try:
+            yield
+        finally:
+            _unlock(handle)
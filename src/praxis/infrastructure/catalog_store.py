@@ -0,0 +1,274 @@
+"""Structured catalog store for the research library.
+
+The store is a JSON lines file (``catalog.jsonl``) next to CATALOG.md with
+one catalog entry per line, kept in catalog order (newest first, then by
+ID) so diffs stay readable. It is the source of truth for the catalog:
+CATALOG.md is rendered from it.
+
+Libraries that predate the store are imported from CATALOG.md the first
+time the catalog is modified, provided re-rendering the imported catalog
+keeps every line of the existing one. A hand-curated CATALOG.md with
+content the store does not model (annotations, placeholder sections,
+free-form rows) is only imported on request; until then it keeps being
+updated in place.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from praxis.domain.catalog import CatalogEntry
+from praxis.infrastructure.catalog_metadata_parser import (
+    parse_artifact_metadata,
+    validate_artifact_metadata,
+)
+from praxis.infrastructure.catalog_writer import render_catalog, sort_entries
+from praxis.infrastructure.file_writer import atomic_write_text
+
+STORE_FILE = "catalog.jsonl"
+
+# Header stamps that every catalog update rewrites anyway
+_STAMP_LINE = re.compile(r"_(Last updated|Total artifacts): [^_]*_")
+
+
+@dataclass
+class CatalogStore:
+    """In-memory catalog with an ID index.
+
+    Attributes:
+        entries: Catalog entries in catalog order (newest first, then by ID).
+    """
+
+    entries: list[CatalogEntry] = field(default_factory=list)
+    _by_id: dict[str, CatalogEntry] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Sort entries into catalog order and rebuild the ID index."""
+        self.entries = sort_entries(self.entries)
+        self._by_id = {}
+        for entry in self.entries:
+            self._by_id.setdefault(entry.id, entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, artifact_id: object) -> bool:
+        return artifact_id in self._by_id
+
+    def get(self, artifact_id: str) -> CatalogEntry | None:
+        """Look up an entry by ID."""
+        return self._by_id.get(artifact_id)
+
+    def paths(self) -> set[Path]:
+        """Library-relative paths of all cataloged artifacts."""
+        return {Path(entry.path) for entry in self.entries}
+
+    def insert(self, entries: list[CatalogEntry]) -> None:
+        """Add entries as one transaction.
+
+        Either every entry is added or, if any ID is already cataloged or
+        repeated within ``entries``, none is.
+
+        Args:
+            entries: Entries to add.
+
+        Raises:
+            ValueError: If an ID is already in the store or repeated.
+        """
+        seen: set[str] = set()
+        for entry in entries:
+            if entry.id in self._by_id or entry.id in seen:
+                raise ValueError(f"duplicate ID: {entry.id}")
+            seen.add(entry.id)
+        self.entries = self.entries + list(entries)
+        self._reindex()
+
+    def artifacts(self) -> list[dict[str, Any]]:
+        """Entries as librarian artifact dicts, in catalog order."""
+        return [
+            {
+                "id": entry.id,
+                "path": str(entry.path),
+                "title": entry.title,
+                "topic": entry.topic,
+                "consensus": entry.consensus,
+                "date": entry.date,
+                "keywords": [str(keyword) for keyword in entry.keywords],
+            }
+            for entry in self.entries
+        ]
+
+
+def get_store_path(catalog_path: Path) -> Path:
+    """Get the store file for a catalog."""
+    return catalog_path.parent / STORE_FILE
+
+
+def _entry_to_record(entry: CatalogEntry) -> dict[str, Any]:
+    """Convert a CatalogEntry to a JSON-serializable record."""
+    record = asdict(entry)
+    record["path"] = Path(entry.path).as_posix()
+    return record
+
+
+def _record_to_entry(record: dict[str, Any]) -> CatalogEntry:
+    """Convert a stored record to a CatalogEntry."""
+    return CatalogEntry(**{**record, "path": Path(record["path"])})
+
+
+def load_catalog_store(catalog_path: Path) -> CatalogStore | None:
+    """Load the store next to a catalog.
+
+    Args:
+        catalog_path: Path to CATALOG.md.
+
+    Returns:
+        CatalogStore, or None if the library has no store yet.
+
+    Raises:
+        ValueError: If the store file is malformed.
+    """
+    store_path = get_store_path(catalog_path)
+    try:
+        lines = store_path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return None
+
+    entries: list[CatalogEntry] = []
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            entries.append(_record_to_entry(json.loads(line)))
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"{store_path}:{number}: invalid catalog record: {e}") from e
+    return CatalogStore(entries)
+
+
+def save_catalog_store(store: CatalogStore, catalog_path: Path) -> None:
+    """Write the store atomically.
+
+    Args:
+        store: Store to persist.
+        catalog_path: Path to CATALOG.md (the store is written next to it).
+    """
+    store_path = get_store_path(catalog_path)
+    content = "".join(json.dumps(_entry_to_record(entry), ensure_ascii=False) + "\n" for entry in store.entries)
+    atomic_write_text(store_path, content)
+
+
+def import_catalog(catalog_path: Path) -> CatalogStore:
+    """Build a store from an existing CATALOG.md.
+
+    Rows come from the catalog itself, with each topic's By Topic heading
+    kept as its display name. Keywords and the fields the markdown does not
+    carry (status, source count, cross-references) are taken from the
+    artifact's metadata when it validates and has the same ID.
+
+    Args:
+        catalog_path: Path to CATALOG.md.
+
+    Returns:
+        CatalogStore with one entry per cataloged artifact (empty if the
+        catalog is missing).
+    """
+    from praxis.infrastructure.librarian import parse_catalog_content, parse_topic_headings
+
+    try:
+        content = catalog_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return CatalogStore()
+
+    headings = parse_topic_headings(content)
+    entries: list[CatalogEntry] = []
+    seen: set[str] = set()
+    for artifact in parse_catalog_content(content):
+        if artifact["id"] in seen:
+            continue
+        seen.add(artifact["id"])
+
+        entry = CatalogEntry(
+            id=artifact["id"],
+            title=artifact["title"],
+            date=artifact["date"],
+            status="approved",
+            topic=artifact["topic"],
+            keywords=artifact["keywords"],
+            consensus=artifact["consensus"],
+            sources_count=0,
+            path=Path(artifact["path"]),
+            topic_heading=headings.get(artifact["id"]),
+        )
+
+        artifact_path = catalog_path.parent / artifact["path"]
+        try:
+            result = validate_artifact_metadata(parse_artifact_metadata(artifact_path), artifact_path)
+        except Exception:
+            result = None
+        if result is not None and result.success and result.entry is not None and result.entry.id == entry.id:
+            entry.status = result.entry.status
+            entry.keywords = result.entry.keywords
+            entry.sources_count = result.entry.sources_count
+            entry.also_relevant = result.entry.also_relevant
+            entry.supersedes = result.entry.supersedes
+            entry.related = result.entry.related
+
+        entries.append(entry)
+    return CatalogStore(entries)
+
+
+def import_is_lossless(catalog_path: Path, store: CatalogStore) -> bool:
+    """Whether rendering an imported store keeps every line of CATALOG.md.
+
+    Args:
+        catalog_path: Path to CATALOG.md.
+        store: Store imported from it.
+
+    Returns:
+        True if the catalog is missing or every non-blank line of it, other
+        than the "Last updated" and "Total artifacts" stamps, also appears
+        in the rendered catalog.
+    """
+    try:
+        content = catalog_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return True
+    rendered = set(render_catalog(store.entries).splitlines())
+    return all(
+        line in rendered for line in content.splitlines() if line.strip() and not _STAMP_LINE.fullmatch(line.strip())
+    )
+
+
+def open_catalog_store(catalog_path: Path, import_existing: bool = False) -> CatalogStore | None:
+    """Load the store, importing it from CATALOG.md if it doesn't exist yet.
+
+    The import only happens if re-rendering the catalog would lose nothing
+    (see :func:`import_is_lossless`) or ``import_existing`` is set. The
+    imported store is not written here; it is persisted by the first
+    change saved through :func:`save_catalog_store`.
+
+    Args:
+        catalog_path: Path to CATALOG.md.
+        import_existing: Import even if hand-written content would be lost.
+
+    Returns:
+        CatalogStore for the library, or None if the library has no store
+        and CATALOG.md should keep being updated in place.
+
+    Raises:
+        ValueError: If the store file is malformed.
+    """
+    store = load_catalog_store(catalog_path)
+    if store is not None:
+        return store
+    store = import_catalog(catalog_path)
+    if import_existing or import_is_lossless(catalog_path, store):
+        return store
+    return None
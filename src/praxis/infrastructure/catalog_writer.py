@@ -7,10 +7,13 @@ Follows the format defined in the Cataloger role specification.
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
 from praxis.domain.catalog import CatalogEntry
+from praxis.infrastructure.catalog_lock import catalog_lock
+from praxis.infrastructure.file_writer import atomic_write_text
 
 
 def _find_section_boundaries(content: str, section_header: str) -> tuple[int, int] | None:
@@ -44,14 +47,35 @@ def _find_section_boundaries(content: str, section_header: str) -> tuple[int, in
     return (start_pos, end_pos)
 
 
-def _update_quick_reference(content: str, entry: CatalogEntry) -> str:
-    """Update the Quick Reference table with a new entry.
+def _group(
+    entries: tuple[CatalogEntry, ...], key: Callable[[CatalogEntry], list[str]]
+) -> dict[str, list[CatalogEntry]]:
+    """Group entries by one or more keys each, preserving first-seen order."""
+    groups: dict[str, list[CatalogEntry]] = {}
+    for entry in entries:
+        for value in key(entry):
+            groups.setdefault(value, []).append(entry)
+    return groups
 
-    Adds entry in date-sorted order (newest first).
+
+def _topic_key(name: str) -> str:
+    """Compare topic folders and headings ("ai-guards" and "AI Guards") alike."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def _topic_heading(entry: CatalogEntry) -> str:
+    """By Topic heading for an entry's topic, defaulting to the title-cased folder name."""
+    return entry.topic_heading or entry.topic.title()
+
+
+def _update_quick_reference(content: str, *entries: CatalogEntry) -> str:
+    """Update the Quick Reference table with new entries.
+
+    Adds entries in date-sorted order (newest first).
 
     Args:
         content: Current CATALOG.md content.
-        entry: Catalog entry to add.
+        entries: Catalog entries to add.
 
     Returns:
         Updated content.
@@ -76,16 +100,18 @@ def _update_quick_reference(content: str, entry: CatalogEntry) -> str:
         row_date = match.group(6).strip()
         rows.append((row_date, row_id, row_path, row_title, row_topic, row_consensus))
 
-    # Add new entry
-    new_row = (
-        entry.date,
-        entry.id,
-        str(entry.path),
-        entry.title,
-        entry.topic,
-        entry.consensus,
-    )
-    rows.append(new_row)
+    # Add new entries
+    for entry in entries:
+        rows.append(
+            (
+                entry.date,
+                entry.id,
+                str(entry.path),
+                entry.title,
+                entry.topic,
+                entry.consensus,
+            )
+        )
 
     # Sort by date (newest first)
     rows.sort(reverse=True, key=lambda r: r[0])
@@ -105,14 +131,14 @@ def _update_quick_reference(content: str, entry: CatalogEntry) -> str:
     return content[:start_pos] + new_section + content[end_pos:]
 
 
-def _update_by_topic(content: str, entry: CatalogEntry) -> str:
-    """Update the By Topic section with a new entry.
+def _update_by_topic(content: str, *entries: CatalogEntry) -> str:
+    """Update the By Topic section with new entries.
 
-    Creates topic subsection if it doesn't exist.
+    Creates topic subsections that don't exist yet.
 
     Args:
         content: Current CATALOG.md content.
-        entry: Catalog entry to add.
+        entries: Catalog entries to add.
 
     Returns:
         Updated content.
@@ -124,75 +150,113 @@ def _update_by_topic(content: str, entry: CatalogEntry) -> str:
     start_pos, end_pos = boundaries
     section = content[start_pos:end_pos]
 
-    # Find or create topic subsection
-    topic_header = f"### {entry.topic.title()}"
-    topic_pattern = re.escape(topic_header) + r"\s*\n"
-    topic_match = re.search(topic_pattern, section)
+    for topic, topic_entries in _group(entries, lambda e: [_topic_heading(e)]).items():
+        # Find or create topic subsection; an existing heading matches
+        # however it is spelled ("### AI Guards" for topic "ai-guards")
+        topic_match = next(
+            (
+                match
+                for match in re.finditer(r"^### ([^\n]+?)\s*\n", section, re.MULTILINE)
+                if _topic_key(match.group(1)) == _topic_key(topic)
+            ),
+            None,
+        )
 
-    keywords_str = ", ".join(entry.keywords)
-    new_entry_line = f"| [{entry.id}]({entry.path}) | {entry.title} | " f"{entry.consensus} | {keywords_str} |\n"
+        new_entry_lines = "".join(
+            f"| [{entry.id}]({entry.path}) | {entry.title} | " f"{entry.consensus} | {', '.join(entry.keywords)} |\n"
+            for entry in topic_entries
+        )
 
-    if topic_match:
-        # Topic exists, add to it
-        # Find the table in this topic subsection
-        topic_start = topic_match.end()
+        if topic_match:
+            # Topic exists, add to it
+            # Find the table in this topic subsection
+            topic_start = topic_match.end()
 
-        # Find next subsection or end
-        next_topic = re.search(r"\n###\s+", section[topic_start:])
-        if next_topic:
-            topic_end = topic_start + next_topic.start()
-        else:
-            topic_end = len(section)
+            # Find next subsection or end
+            next_topic = re.search(r"\n###\s+", section[topic_start:])
+            if next_topic:
+                topic_end = topic_start + next_topic.start()
+            else:
+                topic_end = len(section)
 
-        topic_section = section[topic_start:topic_end]
+            topic_section = section[topic_start:topic_end]
+
+            # Insert after table header (skip first 2 lines)
+            lines = topic_section.split("\n")
+            if len(lines) >= 2:
+                # Insert after header row and separator
+                lines.insert(2, new_entry_lines.rstrip())
+                new_topic_section = "\n".join(lines)
+            else:
+                # No table yet, create it
+                new_topic_section = (
+                    "\n| ID | Title | Consensus | Keywords |\n"
+                    "|----|-------|-----------|----------|\n" + new_entry_lines
+                )
 
-        # Insert after table header (skip first 2 lines)
-        lines = topic_section.split("\n")
-        if len(lines) >= 2:
-            # Insert after header row and separator
-            lines.insert(2, new_entry_line.rstrip())
-            new_topic_section = "\n".join(lines)
+            section = section[:topic_start] + new_topic_section + section[topic_end:]
         else:
-            # No table yet, create it
-            new_topic_section = (
-                "\n| ID | Title | Consensus | Keywords |\n" "|----|-------|-----------|----------|\n" + new_entry_line
+            # Topic doesn't exist, create new subsection
+            # Insert alphabetically among existing topics
+            topic_headers = list(re.finditer(r"\n### ([^\n]+)", section))
+
+            # Find insertion point
+            insert_pos = None
+            for header_match in topic_headers:
+                existing_topic = header_match.group(1).strip()
+                if topic < existing_topic:
+                    insert_pos = header_match.start()
+                    break
+
+            if insert_pos is None:
+                # Add at end of topics
+                insert_pos = len(section) - 1
+
+            new_topic_block = (
+                f"\n### {topic}\n\n"
+                "| ID | Title | Consensus | Keywords |\n"
+                "|----|-------|-----------|----------|\n" + new_entry_lines + "\n"
             )
 
-        new_section = section[:topic_start] + new_topic_section + section[topic_end:]
-    else:
-        # Topic doesn't exist, create new subsection
-        # Insert alphabetically among existing topics
-        topic_headers = list(re.finditer(r"\n### ([^\n]+)", section))
-
-        # Find insertion point
-        insert_pos = None
-        for i, header_match in enumerate(topic_headers):
-            existing_topic = header_match.group(1).strip()
-            if entry.topic.title() < existing_topic:
-                insert_pos = header_match.start()
-                break
-
-        if insert_pos is None:
-            # Add at end of topics
-            insert_pos = len(section) - 1
-
-        new_topic_block = (
-            f"\n### {entry.topic.title()}\n\n"
-            "| ID | Title | Consensus | Keywords |\n"
-            "|----|-------|-----------|----------|\n" + new_entry_line + "\n"
-        )
+            section = section[:insert_pos] + new_topic_block + section[insert_pos:]
+
+    return content[:start_pos] + section + content[end_pos:]
 
-        new_section = section[:insert_pos] + new_topic_block + section[insert_pos:]
 
-    return content[:start_pos] + new_section + content[end_pos:]
+# By Consensus subsections, in catalog order
+CONSENSUS_SUBSECTIONS = [
+    "### High Consensus",
+    "### Strong Consensus",
+    "### Medium Consensus",
+    "### Partial Consensus (hypothesis under evaluation)",
+    "### Low Consensus (use with caution)",
+]
+
+
+def _consensus_subsection(consensus: str) -> str:
+    """Map a consensus value to its By Consensus subsection header."""
+    consensus_lower = consensus.lower()
+    if "high" in consensus_lower:
+        return "### High Consensus"
+    elif "strong" in consensus_lower:
+        return "### Strong Consensus"
+    elif "medium" in consensus_lower:
+        return "### Medium Consensus"
+    elif "partial" in consensus_lower:
+        return "### Partial Consensus (hypothesis under evaluation)"
+    elif "low" in consensus_lower:
+        return "### Low Consensus (use with caution)"
+    else:
+        # Default to Medium
+        return "### Medium Consensus"
 
 
-def _update_by_consensus(content: str, entry: CatalogEntry) -> str:
-    """Update the By Consensus section with a new entry.
+def _update_by_consensus(content: str, *entries: CatalogEntry) -> str:
+    """Update the By Consensus section with new entries.
 
     Args:
         content: Current CATALOG.md content.
-        entry: Catalog entry to add.
+        entries: Catalog entries to add.
 
     Returns:
         Updated content.
@@ -204,65 +268,52 @@ def _update_by_consensus(content: str, entry: CatalogEntry) -> str:
     start_pos, end_pos = boundaries
     section = content[start_pos:end_pos]
 
-    # Map consensus values to section headers
-    consensus_lower = entry.consensus.lower()
-    if "high" in consensus_lower:
-        subsection = "### High Consensus"
-    elif "strong" in consensus_lower:
-        subsection = "### Strong Consensus"
-    elif "medium" in consensus_lower:
-        subsection = "### Medium Consensus"
-    elif "partial" in consensus_lower:
-        subsection = "### Partial Consensus (hypothesis under evaluation)"
-    elif "low" in consensus_lower:
-        subsection = "### Low Consensus (use with caution)"
-    else:
-        # Default to Medium
-        subsection = "### Medium Consensus"
-
-    # Find subsection
-    subsection_pattern = re.escape(subsection) + r"\s*\n"
-    subsection_match = re.search(subsection_pattern, section)
+    for subsection, subsection_entries in _group(entries, lambda e: [_consensus_subsection(e.consensus)]).items():
+        # Find subsection
+        subsection_pattern = re.escape(subsection) + r"\s*\n"
+        subsection_match = re.search(subsection_pattern, section)
 
-    if not subsection_match:
-        raise ValueError(f"Consensus subsection not found: {subsection}")
+        if not subsection_match:
+            raise ValueError(f"Consensus subsection not found: {subsection}")
 
-    subsection_start = subsection_match.end()
+        subsection_start = subsection_match.end()
 
-    # Find next subsection or end
-    next_subsection = re.search(r"\n###\s+", section[subsection_start:])
-    if next_subsection:
-        subsection_end = subsection_start + next_subsection.start()
-    else:
-        subsection_end = len(section)
+        # Find next subsection or end
+        next_subsection = re.search(r"\n###\s+", section[subsection_start:])
+        if next_subsection:
+            subsection_end = subsection_start + next_subsection.start()
+        else:
+            subsection_end = len(section)
 
-    # Create new entry line
-    keywords_str = ", ".join(entry.keywords[:3])  # Show first 3 keywords
-    new_entry_line = f"- [{entry.title}]({entry.path}) — " f"{entry.topic} — {keywords_str}\n"
+        # Create new entry lines (first 3 keywords shown)
+        new_entry_lines = "\n".join(
+            f"- [{entry.title}]({entry.path}) — " f"{entry.topic} — {', '.join(entry.keywords[:3])}"
+            for entry in subsection_entries
+        )
 
-    # Insert at beginning of subsection (after blank line if exists)
-    subsection_content = section[subsection_start:subsection_end]
-    lines = subsection_content.split("\n")
+        # Insert at beginning of subsection (after blank line if exists)
+        subsection_content = section[subsection_start:subsection_end]
+        lines = subsection_content.split("\n")
 
-    # Skip leading blank lines
-    insert_idx = 0
-    while insert_idx < len(lines) and not lines[insert_idx].strip():
-        insert_idx += 1
+        # Skip leading blank lines
+        insert_idx = 0
+        while insert_idx < len(lines) and not lines[insert_idx].strip():
+            insert_idx += 1
 
-    lines.insert(insert_idx, new_entry_line.rstrip())
-    new_subsection_content = "\n".join(lines)
+        lines.insert(insert_idx, new_entry_lines)
+        new_subsection_content = "\n".join(lines)
 
-    new_section = section[:subsection_start] + new_subsection_content + section[subsection_end:]
+        section = section[:subsection_start] + new_subsection_content + section[subsection_end:]
 
-    return content[:start_pos] + new_section + content[end_pos:]
+    return content[:start_pos] + section + content[end_pos:]
 
 
-def _update_keyword_index(content: str, entry: CatalogEntry) -> str:
-    """Update the Keyword Index with entries for each keyword.
+def _update_keyword_index(content: str, *entries: CatalogEntry) -> str:
+    """Update the Keyword Index with lines for each keyword of new entries.
 
     Args:
         content: Current CATALOG.md content.
-        entry: Catalog entry to add.
+        entries: Catalog entries to add.
 
     Returns:
         Updated content.
@@ -275,15 +326,15 @@ def _update_keyword_index(content: str, entry: CatalogEntry) -> str:
     section = content[start_pos:end_pos]
 
     # For each keyword, find or create subsection
-    for keyword in entry.keywords:
+    for keyword, keyword_entries in _group(entries, lambda e: [str(k) for k in e.keywords]).items():
         keyword_header = f"### {keyword}"
         keyword_pattern = re.escape(keyword_header) + r"\s*\n"
         keyword_match = re.search(keyword_pattern, section)
 
-        new_entry_line = f"- [{entry.title}]({entry.path})\n"
+        new_entry_lines = "".join(f"- [{entry.title}]({entry.path})\n" for entry in keyword_entries)
 
         if keyword_match:
-            # Keyword section exists, add entry
+            # Keyword section exists, add entries
             keyword_start = keyword_match.end()
 
             # Find next keyword or end
@@ -293,7 +344,7 @@ def _update_keyword_index(content: str, entry: CatalogEntry) -> str:
             else:
                 keyword_end = len(section)
 
-            # Insert entry (after blank line if exists)
+            # Insert entries (after blank line if exists)
             keyword_content = section[keyword_start:keyword_end]
             lines = keyword_content.split("\n")
 
@@ -302,7 +353,7 @@ def _update_keyword_index(content: str, entry: CatalogEntry) -> str:
             while insert_idx < len(lines) and not lines[insert_idx].strip():
                 insert_idx += 1
 
-            lines.insert(insert_idx, new_entry_line.rstrip())
+            lines.insert(insert_idx, new_entry_lines.rstrip())
             new_keyword_content = "\n".join(lines)
 
             section = section[:keyword_start] + new_keyword_content + section[keyword_end:]
@@ -322,19 +373,19 @@ def _update_keyword_index(content: str, entry: CatalogEntry) -> str:
                 # Add at end
                 insert_pos = len(section) - 1
 
-            new_keyword_block = f"\n### {keyword}\n" + new_entry_line + "\n"
+            new_keyword_block = f"\n### {keyword}\n" + new_entry_lines + "\n"
 
             section = section[:insert_pos] + new_keyword_block + section[insert_pos:]
 
     return content[:start_pos] + section + content[end_pos:]
 
 
-def _update_recently_added(content: str, entry: CatalogEntry) -> str:
-    """Update the Recently Added section with a new entry at the top.
+def _update_recently_added(content: str, *entries: CatalogEntry) -> str:
+    """Update the Recently Added section with new entries at the top.
 
     Args:
         content: Current CATALOG.md content.
-        entry: Catalog entry to add.
+        entries: Catalog entries to add.
 
     Returns:
         Updated content.
@@ -356,10 +407,10 @@ def _update_recently_added(content: str, entry: CatalogEntry) -> str:
             insert_idx = i + 1
             break
 
-    # Create new row
-    new_row = f"| {entry.date} | [{entry.title}]({entry.path}) | {entry.topic} |"
+    # Create new rows
+    new_rows = [f"| {entry.date} | [{entry.title}]({entry.path}) | {entry.topic} |" for entry in entries]
 
-    lines.insert(insert_idx, new_row)
+    lines[insert_idx:insert_idx] = new_rows
     new_section = "\n".join(lines)
 
     return content[:start_pos] + new_section + content[end_pos:]
@@ -379,6 +430,25 @@ def update_catalog(catalog_path: Path, entry: CatalogEntry) -> None:
         catalog_path: Path to CATALOG.md file.
         entry: Catalog entry to add.
 
+    Raises:
+        FileNotFoundError: If CATALOG.md doesn't exist.
+        ValueError: If any required section is missing.
+    """
+    update_catalog_many(catalog_path, [entry])
+
+
+def update_catalog_many(catalog_path: Path, entries: list[CatalogEntry]) -> None:
+    """Update all sections of CATALOG.md with several new entries at once.
+
+    Each section is parsed and rewritten once for the whole batch, and the
+    file is written once, so cataloging N artifacts costs one catalog
+    rewrite rather than N. Nothing is written if any section update fails.
+    The read-modify-write runs under the catalog lock.
+
+    Args:
+        catalog_path: Path to CATALOG.md file.
+        entries: Catalog entries to add.
+
     Raises:
         FileNotFoundError: If CATALOG.md doesn't exist.
         ValueError: If any required section is missing.
@@ -386,14 +456,39 @@ def update_catalog(catalog_path: Path, entry: CatalogEntry) -> None:
     if not catalog_path.exists():
         raise FileNotFoundError(f"CATALOG.md not found: {catalog_path}")
 
-    content = catalog_path.read_text(encoding="utf-8")
+    if not entries:
+        return
+
+    with catalog_lock(catalog_path):
+        add_catalog_entries(catalog_path, entries)
+
+
+def add_catalog_entries(catalog_path: Path, entries: list[CatalogEntry]) -> None:
+    """Add entries to every section of CATALOG.md in place, in one write.
+
+    Unlike :func:`update_catalog_many` this does not take the catalog lock;
+    the caller must hold it.
+
+    Args:
+        catalog_path: Path to CATALOG.md file.
+        entries: Catalog entries to add.
+
+    Raises:
+        FileNotFoundError: If CATALOG.md doesn't exist.
+        ValueError: If any required section is missing.
+    """
+    content = _add_entries(catalog_path.read_text(encoding="utf-8"), entries)
+    atomic_write_text(catalog_path, content)
+
 
+def _add_entries(content: str, entries: list[CatalogEntry]) -> str:
+    """Return CATALOG.md content with entries added to every section."""
     # Update each section in sequence
-    content = _update_quick_reference(content, entry)
-    content = _update_by_topic(content, entry)
-    content = _update_by_consensus(content, entry)
-    content = _update_keyword_index(content, entry)
-    content = _update_recently_added(content, entry)
+    content = _update_quick_reference(content, *entries)
+    content = _update_by_topic(content, *entries)
+    content = _update_by_consensus(content, *entries)
+    content = _update_keyword_index(content, *entries)
+    content = _update_recently_added(content, *entries)
 
     # Update metadata at top (total artifacts count)
     # Pattern: _Total artifacts: NN_
@@ -401,15 +496,137 @@ def update_catalog(catalog_path: Path, entry: CatalogEntry) -> None:
     match = re.search(total_pattern, content)
     if match:
         current_count = int(match.group(1))
-        new_count = current_count + 1
+        new_count = current_count + len(entries)
         content = re.sub(total_pattern, f"_Total artifacts: {new_count}_", content)
 
     # Update last updated timestamp
     today = datetime.now().strftime("%Y-%m-%d")
     updated_pattern = r"_Last updated: [^_]+_"
-    content = re.sub(updated_pattern, f"_Last updated: {today}_", content)
+    return re.sub(updated_pattern, f"_Last updated: {today}_", content)
+
+
+def sort_entries(entries: list[CatalogEntry]) -> list[CatalogEntry]:
+    """Sort entries into catalog order: newest first, then by ID."""
+    by_id = sorted(entries, key=lambda e: e.id)
+    return sorted(by_id, key=lambda e: e.date, reverse=True)
+
+
+def render_catalog(entries: list[CatalogEntry]) -> str:
+    """Render a complete CATALOG.md from catalog entries.
+
+    Output depends only on the entries, so rebuilding the same library on
+    any machine produces byte-identical output. The "Last updated" stamp
+    is the newest artifact date rather than the wall clock for that reason.
+
+    Args:
+        entries: Catalog entries to render.
+
+    Returns:
+        Full CATALOG.md content.
+    """
+    ordered = sort_entries(entries)
+    last_updated = ordered[0].date if ordered else "—"
+
+    lines = [
+        "# Research Library Catalog",
+        "",
+        f"_Last updated: {last_updated}_",
+        f"_Total artifacts: {len(ordered)}_",
+        "",
+        "---",
+        "",
+        "## Quick Reference",
+        "",
+        "| ID | Title | Topic | Consensus | Date |",
+        "|----|-------|-------|-----------|------|",
+    ]
+    for entry in ordered:
+        lines.append(
+            f"| [{entry.id}]({entry.path}) | {entry.title} | {entry.topic} | " f"{entry.consensus} | {entry.date} |"
+        )
+
+    # By Topic, including cross-listings from also_relevant. Headings keep
+    # the display name recorded for the topic, if any entry carries one.
+    topics: dict[str, list[tuple[CatalogEntry, bool]]] = {}
+    headings: dict[str, str] = {}
+    for entry in ordered:
+        topics.setdefault(entry.topic, []).append((entry, False))
+        if entry.topic_heading:
+            headings.setdefault(entry.topic, entry.topic_heading)
+        for other in entry.also_relevant or []:
+            if other != entry.topic:
+                topics.setdefault(str(other), []).append((entry, True))
+
+    lines += ["", "---", "", "## By Topic", ""]
+    for topic in sorted(topics, key=lambda t: headings.get(t, t.title())):
+        lines += [
+            f"### {headings.get(topic, topic.title())}",
+            "",
+            "| ID | Title | Consensus | Keywords |",
+            "|----|-------|-----------|----------|",
+        ]
+        for entry, cross_listed in topics[topic]:
+            title = f"{entry.title} _(cross-listed)_" if cross_listed else entry.title
+            lines.append(f"| [{entry.id}]({entry.path}) | {title} | {entry.consensus} | {', '.join(entry.keywords)} |")
+        lines.append("")
+
+    lines += ["---", "", "## By Consensus", ""]
+    for subsection in CONSENSUS_SUBSECTIONS:
+        lines += [subsection, ""]
+        members = [e for e in ordered if _consensus_subsection(e.consensus) == subsection]
+        for entry in members:
+            lines.append(f"- [{entry.title}]({entry.path}) — {entry.topic} — {', '.join(entry.keywords[:3])}")
+        if not members:
+            lines.append("_No artifacts yet_")
+        lines.append("")
+
+    keywords: dict[str, list[CatalogEntry]] = {}
+    for entry in ordered:
+        for keyword in entry.keywords:
+            keywords.setdefault(str(keyword), []).append(entry)
+
+    lines += ["---", "", "## Keyword Index", ""]
+    for keyword in sorted(keywords, key=lambda k: (k.lower(), k)):
+        lines.append(f"### {keyword}")
+        for entry in sorted(keywords[keyword], key=lambda e: (e.title, e.id)):
+            lines.append(f"- [{entry.title}]({entry.path})")
+        lines.append("")
+
+    lines += [
+        "---",
+        "",
+        "## Recently Added",
+        "",
+        "| Date | Title | Topic |",
+        "|------|-------|-------|",
+    ]
+    for entry in ordered:
+        lines.append(f"| {entry.date} | [{entry.title}]({entry.path}) | {entry.topic} |")
+
+    lines += [
+        "",
+        "---",
+        "",
+        "## Superseded (Historical)",
+        "",
+        "| ID | Superseded By | Date |",
+        "|----|---------------|------|",
+    ]
+    superseding = [e for e in ordered if e.supersedes]
+    for entry in sorted(superseding, key=lambda e: str(e.supersedes)):
+        lines.append(f"| {entry.supersedes} | {entry.id} | {entry.date} |")
+    if not superseding:
+        lines.append("| _none yet_ | — | — |")
 
-    # Write atomically
-    temp_path = catalog_path.with_suffix(".md.tmp")
-    temp_path.write_text(content, encoding="utf-8")
-    temp_path.replace(catalog_path)
+    lines += ["", "---", "", "_Maintained by: cataloger agent_", ""]
+    return "\n".join(lines)
+
+
+def write_catalog(catalog_path: Path, entries: list[CatalogEntry]) -> None:
+    """Replace CATALOG.md with a catalog rendered from entries.
+
+    Args:
+        catalog_path: Path to CATALOG.md file.
+        entries: All catalog entries.
+    """
+    atomic_write_text(catalog_path, render_catalog(entries))
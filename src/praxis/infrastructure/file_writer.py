@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 from pathlib import Path
 
 
@@ -39,3 +41,29 @@ def check_files_exist(paths: list[Path]) -> list[Path]:
         List of paths that exist.
     """
     return [p for p in paths if p.exists()]
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Write a text file atomically.
+
+    The content goes to a uniquely named temporary file in the same
+    directory, is flushed to disk, then renamed over the target. Readers
+    see either the old file or the new one, never a partial write, and
+    concurrent writers never share a temporary file.
+
+    Args:
+        path: File to write.
+        content: Text content (written as UTF-8).
+    """
+    fd, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
@@ -3,40 +3,27 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
-CoverageLevel = Literal["good", "partial", "limited", "none"]
+from praxis.infrastructure.catalog_graph import load_catalog_graph
+from praxis.infrastructure.catalog_store import load_catalog_store
+from praxis.infrastructure.library_index import (
+    LibraryIndex,
+    SummaryCache,
+    load_fulltext_index,
+    load_library_index,
+    load_query_cache,
+    load_summary_cache,
+    load_topic_index,
+    query_cache_key,
+    save_query_cache,
+    save_summary_cache,
+)
+from praxis.infrastructure.text_index import extract_keywords
 
-# Stop words for basic keyword extraction
-STOP_WORDS = {
-    "what",
-    "is",
-    "are",
-    "the",
-    "a",
-    "an",
-    "how",
-    "why",
-    "where",
-    "when",
-    "do",
-    "does",
-    "can",
-    "could",
-    "would",
-    "should",
-    "about",
-    "for",
-    "in",
-    "on",
-    "to",
-    "of",
-    "and",
-    "or",
-    "with",
-}
+CoverageLevel = Literal["good", "partial", "limited", "none"]
 
 
 @dataclass
@@ -75,6 +62,21 @@ class CoverageAssessment:
     reasoning: str
 
 
+@dataclass
+class LibraryStats:
+    """I/O performed while answering a library request.
+
+    Attributes:
+        catalog_parses: Times the catalog was loaded (from index or markdown).
+        file_reads: Artifact files opened.
+        cache_hit: Whether the answer came from the query cache.
+    """
+
+    catalog_parses: int = 0
+    file_reads: int = 0
+    cache_hit: bool = False
+
+
 @dataclass
 class LibraryResponse:
     """Response from a library query."""
@@ -84,11 +86,14 @@ class LibraryResponse:
     summary: str
     sources: list[Citation]
     gaps: list[str]
+    stats: LibraryStats = field(default_factory=LibraryStats)
 
 
 def parse_catalog(catalog_path: Path) -> list[dict[str, Any]]:
     """Parse CATALOG.md and extract artifact metadata.
 
+    Reads the catalog store instead when the library has one.
+
     Args:
         catalog_path: Path to CATALOG.md file.
 
@@ -96,6 +101,13 @@ def parse_catalog(catalog_path: Path) -> list[dict[str, Any]]:
         List of dictionaries with artifact metadata.
         Returns empty list if file is missing or malformed.
     """
+    try:
+        store = load_catalog_store(catalog_path)
+    except ValueError:
+        return []
+    if store is not None:
+        return store.artifacts()
+
     if not catalog_path.exists():
         return []
 
@@ -105,17 +117,38 @@ def parse_catalog(catalog_path: Path) -> list[dict[str, Any]]:
         # Log warning but don't fail
         return []
 
+    return parse_catalog_content(content)
+
+
+def _section(content: str, header: str) -> str | None:
+    """Return the body of a ``## `` section, or None if absent."""
+    match = re.search(re.escape(header) + r"\s*\n(.*?)(?=\n## |\Z)", content, re.DOTALL)
+    return match.group(1) if match else None
+
+
+def parse_catalog_content(content: str) -> list[dict[str, Any]]:
+    """Parse CATALOG.md content and extract artifact metadata.
+
+    Args:
+        content: Full CATALOG.md content.
+
+    Returns:
+        List of dictionaries with artifact metadata.
+    """
     artifacts: list[dict[str, Any]] = []
 
     # Parse the Quick Reference table (primary source)
     # Format: | [id](path) | Title | Topic | Consensus | Date |
+    # Cells never span lines, so the By Topic tables further down
+    # cannot be mistaken for five-column rows.
+    quick_ref = _section(content, "## Quick Reference")
     quick_ref_pattern = (
         r"\|\s*\[([^\]]+)\]\(([^\)]+)\)\s*\|"
-        r"\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|"
-        r"\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|"
+        r"[ \t]*([^\|\n]+)\|[ \t]*([^\|\n]+)\|"
+        r"[ \t]*([^\|\n]+)\|[ \t]*([^\|\n]+)\|"
     )
 
-    for match in re.finditer(quick_ref_pattern, content):
+    for match in re.finditer(quick_ref_pattern, quick_ref if quick_ref is not None else content):
         artifact_id = match.group(1).strip()
         path = match.group(2).strip()
         title = match.group(3).strip()
@@ -136,32 +169,65 @@ def parse_catalog(catalog_path: Path) -> list[dict[str, Any]]:
         )
 
     # Parse keyword index to augment artifacts
-    # Find the "By Topic" section and extract keywords per artifact
-    topic_section_match = re.search(
-        r"## By Topic\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL
-    )
-    if topic_section_match:
-        topic_content = topic_section_match.group(1)
-        # Pattern for keyword rows: | [id](path) | Title | Consensus | Keywords |
-        keyword_pattern = (
-            r"\|\s*\[([^\]]+)\]\([^\)]+\)\s*\|"
-            r"\s*[^\|]+\s*\|\s*[^\|]+\s*\|\s*([^\|]+)\s*\|"
-        )
-        for match in re.finditer(keyword_pattern, topic_content):
-            artifact_id = match.group(1).strip()
-            keywords_str = match.group(2).strip()
-            # Parse keywords (comma-separated)
-            keywords = [k.strip() for k in keywords_str.split(",") if k.strip()]
-
-            # Update artifact with keywords
-            for artifact in artifacts:
-                if artifact["id"] == artifact_id:
-                    artifact["keywords"] = keywords
-                    break
+    # Find the "By Topic" section and extract keywords per artifact. An
+    # artifact listed under several topics (cross-listings) gets the
+    # keywords of every row, in the order they first appear.
+    topic_content = _section(content, "## By Topic")
+    if topic_content:
+        by_id = {artifact["id"]: artifact for artifact in artifacts}
+        for artifact_id, _, _, keywords in _by_topic_rows(topic_content):
+            if artifact_id in by_id:
+                merged = by_id[artifact_id]["keywords"]
+                merged.extend(k for k in keywords if k not in merged)
 
     return artifacts
 
 
+# Row of a By Topic table: | [id](path) | Title | Consensus | Keywords |
+_BY_TOPIC_ROW = re.compile(
+    r"\|\s*\[([^\]]+)\]\([^\)]+\)\s*\|"
+    r"[ \t]*([^\|\n]+)\|[^\|\n]+\|[ \t]*([^\|\n]+)\|"
+)
+
+
+def _by_topic_rows(topic_content: str) -> list[tuple[str, str, str, list[str]]]:
+    """Rows of the By Topic section as (ID, heading, title, keywords)."""
+    rows: list[tuple[str, str, str, list[str]]] = []
+    heading = ""
+    for line in topic_content.splitlines():
+        if line.startswith("### "):
+            heading = line[4:].strip()
+            continue
+        match = _BY_TOPIC_ROW.match(line.strip())
+        if match:
+            keywords = [k.strip() for k in match.group(3).split(",") if k.strip()]
+            rows.append((match.group(1).strip(), heading, match.group(2).strip(), keywords))
+    return rows
+
+
+def parse_topic_headings(content: str) -> dict[str, str]:
+    """Map artifact IDs to the By Topic heading that lists them.
+
+    Headings are display names ("AI Guards") that title-casing the topic
+    folder ("ai-guards") would not reproduce. Cross-listed rows are skipped,
+    so each ID maps to the heading of its own topic.
+
+    Args:
+        content: Full CATALOG.md content.
+
+    Returns:
+        Artifact ID -> heading text.
+    """
+    topic_content = _section(content, "## By Topic")
+    if not topic_content:
+        return {}
+    headings: dict[str, str] = {}
+    for artifact_id, heading, title, _ in _by_topic_rows(topic_content):
+        if heading and not title.endswith("_(cross-listed)_"):
+            headings.setdefault(artifact_id, heading)
+    return headings
+
+
 def calculate_relevance_score(
     artifact: dict[str, Any], query_terms: list[str]
 ) -> float:
@@ -230,6 +296,8 @@ def search_library(
 ) -> list[LibraryMatch]:
     """Search the research library catalog for relevant artifacts.
 
+    With a topic filter only that topic's shard of the index is loaded.
+
     Args:
         query: Search query string (e.g., "roles scrum").
         catalog_path: Path to CATALOG.md file.
@@ -240,8 +308,27 @@ def search_library(
         List of LibraryMatch objects, ranked by relevance (highest first).
         Returns empty list if catalog doesn't exist or is malformed.
     """
-    artifacts = parse_catalog(catalog_path)
-    if not artifacts:
+    index = _load_search_index(catalog_path, topic_filter)
+    if index is None:
+        return []
+    return _search_index(index, query, topic_filter, min_score)
+
+
+def _load_search_index(catalog_path: Path, topic_filter: str | None) -> LibraryIndex | None:
+    """Load the topic's shard when filtering by topic, otherwise the whole catalog index."""
+    if topic_filter:
+        return load_topic_index(catalog_path, topic_filter)
+    return load_library_index(catalog_path)
+
+
+def _search_index(
+    index: LibraryIndex,
+    query: str,
+    topic_filter: str | None = None,
+    min_score: float = 0.1,
+) -> list[LibraryMatch]:
+    """Search an already-loaded catalog index (see search_library)."""
+    if not index.artifacts:
         return []
 
     # Normalize query into terms
@@ -249,9 +336,16 @@ def search_library(
     if not query_terms:
         return []
 
+    # Only artifacts sharing an indexed term with the query can score
+    candidates: set[int] = set()
+    for term in query_terms:
+        candidates.update(index.candidates(term))
+
     matches: list[LibraryMatch] = []
 
-    for artifact in artifacts:
+    for position in sorted(candidates):
+        artifact = index.artifacts[position]
+
         # Apply topic filter if provided
         if topic_filter and artifact["topic"] != topic_filter:
             continue
@@ -263,22 +357,7 @@ def search_library(
         if score < min_score:
             continue
 
-        # Create LibraryMatch
-        keywords_list = artifact.get("keywords", [])
-        if not isinstance(keywords_list, list):
-            keywords_list = []
-
-        match = LibraryMatch(
-            id=str(artifact["id"]),
-            title=str(artifact["title"]),
-            path=Path(artifact["path"]),
-            topic=str(artifact["topic"]),
-            consensus=str(artifact["consensus"]),
-            date=str(artifact["date"]),
-            keywords=keywords_list,
-            relevance_score=score,
-        )
-        matches.append(match)
+        matches.append(_to_match(artifact, score))
 
     # Sort by relevance score (descending)
     matches.sort(key=lambda m: m.relevance_score, reverse=True)
@@ -286,20 +365,192 @@ def search_library(
     return matches
 
 
-def extract_keywords(question: str) -> list[str]:
-    """Extract searchable keywords from a question.
+def search_library_fuzzy(
+    query: str,
+    catalog_path: Path,
+    topic_filter: str | None = None,
+    min_score: float = 0.1,
+) -> list[LibraryMatch]:
+    """Search the catalog tolerating typos, by character-trigram similarity.
 
-    Removes stop words and short words (< 3 characters).
+    Each query term is matched against words from artifact IDs, titles and
+    keywords through the index's trigram postings. An artifact scores the
+    mean, over query terms, of its best-matching word's similarity.
 
     Args:
-        question: Natural language question.
+        query: Search query string (e.g., "hexagnal distilation").
+        catalog_path: Path to CATALOG.md file.
+        topic_filter: Optional topic to filter by (e.g., "roles").
+        min_score: Minimum relevance score threshold (default 0.1).
 
     Returns:
-        List of keywords extracted from the question.
+        List of LibraryMatch objects, ranked by similarity (highest first).
     """
-    # Remove punctuation and split into words
-    words = re.sub(r"[^\w\s]", " ", question.lower()).split()
-    return [w for w in words if w not in STOP_WORDS and len(w) > 2]
+    index = _load_search_index(catalog_path, topic_filter)
+    if index is None:
+        return []
+    return _search_index_fuzzy(index, query, topic_filter, min_score)
+
+
+def _search_index_fuzzy(
+    index: LibraryIndex,
+    query: str,
+    topic_filter: str | None = None,
+    min_score: float = 0.1,
+) -> list[LibraryMatch]:
+    """Fuzzy-search an already-loaded catalog index (see search_library_fuzzy)."""
+    query_terms = [term for term in re.split(r"[^a-z0-9]+", query.lower()) if term]
+    if not query_terms:
+        return []
+
+    # Best similarity per query term, for each artifact with any similar word
+    best: dict[int, list[float]] = {}
+    for i, term in enumerate(query_terms):
+        for word, similarity in index.similar_words(term).items():
+            for position in index.words[word]:
+                scores = best.setdefault(position, [0.0] * len(query_terms))
+                scores[i] = max(scores[i], similarity)
+
+    matches: list[LibraryMatch] = []
+    for position, scores in best.items():
+        artifact = index.artifacts[position]
+        if topic_filter and artifact["topic"] != topic_filter:
+            continue
+        score = round(sum(scores) / len(scores), 3)
+        if score < min_score:
+            continue
+        matches.append(_to_match(artifact, score))
+
+    matches.sort(key=lambda m: (-m.relevance_score, m.id))
+    return matches
+
+
+def _to_match(artifact: dict[str, Any], score: float) -> LibraryMatch:
+    """Build a LibraryMatch from indexed artifact metadata."""
+    keywords_list = artifact.get("keywords", [])
+    if not isinstance(keywords_list, list):
+        keywords_list = []
+
+    return LibraryMatch(
+        id=str(artifact["id"]),
+        title=str(artifact["title"]),
+        path=Path(artifact["path"]),
+        topic=str(artifact["topic"]),
+        consensus=str(artifact["consensus"]),
+        date=str(artifact["date"]),
+        keywords=keywords_list,
+        relevance_score=score,
+    )
+
+
+def search_library_fulltext(
+    query: str,
+    catalog_path: Path,
+    topic_filter: str | None = None,
+    min_score: float = 0.1,
+) -> list[LibraryMatch]:
+    """Search artifact bodies and rank them with BM25.
+
+    Term statistics come from the persisted full-text index, which is
+    refreshed only for artifacts changed since the last search.
+
+    Args:
+        query: Search query string (e.g., "hexagonal ports").
+        catalog_path: Path to CATALOG.md file.
+        topic_filter: Optional topic to filter by (e.g., "roles").
+        min_score: Minimum relevance score, relative to the best match.
+
+    Returns:
+        List of LibraryMatch objects, ranked by relevance (highest first).
+        Scores are normalized so the best match scores 1.0.
+    """
+    query_terms = extract_keywords(query)
+    if not query_terms:
+        return []
+
+    index = load_library_index(catalog_path)
+    if index is None or not index.artifacts:
+        return []
+
+    fulltext = load_fulltext_index(catalog_path.parent, index)
+    scores = fulltext.score(query_terms)
+    if topic_filter:
+        scores = {
+            artifact_id: score
+            for artifact_id, score in scores.items()
+            if (artifact := index.get(artifact_id)) is not None and artifact["topic"] == topic_filter
+        }
+    if not scores:
+        return []
+
+    best = max(scores.values())
+    matches: list[LibraryMatch] = []
+    for artifact_id, score in scores.items():
+        artifact = index.get(artifact_id)
+        relevance = score / best
+        if artifact is None or relevance < min_score:
+            continue
+        matches.append(_to_match(artifact, relevance))
+
+    matches.sort(key=lambda m: (-m.relevance_score, m.id))
+    return matches
+
+
+def find_similar_artifacts(
+    text: str,
+    catalog_path: Path,
+    top_k: int = 5,
+    exclude_path: Path | None = None,
+    min_score: float = 0.1,
+) -> list[LibraryMatch]:
+    """Find the cataloged artifacts whose bodies are most similar to a text.
+
+    Uses TF-IDF cosine similarity over the persisted full-text index,
+    which is refreshed only for artifacts changed since it was last used.
+
+    Args:
+        text: Artifact body to compare (e.g., a new artifact before cataloging).
+        catalog_path: Path to CATALOG.md file.
+        top_k: Maximum number of matches.
+        exclude_path: Library-relative path of the text's own artifact, if cataloged.
+        min_score: Minimum cosine similarity to report.
+
+    Returns:
+        List of LibraryMatch objects, most similar first, with the cosine
+        similarity (0.0-1.0) as relevance score.
+    """
+    return find_similar_artifacts_many([text], catalog_path, top_k, exclude_path, min_score)[0]
+
+
+def find_similar_artifacts_many(
+    texts: list[str],
+    catalog_path: Path,
+    top_k: int = 5,
+    exclude_path: Path | None = None,
+    min_score: float = 0.1,
+) -> list[list[LibraryMatch]]:
+    """Like :func:`find_similar_artifacts`, loading the indexes once for several texts.
+
+    Returns:
+        One list of matches per text, in input order.
+    """
+    results: list[list[LibraryMatch]] = [[] for _ in texts]
+    index = load_library_index(catalog_path)
+    if index is None or not index.artifacts:
+        return results
+
+    fulltext = load_fulltext_index(catalog_path.parent, index)
+    exclude = None
+    if exclude_path is not None:
+        own = exclude_path.as_posix()
+        exclude = {artifact_id for artifact_id, doc in fulltext.documents.items() if doc.path == own}
+
+    for matches, text in zip(results, texts):
+        for artifact_id, score in fulltext.similar(extract_keywords(text), top_k, exclude):
+            artifact = index.get(artifact_id)
+            if artifact is not None and score >= min_score:
+                matches.append(_to_match(artifact, score))
+    return results
 
 
 def get_artifact_summary(artifact_id: str, library_path: Path) -> str:
@@ -314,24 +565,26 @@ def get_artifact_summary(artifact_id: str, library_path: Path) -> str:
         Returns empty string if artifact not found or no summary section.
     """
     # First, find the artifact path from the catalog
-    catalog_path = library_path / "CATALOG.md"
-    artifacts = parse_catalog(catalog_path)
+    index = load_library_index(library_path / "CATALOG.md")
+    artifact = index.get(artifact_id) if index else None
+    if artifact is None:
+        return ""
 
-    artifact_path = None
-    for artifact in artifacts:
-        if artifact["id"] == artifact_id:
-            artifact_path = library_path / artifact["path"]
-            break
+    cache = load_summary_cache(library_path)
+    summary = _read_summary(library_path, Path(artifact["path"]), LibraryStats(), cache)
+    save_summary_cache(cache, library_path)
+    return summary
 
-    if not artifact_path or not artifact_path.exists():
-        return ""
 
-    try:
-        content = artifact_path.read_text(encoding="utf-8")
-    except Exception:
-        return ""
+def extract_summary(content: str) -> str:
+    """Extract the Executive Summary section from artifact content.
+
+    Args:
+        content: Full artifact markdown.
 
-    # Find the Executive Summary section
+    Returns:
+        Section body, or empty string if the artifact has no summary.
+    """
     # Pattern: ## Executive Summary followed by content until next ##
     pattern = r"## Executive Summary\s*\n(.*?)(?=\n##|\Z)"
     match = re.search(pattern, content, re.DOTALL)
@@ -343,6 +596,30 @@ def get_artifact_summary(artifact_id: str, library_path: Path) -> str:
     return ""
 
 
+def _read_summary(library_path: Path, rel_path: Path, stats: LibraryStats, cache: SummaryCache) -> str:
+    """Get the Executive Summary of an artifact file, reading it only on a cache miss."""
+    artifact_path = library_path / rel_path
+    try:
+        stat = artifact_path.stat()
+    except OSError:
+        return ""
+
+    key = rel_path.as_posix()
+    summary = cache.get(key, stat.st_mtime_ns, stat.st_size)
+    if summary is not None:
+        return summary
+
+    try:
+        stats.file_reads += 1
+        content = artifact_path.read_text(encoding="utf-8")
+    except Exception:
+        return ""
+
+    summary = extract_summary(content)
+    cache.put(key, stat.st_mtime_ns, stat.st_size, summary)
+    return summary
+
+
 def assess_coverage(query: str, library_path: Path) -> CoverageAssessment:
     """Assess how well the library covers a topic.
 
@@ -366,6 +643,11 @@ def assess_coverage(query: str, library_path: Path) -> CoverageAssessment:
     search_query = " ".join(keywords) if keywords else query
     matches = search_library(search_query, catalog_path, min_score=0.1)
 
+    return _assess_matches(query, matches)
+
+
+def _assess_matches(query: str, matches: list[LibraryMatch]) -> CoverageAssessment:
+    """Grade a search result against the coverage thresholds."""
     match_count = len(matches)
     if match_count > 0:
         avg_relevance = sum(m.relevance_score for m in matches) / match_count
@@ -405,6 +687,22 @@ def assess_coverage(query: str, library_path: Path) -> CoverageAssessment:
     )
 
 
+def _key_finding(summary: str) -> str:
+    """Pick a key finding from a summary: first prose line, else first bullet."""
+    lines = summary.split("\n")
+    # Find first non-empty line
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not stripped.startswith("-"):
+            return stripped
+    # If still empty, use first bullet point
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("-"):
+            return stripped[1:].strip()
+    return ""
+
+
 def get_citations(artifact_id: str, library_path: Path) -> list[Citation]:
     """Get formatted citations for an artifact.
 
@@ -416,54 +714,62 @@ def get_citations(artifact_id: str, library_path: Path) -> list[Citation]:
         List containing a single Citation for the artifact.
         Returns empty list if artifact not found.
     """
-    catalog_path = library_path / "CATALOG.md"
-    artifacts = parse_catalog(catalog_path)
-
-    for artifact in artifacts:
-        if artifact["id"] == artifact_id:
-            # Extract a key finding from the summary
-            summary = get_artifact_summary(artifact_id, library_path)
-            # Use first line or first sentence as key finding
-            key_finding = ""
-            if summary:
-                lines = summary.split("\n")
-                # Find first non-empty line
-                for line in lines:
-                    stripped = line.strip()
-                    if stripped and not stripped.startswith("-"):
-                        key_finding = stripped
-                        break
-                # If still empty, use first bullet point
-                if not key_finding:
-                    for line in lines:
-                        stripped = line.strip()
-                        if stripped.startswith("-"):
-                            key_finding = stripped[1:].strip()
-                            break
-
-            citation = Citation(
-                artifact_id=artifact["id"],
-                title=artifact["title"],
-                path=Path(artifact["path"]),
-                consensus=artifact["consensus"],
-                date=artifact["date"],
-                key_finding=key_finding,
-            )
-            return [citation]
-
-    return []
-
-
-def query_library(question: str, library_path: Path) -> LibraryResponse:
+    index = load_library_index(library_path / "CATALOG.md")
+    artifact = index.get(artifact_id) if index else None
+    if artifact is None:
+        return []
+
+    # Extract a key finding from the summary
+    cache = load_summary_cache(library_path)
+    summary = _read_summary(library_path, Path(artifact["path"]), LibraryStats(), cache)
+    save_summary_cache(cache, library_path)
+
+    citation = Citation(
+        artifact_id=artifact["id"],
+        title=artifact["title"],
+        path=Path(artifact["path"]),
+        consensus=artifact["consensus"],
+        date=artifact["date"],
+        key_finding=_key_finding(summary) if summary else "",
+    )
+    return [citation]
+
+
+def query_library(
+    question: str,
+    library_path: Path,
+    fuzzy: bool = False,
+    exclude_superseded: bool = False,
+    use_cache: bool = True,
+) -> LibraryResponse:
     """Answer a question using library artifacts.
 
+    The catalog is loaded once and searched once; coverage, summaries,
+    citations and gap detection all work from that single result. The
+    response's ``stats`` record the I/O this took.
+
+    Answers are cached under ``.index/`` by the question's keyword set, so
+    rephrasings with the same keywords are served without searching or
+    reading artifacts until the catalog changes, the entry expires, or one
+    of the cited artifacts is edited (checked by mtime and size).
+
     Args:
         question: Natural language question.
         library_path: Path to research library root (containing CATALOG.md).
+        fuzzy: Match question terms by trigram similarity (typo-tolerant).
+        exclude_superseded: Drop matches that have been superseded or retired,
+            using the catalog graph rather than artifact metadata.
+        use_cache: Serve and store answers in the query cache.
 
     Returns:
         LibraryResponse with coverage assessment, summary, sources, and gaps.
+
+    Raises:
+        ValueError: If superseded artifacts are to be excluded but the
+            catalog graph cannot be loaded or built.
     """
+    stats = LibraryStats()
+
     # Handle empty query
     if not question or not question.strip():
         return LibraryResponse(
@@ -477,18 +783,39 @@ def query_library(question: str, library_path: Path) -> LibraryResponse:
             summary="",
             sources=[],
             gaps=[],
+            stats=stats,
         )
 
     # Extract keywords from question
     keywords = extract_keywords(question)
     search_query = " ".join(keywords) if keywords else question
 
-    # Search library
-    catalog_path = library_path / "CATALOG.md"
-    matches = search_library(search_query, catalog_path, min_score=0.1)
+    # Load the catalog snapshot and search it once
+    index = load_library_index(library_path / "CATALOG.md")
+    stats.catalog_parses += 1
+
+    query_cache = load_query_cache(library_path, index.fingerprint.sha256) if index and use_cache else None
+    cache_key = query_cache_key(
+        keywords or question.lower().split(), fuzzy=fuzzy, exclude_superseded=exclude_superseded
+    )
+    cached = query_cache.get(cache_key) if query_cache else None
+    if cached is not None and not _cited_files_unchanged(library_path, cached.get("files")):
+        cached = None
+    if query_cache is not None and cached is not None:
+        stats.cache_hit = True
+        save_query_cache(query_cache, library_path)
+        return _response_from_cache(question, cached, stats)
+
+    search = _search_index_fuzzy if fuzzy else _search_index
+    matches = search(index, search_query, min_score=0.1) if index else []
+    if exclude_superseded and matches:
+        graph = load_catalog_graph(library_path / "CATALOG.md")
+        if graph is None:
+            raise ValueError(f"No catalog graph for {library_path}; cannot exclude superseded artifacts")
+        matches = [m for m in matches if not graph.is_superseded(m.id)]
 
     # Assess coverage
-    coverage = assess_coverage(question, library_path)
+    coverage = _assess_matches(question, matches)
 
     # Build response based on coverage
     if coverage.level == "none":
@@ -498,15 +825,17 @@ def query_library(question: str, library_path: Path) -> LibraryResponse:
             summary="",
             sources=[],
             gaps=[question],
+            stats=stats,
         )
 
     # Extract summaries from top matches (up to 3)
     top_matches = matches[:3]
     summaries = []
     sources = []
+    cache = load_summary_cache(library_path)
 
     for match in top_matches:
-        summary = get_artifact_summary(match.id, library_path)
+        summary = _read_summary(library_path, match.path, stats, cache)
         if summary:
             summaries.append(summary)
 
@@ -521,6 +850,8 @@ def query_library(question: str, library_path: Path) -> LibraryResponse:
         )
         sources.append(citation)
 
+    save_summary_cache(cache, library_path)
+
     # Combine summaries
     combined_summary = "\n\n".join(summaries) if summaries else ""
 
@@ -540,10 +871,63 @@ def query_library(question: str, library_path: Path) -> LibraryResponse:
             if len(keyword_matches) < 2:
                 gaps.append(keyword)
 
-    return LibraryResponse(
+    response = LibraryResponse(
         query=question,
         coverage=coverage,
         summary=combined_summary,
         sources=sources,
         gaps=gaps,
+        stats=stats,
+    )
+    if query_cache is not None:
+        # The stat each cited summary was read at, re-checked on a hit
+        files = {}
+        for source in sources:
+            stamp = cache.stamp(source.path.as_posix())
+            files[source.path.as_posix()] = list(stamp) if stamp else None
+        query_cache.put(cache_key, _response_to_cache(response, files))
+        save_query_cache(query_cache, library_path)
+    return response
+
+
+def _response_to_cache(response: LibraryResponse, files: dict[str, list[int] | None]) -> dict[str, Any]:
+    """Serialize the question-independent parts of a response for the query cache.
+
+    ``files`` maps each cited path to the (mtime_ns, size) its summary was
+    read at, or None if it could not be read.
+    """
+    return {
+        "coverage": asdict(response.coverage),
+        "summary": response.summary,
+        "sources": [{**asdict(source), "path": source.path.as_posix()} for source in response.sources],
+        "gaps": response.gaps,
+        "files": files,
+    }
+
+
+def _cited_files_unchanged(library_path: Path, files: Any) -> bool:
+    """Whether every artifact a cached answer cites still has the stat it was summarized at."""
+    if not isinstance(files, dict):
+        return False
+    for rel_path, stamp in files.items():
+        try:
+            stat = (library_path / rel_path).stat()
+        except OSError:
+            if stamp is not None:
+                return False
+            continue
+        if stamp != [stat.st_mtime_ns, stat.st_size]:
+            return False
+    return True
+
+
+def _response_from_cache(question: str, cached: dict[str, Any], stats: LibraryStats) -> LibraryResponse:
+    """Rebuild a response for ``question`` from a query cache entry."""
+    return LibraryResponse(
+        query=question,
+        coverage=CoverageAssessment(**cached["coverage"]),
+        summary=cached["summary"],
+        sources=[Citation(**{**source, "path": Path(source["path"])}) for source in cached["sources"]],
+        gaps=list(cached["gaps"]),
+        stats=stats,
     )
@@ -0,0 +1,796 @@
+"""Persistent search indexes for the research library.
+
+Builds an inverted index from the catalog and stores it under the
+library's ``.index/`` directory. The catalog is read from the structured
+store (``catalog.jsonl``) when the library has one, otherwise from
+CATALOG.md. The index is keyed by the source fingerprint (mtime, size,
+content hash) and is rebuilt automatically when the catalog changes, so
+searches do dictionary lookups instead of re-parsing markdown.
+
+Each topic also gets a shard: an index of just that topic's artifacts,
+written under ``.index/topics/`` whenever the catalog index is rebuilt, so
+a topic-filtered search only loads one topic.
+
+A second, full-text index holds BM25 term statistics over artifact bodies.
+It is maintained per artifact (by mtime and size), so only changed files
+are re-tokenized.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+from praxis.infrastructure.file_writer import atomic_write_text
+from praxis.infrastructure.text_index import FulltextDocument, FulltextIndex, extract_keywords
+
+INDEX_DIR = ".index"
+CATALOG_INDEX_FILE = "catalog.json"
+FULLTEXT_INDEX_FILE = "fulltext.json"
+PATHS_INDEX_FILE = "cataloged-paths.json"
+TOPIC_SHARD_DIR = "topics"
+SUMMARY_CACHE_FILE = "summaries.json"
+SUMMARY_CACHE_SIZE = 1024
+QUERY_CACHE_FILE = "queries.json"
+QUERY_CACHE_SIZE = 256
+QUERY_CACHE_TTL = 24 * 60 * 60  # seconds
+INDEX_VERSION = 5
+
+# Minimum trigram similarity (Jaccard) for a fuzzy word match
+FUZZY_THRESHOLD = 0.3
+
+
+@dataclass(frozen=True)
+class CatalogFingerprint:
+    """Identity of a catalog revision (store file or CATALOG.md)."""
+
+    source: str
+    mtime_ns: int
+    size: int
+    sha256: str
+
+
+@dataclass
+class LibraryIndex:
+    """In-memory view of the persisted catalog index.
+
+    Attributes:
+        fingerprint: Fingerprint of the CATALOG.md the index was built from.
+        artifacts: Artifact metadata dicts, in catalog order.
+        by_id: Artifact ID -> position in ``artifacts``.
+        terms: Lowercased term -> positions of artifacts containing it.
+        by_date: Positions of dated artifacts, sorted by (date, ID).
+        topic_dates: Lowercased topic -> its slice of ``by_date``.
+        words: Lowercased word from an ID, title or keyword -> positions.
+        trigrams: Character trigram -> words in ``words`` containing it.
+        term_grams: Character trigram of a term (or the whole term, if
+            shorter than three characters) -> terms in ``terms`` containing it.
+    """
+
+    fingerprint: CatalogFingerprint
+    artifacts: list[dict[str, Any]] = field(default_factory=list)
+    by_id: dict[str, int] = field(default_factory=dict)
+    terms: dict[str, list[int]] = field(default_factory=dict)
+    by_date: list[int] = field(default_factory=list)
+    topic_dates: dict[str, list[int]] = field(default_factory=dict)
+    words: dict[str, list[int]] = field(default_factory=dict)
+    trigrams: dict[str, list[str]] = field(default_factory=dict)
+    term_grams: dict[str, list[str]] = field(default_factory=dict)
+
+    def get(self, artifact_id: str) -> dict[str, Any] | None:
+        """Look up an artifact by ID."""
+        position = self.by_id.get(artifact_id)
+        return self.artifacts[position] if position is not None else None
+
+    def candidates(self, term: str) -> set[int]:
+        """Return positions of artifacts that may score for a query term.
+
+        A term can match an indexed term either way round (substring in
+        title, partial keyword match). Indexed terms inside the query term
+        are found by looking up each of its substrings; indexed terms
+        containing it are narrowed through ``term_grams`` before the
+        substring check, so the vocabulary is never scanned. Terms shorter
+        than three characters, which keyword extraction drops, only match
+        the indexed terms inside them.
+        """
+        term_lower = term.lower()
+        matched = {
+            term_lower[start:end]
+            for start in range(len(term_lower))
+            for end in range(start + 1, len(term_lower) + 1)
+            if term_lower[start:end] in self.terms
+        }
+        matched.update(self._terms_containing(term_lower))
+
+        positions: set[int] = set()
+        for indexed_term in matched:
+            positions.update(self.terms[indexed_term])
+        return positions
+
+    def _terms_containing(self, term: str) -> set[str]:
+        """Indexed terms that contain a (lowercased) query term."""
+        if len(term) < 3:
+            return set()
+        postings = sorted((self.term_grams.get(gram, []) for gram in term_grams(term)), key=len)
+        found = set(postings[0]).intersection(*postings[1:])
+        return {indexed_term for indexed_term in found if term in indexed_term}
+
+    def similar_words(self, term: str, threshold: float = FUZZY_THRESHOLD) -> dict[str, float]:
+        """Find indexed words that look like a (possibly misspelled) term.
+
+        Only words sharing at least one trigram with the term are
+        considered, found through the trigram postings, so the cost
+        depends on the term rather than on the catalog size.
+
+        Args:
+            term: Query term.
+            threshold: Minimum Jaccard similarity of the trigram sets.
+
+        Returns:
+            Word -> similarity in (0, 1], for words at or above threshold.
+        """
+        term_trigrams = trigrams(term.lower())
+        shared: dict[str, int] = {}
+        for trigram in term_trigrams:
+            for word in self.trigrams.get(trigram, []):
+                shared[word] = shared.get(word, 0) + 1
+
+        similar: dict[str, float] = {}
+        for word, count in shared.items():
+            similarity = count / (len(term_trigrams) + len(trigrams(word)) - count)
+            if similarity >= threshold:
+                similar[word] = similarity
+        return similar
+
+    def dated(
+        self, after: str | None = None, before: str | None = None, topic: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Return artifacts dated in ``[after, before)``, oldest first.
+
+        Both bounds are YYYY-MM-DD strings (compared as strings, like the
+        catalog dates) and either may be omitted. Undated artifacts are
+        never returned.
+
+        Args:
+            after: Earliest date to include.
+            before: Only dates strictly before this are included.
+            topic: Restrict to one topic (case-insensitive).
+
+        Returns:
+            Artifact metadata dicts sorted by date, then ID.
+        """
+        positions = self.by_date if topic is None else self.topic_dates.get(topic.lower(), [])
+
+        def date_of(position: int) -> str:
+            return str(self.artifacts[position]["date"])
+
+        start = bisect_left(positions, after, key=date_of) if after else 0
+        end = bisect_left(positions, before, key=date_of) if before else len(positions)
+        return [self.artifacts[position] for position in positions[start:end]]
+
+
+def get_index_dir(catalog_path: Path) -> Path:
+    """Get the index directory for a catalog."""
+    return catalog_path.parent / INDEX_DIR
+
+
+def trigrams(word: str) -> set[str]:
+    """Character trigrams of a word, padded so short words and word edges count."""
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def term_grams(term: str) -> set[str]:
+    """Unpadded character trigrams of a term (none if it is shorter than three)."""
+    return {term[i : i + 3] for i in range(len(term) - 2)}
+
+
+def _index_words(artifact: dict[str, Any]) -> set[str]:
+    """Collect the words of an artifact's ID, title and keywords for fuzzy matching."""
+    text = " ".join([str(artifact["id"]), str(artifact["title"]), *map(str, artifact.get("keywords", []))])
+    return {word for word in re.split(r"[^a-z0-9]+", text.lower()) if len(word) > 2 and not word.isdigit()}
+
+
+def _index_terms(artifact: dict[str, Any]) -> set[str]:
+    """Collect the searchable terms for one artifact."""
+    terms = {str(artifact["id"]).lower(), str(artifact["topic"]).lower()}
+    terms.update(word.lower() for word in str(artifact["title"]).split())
+    terms.update(str(keyword).lower() for keyword in artifact.get("keywords", []))
+    terms.discard("")
+    return terms
+
+
+def build_library_index(content: str, fingerprint: CatalogFingerprint) -> LibraryIndex:
+    """Build an index from CATALOG.md content.
+
+    Args:
+        content: Full CATALOG.md content.
+        fingerprint: Fingerprint of the catalog the content was read from.
+
+    Returns:
+        LibraryIndex for the catalog.
+    """
+    from praxis.infrastructure.librarian import parse_catalog_content
+
+    return _build_index(parse_catalog_content(content), fingerprint)
+
+
+def _build_index(artifacts: list[dict[str, Any]], fingerprint: CatalogFingerprint) -> LibraryIndex:
+    """Build an index from artifact metadata dicts, skipping repeated IDs."""
+    index = LibraryIndex(fingerprint=fingerprint)
+    for artifact in artifacts:
+        artifact_id = str(artifact["id"])
+        if artifact_id in index.by_id:
+            continue
+        position = len(index.artifacts)
+        index.artifacts.append(artifact)
+        index.by_id[artifact_id] = position
+        for term in _index_terms(artifact):
+            index.terms.setdefault(term, []).append(position)
+        for word in _index_words(artifact):
+            index.words.setdefault(word, []).append(position)
+
+    for word in sorted(index.words):
+        for trigram in trigrams(word):
+            index.trigrams.setdefault(trigram, []).append(word)
+    for term in sorted(index.terms):
+        for gram in term_grams(term):
+            index.term_grams.setdefault(gram, []).append(term)
+
+    index.by_date = sorted(
+        (position for position, artifact in enumerate(index.artifacts) if artifact.get("date")),
+        key=lambda position: (str(index.artifacts[position]["date"]), str(index.artifacts[position]["id"])),
+    )
+    for position in index.by_date:
+        index.topic_dates.setdefault(str(index.artifacts[position]["topic"]).lower(), []).append(position)
+    return index
+
+
+def _index_to_dict(index: LibraryIndex) -> dict[str, Any]:
+    """Convert a LibraryIndex to a dictionary for JSON serialization."""
+    return {
+        "version": INDEX_VERSION,
+        "catalog": {
+            "source": index.fingerprint.source,
+            "mtime_ns": index.fingerprint.mtime_ns,
+            "size": index.fingerprint.size,
+            "sha256": index.fingerprint.sha256,
+        },
+        "artifacts": index.artifacts,
+        "terms": index.terms,
+        "by_date": index.by_date,
+        "topic_dates": index.topic_dates,
+        "words": index.words,
+        "trigrams": index.trigrams,
+        "term_grams": index.term_grams,
+    }
+
+
+def _dict_to_index(data: dict[str, Any]) -> LibraryIndex:
+    """Convert a dictionary to a LibraryIndex."""
+    catalog = data["catalog"]
+    artifacts = data["artifacts"]
+    return LibraryIndex(
+        fingerprint=CatalogFingerprint(
+            source=str(catalog["source"]),
+            mtime_ns=int(catalog["mtime_ns"]),
+            size=int(catalog["size"]),
+            sha256=str(catalog["sha256"]),
+        ),
+        artifacts=artifacts,
+        by_id={str(a["id"]): i for i, a in enumerate(artifacts)},
+        terms=data["terms"],
+        by_date=data["by_date"],
+        topic_dates=data["topic_dates"],
+        words=data["words"],
+        trigrams=data["trigrams"],
+        term_grams=data["term_grams"],
+    )
+
+
+def _read_index(index_path: Path) -> LibraryIndex | None:
+    """Read a persisted index, returning None if missing or unusable."""
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return None
+    try:
+        return _dict_to_index(data)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def save_library_index(index: LibraryIndex, index_path: Path) -> None:
+    """Persist an index atomically.
+
+    Write failures are ignored: a read-only library still gets correct
+    (just unpersisted) search results.
+    """
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(index_path, json.dumps(_index_to_dict(index)))
+    except OSError:
+        pass
+
+
+def load_library_index(catalog_path: Path) -> LibraryIndex | None:
+    """Load the index for a catalog, rebuilding it if the catalog changed.
+
+    The catalog store is indexed when present, otherwise CATALOG.md. The
+    stored index is reused when the source's mtime and size are unchanged.
+    Otherwise the source's content hash is compared; a touched but
+    identical source only refreshes the stored fingerprint.
+
+    Args:
+        catalog_path: Path to CATALOG.md.
+
+    Returns:
+        LibraryIndex, or None if the catalog is missing or unreadable.
+    """
+    from praxis.infrastructure.catalog_store import get_store_path, load_catalog_store
+
+    store_path = get_store_path(catalog_path)
+    source_path = store_path if store_path.exists() else catalog_path
+    try:
+        stat = source_path.stat()
+    except OSError:
+        return None
+
+    index_path = get_index_dir(catalog_path) / CATALOG_INDEX_FILE
+    stored = _read_index(index_path)
+    if stored is not None and (stored.fingerprint.source, stored.fingerprint.mtime_ns, stored.fingerprint.size) == (
+        source_path.name,
+        stat.st_mtime_ns,
+        stat.st_size,
+    ):
+        return stored
+
+    try:
+        raw = source_path.read_bytes()
+    except OSError:
+        return None
+
+    fingerprint = CatalogFingerprint(
+        source=source_path.name,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        sha256=hashlib.sha256(raw).hexdigest(),
+    )
+
+    if stored is not None and (stored.fingerprint.source, stored.fingerprint.sha256) == (
+        fingerprint.source,
+        fingerprint.sha256,
+    ):
+        stored = replace(stored, fingerprint=fingerprint)
+        save_library_index(stored, index_path)
+        save_topic_shards(stored, catalog_path)
+        return stored
+
+    if source_path == store_path:
+        try:
+            store = load_catalog_store(catalog_path)
+        except ValueError:
+            return None
+        index = _build_index(store.artifacts() if store is not None else [], fingerprint)
+    else:
+        index = build_library_index(raw.decode("utf-8", errors="replace"), fingerprint)
+    save_library_index(index, index_path)
+    save_topic_shards(index, catalog_path)
+    return index
+
+
+def _shard_name(topic: str) -> str:
+    """File name stem of a topic's shard (topics match case-insensitively)."""
+    return re.sub(r"[^\w.-]", "_", topic.lower())
+
+
+def _catalog_source(catalog_path: Path) -> tuple[str, int, int] | None:
+    """Name, mtime and size of the file the catalog index is built from."""
+    from praxis.infrastructure.catalog_store import get_store_path
+
+    store_path = get_store_path(catalog_path)
+    source_path = store_path if store_path.exists() else catalog_path
+    try:
+        stat = source_path.stat()
+    except OSError:
+        return None
+    return source_path.name, stat.st_mtime_ns, stat.st_size
+
+
+def save_topic_shards(index: LibraryIndex, catalog_path: Path) -> None:
+    """Split an index into per-topic shards and persist them, ignoring write failures.
+
+    Shards of topics no longer in the catalog are removed.
+
+    Args:
+        index: Freshly built or refreshed catalog index.
+        catalog_path: Path to CATALOG.md.
+    """
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for artifact in index.artifacts:
+        groups.setdefault(_shard_name(str(artifact["topic"])), []).append(artifact)
+
+    shard_dir = get_index_dir(catalog_path) / TOPIC_SHARD_DIR
+    try:
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        for stale in shard_dir.glob("*.json"):
+            if stale.stem not in groups:
+                stale.unlink()
+    except OSError:
+        return
+    for name, artifacts in groups.items():
+        save_library_index(_build_index(artifacts, index.fingerprint), shard_dir / f"{name}.json")
+
+
+def load_topic_index(catalog_path: Path, topic: str) -> LibraryIndex | None:
+    """Load the index of one topic's artifacts.
+
+    Only the topic's shard is read when it is current. If the catalog has
+    changed, the catalog index (and with it every shard) is rebuilt first.
+
+    Args:
+        catalog_path: Path to CATALOG.md.
+        topic: Topic name (case-insensitive).
+
+    Returns:
+        LibraryIndex over the topic's artifacts (empty if the topic has
+        none), or None if the catalog is missing or unreadable.
+    """
+    source = _catalog_source(catalog_path)
+    if source is None:
+        return None
+
+    shard_path = get_index_dir(catalog_path) / TOPIC_SHARD_DIR / f"{_shard_name(topic)}.json"
+    shard = _read_index(shard_path)
+    if shard is not None and (shard.fingerprint.source, shard.fingerprint.mtime_ns, shard.fingerprint.size) == source:
+        return shard
+
+    index = load_library_index(catalog_path)
+    if index is None:
+        return None
+    shard = _read_index(shard_path)
+    if shard is not None and shard.fingerprint == index.fingerprint:
+        return shard
+    # Topic not in the catalog, or the shard could not be written
+    name = _shard_name(topic)
+    return _build_index([a for a in index.artifacts if _shard_name(str(a["topic"])) == name], index.fingerprint)
+
+
+@dataclass(frozen=True)
+class CatalogedPaths:
+    """Library-relative paths of every cataloged artifact.
+
+    Attributes:
+        source: Name of the file the paths were read from.
+        mtime_ns: Modification time of that file.
+        size: Size of that file.
+        paths: POSIX-style paths, relative to the library root.
+    """
+
+    source: str
+    mtime_ns: int
+    size: int
+    paths: frozenset[str]
+
+
+def _extract_cataloged_paths(catalog_path: Path, source_path: Path) -> frozenset[str]:
+    """Read cataloged paths from the store or from CATALOG.md table rows."""
+    from praxis.infrastructure.catalog_store import load_catalog_store
+
+    if source_path != catalog_path:
+        store = load_catalog_store(catalog_path)
+        return frozenset(p.as_posix() for p in store.paths()) if store is not None else frozenset()
+
+    # Pattern: | [id](path) | ... (any catalog table row)
+    content = catalog_path.read_text(encoding="utf-8")
+    return frozenset(
+        Path(match.group(1).strip()).as_posix() for match in re.finditer(r"\|\s*\[[^\]]+\]\(([^\)]+)\)\s*\|", content)
+    )
+
+
+def load_cataloged_paths(catalog_path: Path) -> CatalogedPaths | None:
+    """Load the set of cataloged paths, re-reading the catalog only if it changed.
+
+    The set is cached under ``.index/`` and keyed by the source file's
+    name, mtime and size (the catalog store when present, else CATALOG.md).
+
+    Args:
+        catalog_path: Path to CATALOG.md.
+
+    Returns:
+        CatalogedPaths, or None if the library has no catalog.
+
+    Raises:
+        ValueError: If the catalog store is malformed.
+    """
+    from praxis.infrastructure.catalog_store import get_store_path
+
+    store_path = get_store_path(catalog_path)
+    source_path = store_path if store_path.exists() else catalog_path
+    try:
+        stat = source_path.stat()
+    except OSError:
+        return None
+
+    index_path = get_index_dir(catalog_path) / PATHS_INDEX_FILE
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        if (data["version"], data["source"], data["mtime_ns"], data["size"]) == (
+            INDEX_VERSION,
+            source_path.name,
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            return CatalogedPaths(
+                source=source_path.name,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                paths=frozenset(data["paths"]),
+            )
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    cataloged = CatalogedPaths(
+        source=source_path.name,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        paths=_extract_cataloged_paths(catalog_path, source_path),
+    )
+    data = {
+        "version": INDEX_VERSION,
+        "source": cataloged.source,
+        "mtime_ns": cataloged.mtime_ns,
+        "size": cataloged.size,
+        "paths": sorted(cataloged.paths),
+    }
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(index_path, json.dumps(data))
+    except OSError:
+        pass
+    return cataloged
+
+
+@dataclass
+class SummaryCache:
+    """LRU cache of artifact Executive Summaries.
+
+    Entries are keyed by library-relative path and are only valid for the
+    mtime and size the summary was read at, so a lookup costs a stat
+    rather than a file read.
+
+    Attributes:
+        entries: Path -> (mtime_ns, size, summary), least recently used first.
+        max_entries: Entries kept before the least recently used is evicted.
+        changed: Whether the cache differs from what is on disk.
+    """
+
+    entries: OrderedDict[str, tuple[int, int, str]] = field(default_factory=OrderedDict)
+    max_entries: int = SUMMARY_CACHE_SIZE
+    changed: bool = False
+
+    def get(self, rel_path: str, mtime_ns: int, size: int) -> str | None:
+        """Return the cached summary if it matches the file's stat."""
+        cached = self.entries.get(rel_path)
+        if cached is None or cached[:2] != (mtime_ns, size):
+            return None
+        if next(reversed(self.entries)) != rel_path:
+            self.entries.move_to_end(rel_path)
+            self.changed = True
+        return cached[2]
+
+    def stamp(self, rel_path: str) -> tuple[int, int] | None:
+        """Return the (mtime_ns, size) a path's cached summary was read at."""
+        cached = self.entries.get(rel_path)
+        return None if cached is None else (cached[0], cached[1])
+
+    def put(self, rel_path: str, mtime_ns: int, size: int, summary: str) -> None:
+        """Store a summary, evicting the least recently used entries if full."""
+        self.entries[rel_path] = (mtime_ns, size, summary)
+        self.entries.move_to_end(rel_path)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.changed = True
+
+
+def load_summary_cache(library_path: Path) -> SummaryCache:
+    """Load the summary cache, or return an empty one."""
+    cache = SummaryCache()
+    try:
+        data = json.loads((library_path / INDEX_DIR / SUMMARY_CACHE_FILE).read_text(encoding="utf-8"))
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+            for rel_path, (mtime_ns, size, summary) in data["entries"].items():
+                cache.entries[rel_path] = (int(mtime_ns), int(size), str(summary))
+    except (OSError, ValueError, KeyError, TypeError):
+        return SummaryCache()
+    return cache
+
+
+def save_summary_cache(cache: SummaryCache, library_path: Path) -> None:
+    """Persist the summary cache atomically if it changed, ignoring write failures."""
+    if not cache.changed:
+        return
+    index_path = library_path / INDEX_DIR / SUMMARY_CACHE_FILE
+    data = {"version": INDEX_VERSION, "entries": cache.entries}
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(index_path, json.dumps(data))
+    except OSError:
+        return
+    cache.changed = False
+
+
+@dataclass
+class QueryCache:
+    """LRU cache of library query responses, with a time-to-live.
+
+    The cache belongs to one catalog fingerprint: loading it for a
+    different catalog yields an empty cache, so any change to the catalog
+    invalidates every entry.
+
+    Attributes:
+        catalog_sha256: Fingerprint of the catalog the entries were computed from.
+        entries: Query key -> (created at, response), least recently used first.
+        max_entries: Entries kept before the least recently used is evicted.
+        ttl: Seconds an entry stays valid.
+        changed: Whether the cache differs from what is on disk.
+    """
+
+    catalog_sha256: str
+    entries: OrderedDict[str, tuple[float, dict[str, Any]]] = field(default_factory=OrderedDict)
+    max_entries: int = QUERY_CACHE_SIZE
+    ttl: float = QUERY_CACHE_TTL
+    changed: bool = False
+
+    def get(self, key: str, now: float | None = None) -> dict[str, Any] | None:
+        """Return a cached response, dropping it if it has expired."""
+        cached = self.entries.get(key)
+        if cached is None:
+            return None
+        now = time.time() if now is None else now
+        if now - cached[0] > self.ttl:
+            del self.entries[key]
+            self.changed = True
+            return None
+        if next(reversed(self.entries)) != key:
+            self.entries.move_to_end(key)
+            self.changed = True
+        return cached[1]
+
+    def put(self, key: str, response: dict[str, Any], now: float | None = None) -> None:
+        """Store a response, evicting the least recently used entries if full."""
+        self.entries[key] = (time.time() if now is None else now, response)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.changed = True
+
+
+def query_cache_key(keywords: list[str], **options: bool) -> str:
+    """Normalize a query to a cache key: its keyword set plus any options that change the answer."""
+    flags = ",".join(f"{name}={int(value)}" for name, value in sorted(options.items()))
+    return f"{flags}|{' '.join(sorted(set(keywords)))}"
+
+
+def load_query_cache(library_path: Path, catalog_sha256: str) -> QueryCache:
+    """Load the query cache for the current catalog, or return an empty one."""
+    cache = QueryCache(catalog_sha256)
+    try:
+        data = json.loads((library_path / INDEX_DIR / QUERY_CACHE_FILE).read_text(encoding="utf-8"))
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION and data["catalog"] == catalog_sha256:
+            for key, (created, response) in data["entries"].items():
+                cache.entries[key] = (float(created), dict(response))
+    except (OSError, ValueError, KeyError, TypeError):
+        return QueryCache(catalog_sha256)
+    return cache
+
+
+def save_query_cache(cache: QueryCache, library_path: Path) -> None:
+    """Persist the query cache atomically if it changed, ignoring write failures."""
+    if not cache.changed:
+        return
+    index_path = library_path / INDEX_DIR / QUERY_CACHE_FILE
+    data = {"version": INDEX_VERSION, "catalog": cache.catalog_sha256, "entries": cache.entries}
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(index_path, json.dumps(data))
+    except OSError:
+        return
+    cache.changed = False
+
+
+def _read_fulltext_index(index_path: Path) -> FulltextIndex:
+    """Read a persisted full-text index, or return an empty one."""
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return FulltextIndex()
+        return FulltextIndex(
+            documents={doc_id: FulltextDocument(**doc) for doc_id, doc in data["documents"].items()},
+            postings=data["postings"],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return FulltextIndex()
+
+
+def _save_fulltext_index(index: FulltextIndex, index_path: Path) -> None:
+    """Persist a full-text index atomically, ignoring write failures."""
+    data = {
+        "version": INDEX_VERSION,
+        "documents": {
+            doc_id: {"path": doc.path, "mtime_ns": doc.mtime_ns, "size": doc.size, "length": doc.length}
+            for doc_id, doc in index.documents.items()
+        },
+        "postings": index.postings,
+    }
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(index_path, json.dumps(data))
+    except OSError:
+        pass
+
+
+def load_fulltext_index(library_path: Path, catalog_index: LibraryIndex) -> FulltextIndex:
+    """Load the full-text index, re-tokenizing only changed artifacts.
+
+    Every cataloged artifact is stat'ed; bodies are read only for artifacts
+    that are new or whose mtime or size changed since they were indexed.
+
+    Args:
+        library_path: Path to research library root.
+        catalog_index: Current catalog index (defines the document set).
+
+    Returns:
+        Up-to-date FulltextIndex.
+    """
+    index_path = library_path / INDEX_DIR / FULLTEXT_INDEX_FILE
+    index = _read_fulltext_index(index_path)
+    changed = False
+
+    wanted = {str(a["id"]): str(a["path"]) for a in catalog_index.artifacts}
+    for artifact_id in [doc_id for doc_id in index.documents if doc_id not in wanted]:
+        index.remove(artifact_id)
+        changed = True
+
+    for artifact_id, rel_path in wanted.items():
+        artifact_path = library_path / rel_path
+        try:
+            stat = artifact_path.stat()
+        except OSError:
+            if artifact_id in index.documents:
+                index.remove(artifact_id)
+                changed = True
+            continue
+
+        existing = index.documents.get(artifact_id)
+        if existing and (existing.path, existing.mtime_ns, existing.size) == (
+            rel_path,
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            continue
+
+        try:
+            body = artifact_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        index.remove(artifact_id)
+        index.add(
+            artifact_id,
+            FulltextDocument(path=rel_path, mtime_ns=stat.st_mtime_ns, size=stat.st_size, length=0),
+            extract_keywords(body),
+        )
+        changed = True
+
+    if changed:
+        _save_fulltext_index(index, index_path)
+    return index
@@ -0,0 +1,157 @@
+"""Compiled opinion bundle cache.
+
+Resolving opinions discovers files, parses YAML frontmatter and merges
+extension contributions. Opinions rarely change, so each resolved bundle
+is cached under ``.praxis/cache/opinions/`` in the project, one JSON file
+per (domain, stage, subtype, opinions root, extension set) key.
+
+A bundle records every file that could contribute to it (present or
+not), with its mtime, size and content hash. It is reused only while
+all of them are unchanged: a matching mtime and size is trusted as is,
+otherwise the file is re-hashed, so a touched but unchanged file does
+not invalidate the bundle while an edited, added or removed one does.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from praxis.domain.opinions import ResolvedOpinions
+from praxis.domain.workspace import ExtensionManifest
+
+OPINIONS_CACHE_DIR = Path(".praxis") / "cache" / "opinions"
+OPINIONS_CACHE_VERSION = 1
+
+
+def get_opinions_cache_dir(project_root: Path) -> Path:
+    """Return the opinion bundle cache directory for a project."""
+    return project_root / OPINIONS_CACHE_DIR
+
+
+def bundle_cache_key(
+    domain: str,
+    stage: str | None,
+    subtype: str | None,
+    opinions_root: Path,
+    extension_manifests: list[tuple[Path, ExtensionManifest]],
+) -> str:
+    """Build the cache key for a resolved bundle.
+
+    The extension set is part of the key (name, location and declared
+    opinion contributions), so installing, removing or re-declaring an
+    extension selects a different bundle.
+    """
+    extensions = sorted(
+        (
+            manifest.name,
+            str(ext_path),
+            sorted((c.source, c.target) for c in manifest.contributions.opinions),
+        )
+        for ext_path, manifest in extension_manifests
+    )
+    payload = json.dumps(
+        [OPINIONS_CACHE_VERSION, domain, stage, subtype, str(opinions_root), extensions],
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    label = "-".join(part or "_" for part in (domain, stage, subtype))
+    return f"{label}-{digest}"
+
+
+def _hash_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def fingerprint_sources(paths: list[Path]) -> list[dict[str, Any]]:
+    """Record the state of every candidate source file of a bundle."""
+    sources: list[dict[str, Any]] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            sources.append(
+                {
+                    "path": str(path),
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "sha256": _hash_file(path),
+                }
+            )
+        except OSError:
+            sources.append({"path": str(path), "sha256": None})
+    return sources
+
+
+def _source_unchanged(source: dict[str, Any]) -> bool:
+    path = Path(source["path"])
+    try:
+        stat = path.stat()
+    except OSError:
+        return source["sha256"] is None
+    if source["sha256"] is None:
+        return False
+    if stat.st_mtime_ns == source["mtime_ns"] and stat.st_size == source["size"]:
+        return True
+    try:
+        return bool(_hash_file(path) == source["sha256"])
+    except OSError:
+        return False
+
+
+def load_cached_bundle(cache_dir: Path, key: str) -> ResolvedOpinions | None:
+    """Load a cached bundle if every source file is unchanged.
+
+    Returns:
+        The cached ResolvedOpinions, or None if missing, corrupt or stale.
+    """
+    try:
+        data = json.loads((cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+        if data.get("version") != OPINIONS_CACHE_VERSION:
+            return None
+        if not all(_source_unchanged(source) for source in data["sources"]):
+            return None
+        return ResolvedOpinions.model_validate(data["resolved"])
+    except (OSError, ValueError, KeyError, TypeError, ValidationError):
+        return None
+
+
+def save_cached_bundle(cache_dir: Path, key: str, resolved: ResolvedOpinions, sources: list[dict[str, Any]]) -> None:
+    """Write a bundle to the cache atomically.
+
+    The cache directory gets a ``.gitignore`` so cached bundles are never
+    committed with the project. Failures to write are ignored; the cache
+    is an optimization only.
+
+    Args:
+        cache_dir: Bundle cache directory.
+        key: Key from :func:`bundle_cache_key`.
+        resolved: The resolved bundle.
+        sources: Source fingerprints from :func:`fingerprint_sources`,
+            taken before resolving so a concurrent edit invalidates the
+            bundle rather than being masked by it.
+    """
+    data = {
+        "version": OPINIONS_CACHE_VERSION,
+        "sources": sources,
+        "resolved": resolved.model_dump(mode="json"),
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        gitignore = cache_dir.parent / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("*\n", encoding="utf-8")
+        fd, temp_name = tempfile.mkstemp(dir=cache_dir, prefix=f".{key}.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+        os.replace(temp_name, cache_dir / f"{key}.json")
+    except OSError:
+        Path(temp_name).unlink(missing_ok=True)
@@ -0,0 +1,174 @@
+"""Persistent full-text index over opinion bodies.
+
+``praxis opinions search`` looks terms up in an inverted index instead of
+reading every opinion file. The index covers the file that resolution
+would use for each target path (see
+:func:`~praxis.infrastructure.opinions_loader.opinion_sources`), records
+its provenance, and is stored under ``.praxis/cache/`` in the project.
+
+The index is maintained per file: each file's mtime and size are
+compared on load, and only new or changed files are re-tokenized.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from praxis.infrastructure.opinions_loader import read_opinion
+from praxis.infrastructure.text_index import FulltextDocument, FulltextIndex, extract_keywords
+
+OPINIONS_INDEX_FILE = Path(".praxis") / "cache" / "opinions-index.json"
+OPINIONS_INDEX_VERSION = 1
+
+
+@dataclass
+class OpinionsIndex:
+    """BM25 term statistics over the bodies of the merged opinion files.
+
+    Attributes:
+        fulltext: Term statistics keyed by target path (relative to opinions/).
+        sources: Target path -> provenance ('core' or extension name).
+    """
+
+    fulltext: FulltextIndex = field(default_factory=FulltextIndex)
+    sources: dict[str, str] = field(default_factory=dict)
+
+    def search(self, terms: list[str]) -> list[tuple[str, float]]:
+        """Rank the files whose body contains every term.
+
+        Args:
+            terms: Tokenized query terms.
+
+        Returns:
+            (target path, BM25 score) pairs, best first, then by path.
+        """
+        if not terms:
+            return []
+        matching = set.intersection(*(set(self.fulltext.postings.get(term, {})) for term in set(terms)))
+        scores = self.fulltext.score(terms)
+        ranked = [(path, scores.get(path, 0.0)) for path in matching]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
+
+    def remove(self, path: str) -> None:
+        """Drop a file from the index."""
+        self.fulltext.remove(path)
+        self.sources.pop(path, None)
+
+
+def get_opinions_index_path(project_root: Path) -> Path:
+    """Return the opinions search index path for a project."""
+    return project_root / OPINIONS_INDEX_FILE
+
+
+def _read_index(index_path: Path) -> OpinionsIndex:
+    """Read a persisted index, or return an empty one."""
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("version") != OPINIONS_INDEX_VERSION:
+            return OpinionsIndex()
+        documents = data["documents"]
+        return OpinionsIndex(
+            fulltext=FulltextIndex(
+                documents={
+                    path: FulltextDocument(doc["path"], doc["mtime_ns"], doc["size"], doc["length"])
+                    for path, doc in documents.items()
+                },
+                postings=data["postings"],
+            ),
+            sources={path: str(doc["source"]) for path, doc in documents.items()},
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return OpinionsIndex()
+
+
+def _save_index(index: OpinionsIndex, index_path: Path) -> None:
+    """Persist an index atomically, ignoring write failures."""
+    data = {
+        "version": OPINIONS_INDEX_VERSION,
+        "documents": {
+            path: {
+                "path": doc.path,
+                "mtime_ns": doc.mtime_ns,
+                "size": doc.size,
+                "length": doc.length,
+                "source": index.sources[path],
+            }
+            for path, doc in index.fulltext.documents.items()
+        },
+        "postings": index.fulltext.postings,
+    }
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        gitignore = index_path.parent / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("*\n", encoding="utf-8")
+        fd, temp_name = tempfile.mkstemp(dir=index_path.parent, prefix=f".{index_path.name}.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+        os.replace(temp_name, index_path)
+    except OSError:
+        Path(temp_name).unlink(missing_ok=True)
+
+
+def load_opinions_index(index_path: Path, sources: dict[str, tuple[str, Path]]) -> OpinionsIndex:
+    """Load the opinions index, re-tokenizing only changed files.
+
+    Every source file is stat'ed; bodies are read only for files that are
+    new, changed (mtime or size), or now supplied by a different source.
+
+    Args:
+        index_path: Persisted index file.
+        sources: Target path -> (provenance, file path), as returned by
+            :func:`~praxis.infrastructure.opinions_loader.opinion_sources`.
+
+    Returns:
+        Up-to-date OpinionsIndex.
+    """
+    index = _read_index(index_path)
+    changed = False
+
+    for path in [p for p in index.fulltext.documents if p not in sources]:
+        index.remove(path)
+        changed = True
+
+    for path, (source, file_path) in sources.items():
+        try:
+            stat = file_path.stat()
+        except OSError:
+            if path in index.fulltext.documents:
+                index.remove(path)
+                changed = True
+            continue
+
+        existing = index.fulltext.documents.get(path)
+        if (
+            existing
+            and index.sources.get(path) == source
+            and (existing.path, existing.mtime_ns, existing.size) == (str(file_path), stat.st_mtime_ns, stat.st_size)
+        ):
+            continue
+
+        try:
+            _, content, _ = read_opinion(file_path)
+        except (OSError, UnicodeDecodeError):
+            continue
+        index.remove(path)
+        index.fulltext.add(
+            path,
+            FulltextDocument(path=str(file_path), mtime_ns=stat.st_mtime_ns, size=stat.st_size, length=0),
+            extract_keywords(content or ""),
+        )
+        index.sources[path] = source
+        changed = True
+
+    if changed:
+        _save_index(index, index_path)
+    return index
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Collection
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TextIO
 
 import yaml
 
@@ -15,6 +19,52 @@ from praxis.domain.opinions import (
 )
 from praxis.domain.workspace import ExtensionManifest, OpinionContribution
 
+# libyaml's loader is several times faster; fall back to pure Python
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_DELIMITER = re.compile(r"---\s*\n")
+
+# read_opinion results keyed by (path, with_content), shared across calls
+# that should read each file at most once (e.g. a batch of resolutions)
+OpinionReads = dict[
+    tuple[Path, bool], tuple[OpinionFrontmatter | None, str | None, str | None]
+]
+
+
+def _parse_frontmatter_yaml(
+    yaml_str: str,
+) -> tuple[OpinionFrontmatter | None, str | None, bool]:
+    """Parse and validate a frontmatter block.
+
+    Returns:
+        Tuple of (frontmatter, error, whole_content). whole_content is True
+        when the error means the block is not frontmatter at all, so the
+        caller should treat the whole file as the body.
+    """
+    try:
+        data = yaml.load(yaml_str, Loader=_SafeLoader)
+        if not isinstance(data, dict):
+            return None, "Frontmatter is not a valid YAML dictionary", True
+
+        # Validate required fields (domain is optional for _shared files)
+        if "version" not in data:
+            return None, "Missing required field: version", False
+        if "status" not in data:
+            return None, "Missing required field: status", False
+
+        # Parse status enum
+        try:
+            data["status"] = OpinionStatus(data["status"])
+        except ValueError:
+            return None, f"Invalid status: {data['status']}", False
+
+        return OpinionFrontmatter(**data), None, False
+
+    except yaml.YAMLError as e:
+        return None, f"Invalid YAML: {e}", True
+    except Exception as e:
+        return None, f"Failed to parse frontmatter: {e}", True
+
 
 def parse_frontmatter(
     content: str,
@@ -33,37 +83,78 @@ def parse_frontmatter(
         # No frontmatter found - return content as body
         return None, content, None
 
-    yaml_str = match.group(1)
-    body = match.group(2)
+    frontmatter, error, whole_content = _parse_frontmatter_yaml(match.group(1))
+    return frontmatter, content if whole_content else match.group(2), error
 
-    try:
-        data = yaml.safe_load(yaml_str)
-        if not isinstance(data, dict):
-            return None, content, "Frontmatter is not a valid YAML dictionary"
 
-        # Validate required fields (domain is optional for _shared files)
-        if "version" not in data:
-            return None, body, "Missing required field: version"
-        if "status" not in data:
-            return None, body, "Missing required field: status"
+def _read_header(handle: TextIO) -> tuple[str | None, str]:
+    """Read the frontmatter block at the start of an open file.
 
-        # Parse status enum
-        try:
-            data["status"] = OpinionStatus(data["status"])
-        except ValueError:
-            return None, body, f"Invalid status: {data['status']}"
+    Reading stops at the closing ``---``, so the body is never read.
+    Delimiters follow :func:`parse_frontmatter`.
 
-        frontmatter = OpinionFrontmatter(**data)
-        return frontmatter, body, None
+    Returns:
+        Tuple of (yaml_str, header). yaml_str is None if the file has no
+        frontmatter; header is the raw text consumed from the file.
+    """
+    consumed = [handle.readline()]
+    if not _DELIMITER.fullmatch(consumed[0]):
+        return None, consumed[0]
 
-    except yaml.YAMLError as e:
-        return None, content, f"Invalid YAML: {e}"
-    except Exception as e:
-        return None, content, f"Failed to parse frontmatter: {e}"
+    yaml_lines: list[str] = []
+    for line in handle:
+        consumed.append(line)
+        if yaml_lines and _DELIMITER.fullmatch(line):
+            return "".join(yaml_lines), "".join(consumed)
+        yaml_lines.append(line)
+    return None, "".join(consumed)
+
+
+def read_opinion(
+    path: Path, with_content: bool = True, reads: OpinionReads | None = None
+) -> tuple[OpinionFrontmatter | None, str | None, str | None]:
+    """Read an opinion file's frontmatter and, optionally, its body.
+
+    Only the frontmatter block is read when with_content is False, so
+    listing or validating metadata costs a small read per file.
+
+    Args:
+        path: Path to the opinion file
+        with_content: Also read the markdown body
+        reads: Memo of earlier reads; the file is read only if missing
+
+    Returns:
+        Tuple of (frontmatter, content, error). content is the stripped
+        body, or None if the body is empty or was not requested.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    if reads is not None and (path, with_content) in reads:
+        return reads[path, with_content]
+
+    with path.open(encoding="utf-8") as handle:
+        yaml_str, header = _read_header(handle)
+        if yaml_str is None:
+            frontmatter, error, whole_content = None, None, True
+        else:
+            frontmatter, error, whole_content = _parse_frontmatter_yaml(yaml_str)
+        body = handle.read() if with_content else ""
+
+    if whole_content and with_content:
+        body = header + body
+    result = (frontmatter, body.strip() if body else None, error)
+    if reads is not None:
+        reads[path, with_content] = result
+    return result
 
 
 def load_opinion_file(
-    opinions_root: Path, relative_path: str, source: str = "core"
+    opinions_root: Path,
+    relative_path: str,
+    source: str = "core",
+    with_content: bool = True,
+    reads: OpinionReads | None = None,
 ) -> OpinionFile:
     """Load a single opinion file.
 
@@ -71,6 +162,8 @@ def load_opinion_file(
         opinions_root: Path to the opinions/ directory
         relative_path: Path relative to opinions/ (e.g., "code/principles.md")
         source: Provenance source ('core' or extension name)
+        with_content: Load the markdown body (frontmatter only if False)
+        reads: Optional memo shared with other loads (see read_opinion)
 
     Returns:
         OpinionFile with parsed content or error information
@@ -81,14 +174,13 @@ def load_opinion_file(
         return OpinionFile(path=relative_path, exists=False, source=source)
 
     try:
-        content = full_path.read_text(encoding="utf-8")
-        frontmatter, body, error = parse_frontmatter(content)
+        frontmatter, content, error = read_opinion(full_path, with_content, reads)
 
         return OpinionFile(
             path=relative_path,
             exists=True,
             frontmatter=frontmatter,
-            content=body.strip() if body else None,
+            content=content,
             parse_error=error,
             source=source,
         )
@@ -103,6 +195,88 @@ def load_opinion_file(
         )
 
 
+@dataclass(frozen=True)
+class OpinionsInventory:
+    """Opinion files discovered under an opinions/ directory.
+
+    Attributes:
+        root: The opinions/ directory
+        paths: Relative POSIX paths of the opinion files, sorted
+        directories: (directory, mtime_ns) for every directory walked
+    """
+
+    root: Path
+    paths: tuple[str, ...] = ()
+    directories: tuple[tuple[str, int], ...] = ()
+
+    def is_current(self) -> bool:
+        """Whether no walked directory has had entries added or removed."""
+        try:
+            return all(os.stat(d).st_mtime_ns == mtime for d, mtime in self.directories)
+        except OSError:
+            return False
+
+
+_inventories: dict[Path, OpinionsInventory] = {}
+
+
+def _scan_opinions(opinions_root: Path) -> OpinionsInventory:
+    """Walk opinions/ once with os.scandir, pruning skipped directories."""
+    paths: list[str] = []
+    directories: list[tuple[str, int]] = []
+    stack = [(str(opinions_root), "")]
+
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        directories.append((directory, mtime))
+
+        for entry in entries:
+            name = entry.name
+            # Skip templates, and other underscore entries at the top level
+            # (except _shared)
+            if name == "_templates" or (
+                not prefix and name.startswith("_") and name != "_shared"
+            ):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((entry.path, f"{prefix}{name}/"))
+            elif name.endswith(".md"):
+                paths.append(f"{prefix}{name}")
+
+    return OpinionsInventory(
+        root=opinions_root,
+        paths=tuple(sorted(paths)),
+        directories=tuple(directories),
+    )
+
+
+def discover_opinions(opinions_root: Path) -> OpinionsInventory:
+    """Discover the opinion files under opinions/.
+
+    The inventory is kept for the life of the process and reused while
+    none of the walked directories has changed, so the tree view, merging
+    and combination listing share a single directory walk.
+
+    Args:
+        opinions_root: Path to the opinions/ directory
+
+    Returns:
+        OpinionsInventory (empty if the directory does not exist)
+    """
+    cached = _inventories.get(opinions_root)
+    if cached is not None and cached.is_current():
+        return cached
+    inventory = _scan_opinions(opinions_root)
+    _inventories[opinions_root] = inventory
+    return inventory
+
+
 def build_opinions_tree(opinions_root: Path) -> OpinionsTree:
     """Build a tree of all available opinion files.
 
@@ -117,42 +291,21 @@ def build_opinions_tree(opinions_root: Path) -> OpinionsTree:
 
     domains: dict[str, list[str]] = {}
     shared: list[str] = []
-    total = 0
-
-    for path in opinions_root.rglob("*.md"):
-        relative = path.relative_to(opinions_root)
-        parts = relative.parts
-
-        # Skip templates
-        if "_templates" in parts:
-            continue
-
-        # Skip other underscore directories (except _shared)
-        if parts[0].startswith("_") and parts[0] != "_shared":
-            continue
-
-        # Use as_posix() for cross-platform path consistency
-        relative_str = relative.as_posix()
-        total += 1
+    inventory = discover_opinions(opinions_root)
 
-        if parts[0] == "_shared":
+    # Inventory paths are sorted, so groups come out sorted too
+    for relative_str in inventory.paths:
+        top = relative_str.split("/", 1)[0]
+        if top == "_shared":
             shared.append(relative_str)
         else:
-            domain = parts[0]
-            if domain not in domains:
-                domains[domain] = []
-            domains[domain].append(relative_str)
-
-    # Sort for deterministic output
-    shared.sort()
-    for domain in domains:
-        domains[domain].sort()
+            domains.setdefault(top, []).append(relative_str)
 
     return OpinionsTree(
         root=str(opinions_root),
         domains=dict(sorted(domains.items())),
         shared=shared,
-        total_files=total,
+        total_files=len(inventory.paths),
     )
 
 
@@ -186,6 +339,8 @@ def load_extension_opinions(
     extension_path: Path,
     extension_name: str,
     contributions: list[OpinionContribution],
+    with_content: bool = True,
+    reads: OpinionReads | None = None,
 ) -> list[OpinionFile]:
     """Load opinion files contributed by an extension.
 
@@ -193,6 +348,8 @@ def load_extension_opinions(
         extension_path: Path to the extension directory
         extension_name: Name of the extension (for provenance)
         contributions: List of opinion contributions from manifest
+        with_content: Load markdown bodies (frontmatter only if False)
+        reads: Optional memo shared with other loads (see read_opinion)
 
     Returns:
         List of OpinionFile objects with extension provenance
@@ -215,15 +372,16 @@ def load_extension_opinions(
 
         # Load the file
         try:
-            content = source_path.read_text(encoding="utf-8")
-            frontmatter, body, error = parse_frontmatter(content)
+            frontmatter, content, error = read_opinion(
+                source_path, with_content, reads
+            )
 
             opinions.append(
                 OpinionFile(
                     path=contrib.target,
                     exists=True,
                     frontmatter=frontmatter,
-                    content=body.strip() if body else None,
+                    content=content,
                     parse_error=error,
                     source=extension_name,
                 )
@@ -241,9 +399,73 @@ def load_extension_opinions(
     return opinions
 
 
+def opinion_source_paths(
+    core_opinions_root: Path,
+    extension_manifests: list[tuple[Path, ExtensionManifest]],
+    paths: Collection[str],
+) -> list[Path]:
+    """List every file that could supply the given target paths.
+
+    This is the core file for each path plus the source of every extension
+    contribution targeting it, whether or not the file exists. It is the
+    set of files :func:`merge_opinions_with_extensions` reads for
+    ``paths``, so a change to any of them can change the merge result.
+
+    Args:
+        core_opinions_root: Path to core opinions/ directory
+        extension_manifests: List of (extension_path, manifest) tuples
+        paths: Target paths relative to opinions/
+
+    Returns:
+        Candidate source file paths
+    """
+    sources = [core_opinions_root / path for path in sorted(paths)]
+    for ext_path, manifest in sorted(extension_manifests, key=lambda x: x[1].name):
+        for contrib in manifest.contributions.opinions:
+            if contrib.target in paths:
+                sources.append(ext_path / contrib.source)
+    return sources
+
+
+def opinion_sources(
+    core_opinions_root: Path,
+    extension_manifests: list[tuple[Path, ExtensionManifest]],
+) -> dict[str, tuple[str, Path]]:
+    """Map every merged target path to the file that supplies it.
+
+    Applies the precedence of :func:`merge_opinions_with_extensions` for
+    the whole tree (core wins, then the alphabetically last extension,
+    then an extension's first contribution for a target) without reading
+    any file.
+
+    Args:
+        core_opinions_root: Path to core opinions/ directory
+        extension_manifests: List of (extension_path, manifest) tuples
+
+    Returns:
+        Dict of target_path -> (source, file path), where source is
+        'core' or the extension name
+    """
+    sources: dict[str, tuple[str, Path]] = {}
+    if core_opinions_root.exists():
+        for relative_str in discover_opinions(core_opinions_root).paths:
+            sources[relative_str] = ("core", core_opinions_root / relative_str)
+
+    sorted_extensions = sorted(extension_manifests, key=lambda x: x[1].name)
+    for ext_path, manifest in reversed(sorted_extensions):
+        for contrib in manifest.contributions.opinions:
+            sources.setdefault(
+                contrib.target, (manifest.name, ext_path / contrib.source)
+            )
+    return sources
+
+
 def merge_opinions_with_extensions(
     core_opinions_root: Path,
     extension_manifests: list[tuple[Path, ExtensionManifest]],
+    paths: Collection[str] | None = None,
+    with_content: bool = True,
+    reads: OpinionReads | None = None,
 ) -> tuple[dict[str, OpinionFile], list[str]]:
     """Merge core opinions with extension contributions.
 
@@ -252,6 +474,15 @@ def merge_opinions_with_extensions(
     Args:
         core_opinions_root: Path to core opinions/ directory
         extension_manifests: List of (extension_path, manifest) tuples
+        paths: Only merge these target paths (e.g. a resolution chain).
+            Core files are loaded directly and only contributions that
+            target these paths are read, so the cost tracks the number of
+            paths rather than the size of the opinions tree. If None, the
+            whole tree is merged.
+        with_content: Load markdown bodies. Callers that only need
+            metadata (tree listings) pass False and read frontmatter only.
+        reads: Optional memo shared across merges, so a batch of merges
+            reads each file at most once (see read_opinion)
 
     Returns:
         Tuple of (merged_opinions_dict, warnings)
@@ -260,23 +491,20 @@ def merge_opinions_with_extensions(
     merged: dict[str, OpinionFile] = {}
     warnings: list[str] = []
 
-    # First, load core opinions (if they exist)
-    if core_opinions_root.exists():
-        for path in core_opinions_root.rglob("*.md"):
-            relative = path.relative_to(core_opinions_root)
-            parts = relative.parts
-
-            # Skip templates
-            if "_templates" in parts:
-                continue
-
-            # Skip underscore directories except _shared
-            if parts[0].startswith("_") and parts[0] != "_shared":
-                continue
-
-            relative_str = relative.as_posix()
-            opinion = load_opinion_file(core_opinions_root, relative_str, source="core")
-            merged[relative_str] = opinion
+    if paths is not None:
+        # Load only the requested core files
+        for relative_str in paths:
+            opinion = load_opinion_file(
+                core_opinions_root, relative_str, "core", with_content, reads
+            )
+            if opinion.exists:
+                merged[relative_str] = opinion
+    elif core_opinions_root.exists():
+        # First, load core opinions (if they exist)
+        for relative_str in discover_opinions(core_opinions_root).paths:
+            merged[relative_str] = load_opinion_file(
+                core_opinions_root, relative_str, "core", with_content, reads
+            )
 
     # Sort extensions alphabetically for deterministic resolution
     sorted_extensions = sorted(extension_manifests, key=lambda x: x[1].name)
@@ -284,8 +512,11 @@ def merge_opinions_with_extensions(
     # Process extensions in reverse alphabetical order
     # (so later alphabetical names win in conflicts)
     for ext_path, manifest in reversed(sorted_extensions):
+        contributions = manifest.contributions.opinions
+        if paths is not None:
+            contributions = [c for c in contributions if c.target in paths]
         ext_opinions = load_extension_opinions(
-            ext_path, manifest.name, manifest.contributions.opinions
+            ext_path, manifest.name, contributions, with_content, reads
         )
 
         for opinion in ext_opinions:
@@ -335,7 +566,7 @@ def build_opinions_tree_with_extensions(
         OpinionsTree with merged opinions and provenance info
     """
     merged, warnings = merge_opinions_with_extensions(
-        core_opinions_root, extension_manifests
+        core_opinions_root, extension_manifests, with_content=False
     )
 
     domains: dict[str, list[str]] = {}
@@ -0,0 +1,110 @@
+"""Per-invocation snapshot of a project directory.
+
+A command such as ``praxis status`` asks the same questions of a project
+several times: status, validation and next steps all need the parsed
+praxis.yaml, and each checks whether artifacts such as ``docs/sod.md``
+exist. A ProjectSnapshot loads praxis.yaml once and lists the project
+root and ``docs/`` once, and services that are handed a snapshot answer
+from it instead of going back to the disk.
+
+A snapshot lives for one invocation and does not see changes made after
+it was taken.
+"""
+
+from __future__ import annotations
+
+import os
+import posixpath
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from praxis.domain.models import PraxisConfig, ValidationResult
+from praxis.infrastructure.yaml_loader import load_praxis_config
+
+# Directories listed besides the project root; artifacts and stage
+# documents live here
+SNAPSHOT_DIRS = ("docs",)
+
+
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """Project state captured once per command invocation.
+
+    Attributes:
+        root: The project directory
+        config_result: Result of loading and validating praxis.yaml
+        entries: Relative POSIX paths of the files and directories found
+            in the listed directories
+        listed: Directories that were listed ("" for the root); existence
+            of paths inside them is answered from ``entries``
+    """
+
+    root: Path
+    config_result: ValidationResult
+    entries: frozenset[str] = frozenset()
+    listed: frozenset[str] = frozenset()
+
+    @property
+    def config(self) -> PraxisConfig | None:
+        """The parsed configuration, or None if praxis.yaml is invalid."""
+        return self.config_result.config if self.config_result.valid else None
+
+    def exists(self, relative_path: Path | str) -> bool:
+        """Whether a path relative to the project root exists.
+
+        Paths in a listed directory are looked up in the listing; any
+        other path falls back to the filesystem.
+        """
+        relative = PurePosixPath(relative_path).as_posix()
+        if posixpath.dirname(relative) in self.listed:
+            return relative in self.entries
+        return (self.root / relative).exists()
+
+
+def path_exists(project_root: Path, relative_path: Path | str, snapshot: ProjectSnapshot | None = None) -> bool:
+    """Whether a project path exists, answered from the snapshot if one is given."""
+    if snapshot is not None:
+        return snapshot.exists(relative_path)
+    return (project_root / relative_path).exists()
+
+
+def _list_directory(root: Path, relative: str) -> list[str] | None:
+    """List a directory's existing entries as project-relative paths.
+
+    Returns an empty list if the directory does not exist, or None if it
+    could not be listed.
+    """
+    prefix = f"{relative}/" if relative else ""
+    try:
+        with os.scandir(root / relative) as it:
+            return [f"{prefix}{entry.name}" for entry in it if entry.is_file() or entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    except OSError:
+        return None
+
+
+def take_project_snapshot(path: Path) -> ProjectSnapshot:
+    """Load praxis.yaml and list the project directories once.
+
+    Args:
+        path: Path to praxis.yaml file or project directory.
+
+    Returns:
+        ProjectSnapshot of the project containing ``path``.
+    """
+    root = path if path.is_dir() else path.parent
+    entries: list[str] = []
+    listed: list[str] = []
+    for relative in ("", *SNAPSHOT_DIRS):
+        listing = _list_directory(root, relative)
+        if listing is not None:
+            entries.extend(listing)
+            listed.append(relative)
+
+    return ProjectSnapshot(
+        root=root,
+        config_result=load_praxis_config(path),
+        entries=frozenset(entries),
+        listed=frozenset(listed),
+    )
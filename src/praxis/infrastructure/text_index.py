@@ -0,0 +1,214 @@
+"""Tokenizer and BM25 term statistics shared by the text indexes.
+
+The research library's full-text index and the opinions search index
+both tokenize with :func:`extract_keywords` and keep their term
+statistics in a :class:`FulltextIndex`. Each owns its own persistence and
+document bookkeeping; this module has no I/O.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+
+# Stop words for basic keyword extraction
+STOP_WORDS = {
+    "what",
+    "is",
+    "are",
+    "the",
+    "a",
+    "an",
+    "how",
+    "why",
+    "where",
+    "when",
+    "do",
+    "does",
+    "can",
+    "could",
+    "would",
+    "should",
+    "about",
+    "for",
+    "in",
+    "on",
+    "to",
+    "of",
+    "and",
+    "or",
+    "with",
+}
+
+
+def extract_keywords(question: str) -> list[str]:
+    """Extract searchable keywords from a question.
+
+    Removes stop words and short words (< 3 characters).
+
+    Args:
+        question: Natural language question.
+
+    Returns:
+        List of keywords extracted from the question.
+    """
+    # Remove punctuation and split into words
+    words = re.sub(r"[^\w\s]", " ", question.lower()).split()
+    return [w for w in words if w not in STOP_WORDS and len(w) > 2]
+
+
+# Standard Okapi BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+@dataclass
+class FulltextDocument:
+    """Term statistics bookkeeping for one indexed document."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    length: int
+
+
+@dataclass
+class FulltextIndex:
+    """BM25 term statistics over document bodies.
+
+    Attributes:
+        documents: Document ID -> document bookkeeping.
+        postings: Term -> {document ID: term frequency}.
+    """
+
+    documents: dict[str, FulltextDocument] = field(default_factory=dict)
+    postings: dict[str, dict[str, int]] = field(default_factory=dict)
+    _norms: dict[str, float] | None = field(default=None, init=False, repr=False, compare=False)
+    _terms: dict[str, set[str]] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def average_length(self) -> float:
+        """Average document length in tokens."""
+        if not self.documents:
+            return 0.0
+        return sum(doc.length for doc in self.documents.values()) / len(self.documents)
+
+    def score(self, query_terms: list[str]) -> dict[str, float]:
+        """Score documents containing any query term with BM25.
+
+        Args:
+            query_terms: Tokenized query terms.
+
+        Returns:
+            Artifact ID -> BM25 score, for documents with a positive score.
+        """
+        total = len(self.documents)
+        avg_length = self.average_length or 1.0
+        scores: dict[str, float] = {}
+        for term in set(query_terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log((total - len(postings) + 0.5) / (len(postings) + 0.5) + 1.0)
+            for artifact_id, tf in postings.items():
+                length = self.documents[artifact_id].length
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                scores[artifact_id] = scores.get(artifact_id, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+        return scores
+
+    def _idf(self, term: str) -> float:
+        """Smoothed inverse document frequency (terms unseen in the corpus included)."""
+        total = len(self.documents)
+        return math.log((1 + total) / (1 + len(self.postings.get(term, ())))) + 1.0
+
+    def _document_norms(self) -> dict[str, float]:
+        """Euclidean norm of every document's TF-IDF vector, computed once per index state."""
+        if self._norms is None:
+            squares = dict.fromkeys(self.documents, 0.0)
+            for term, postings in self.postings.items():
+                idf = self._idf(term)
+                for artifact_id, tf in postings.items():
+                    squares[artifact_id] += ((1.0 + math.log(tf)) * idf) ** 2
+            self._norms = {artifact_id: math.sqrt(square) for artifact_id, square in squares.items()}
+        return self._norms
+
+    def similar(self, tokens: list[str], top_k: int = 5, exclude: set[str] | None = None) -> list[tuple[str, float]]:
+        """Rank documents by TF-IDF cosine similarity to a tokenized text.
+
+        Term weights are sublinear term frequency times smoothed IDF. Only
+        the postings of the text's own terms are visited; document norms
+        come from one pass over the stored postings, so nothing is
+        re-tokenized.
+
+        Args:
+            tokens: Tokenized text to compare.
+            top_k: Maximum number of documents to return.
+            exclude: Artifact IDs to leave out (e.g. the text's own document).
+
+        Returns:
+            (artifact ID, cosine similarity in 0.0-1.0) pairs, most similar first.
+        """
+        counts: dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        if not counts or not self.documents:
+            return []
+
+        weights = {term: (1.0 + math.log(tf)) * self._idf(term) for term, tf in counts.items()}
+        query_norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        dots: dict[str, float] = {}
+        for term, weight in weights.items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf(term)
+            for artifact_id, tf in postings.items():
+                dots[artifact_id] = dots.get(artifact_id, 0.0) + weight * (1.0 + math.log(tf)) * idf
+
+        norms = self._document_norms()
+        scores = [
+            (artifact_id, min(1.0, dot / (query_norm * norms[artifact_id])))
+            for artifact_id, dot in dots.items()
+            if norms.get(artifact_id) and (exclude is None or artifact_id not in exclude)
+        ]
+        scores.sort(key=lambda item: (-item[1], item[0]))
+        return scores[:top_k]
+
+    def _document_terms(self) -> dict[str, set[str]]:
+        """Terms of every document, inverted from the postings once and then kept current."""
+        if self._terms is None:
+            self._terms = {artifact_id: set() for artifact_id in self.documents}
+            for term, postings in self.postings.items():
+                for artifact_id in postings:
+                    self._terms.setdefault(artifact_id, set()).add(term)
+        return self._terms
+
+    def remove(self, artifact_id: str) -> None:
+        """Drop a document and its postings.
+
+        Only the postings of the document's own terms are touched, so an
+        incremental update costs the size of the changed documents rather
+        than the vocabulary.
+        """
+        if self.documents.pop(artifact_id, None) is None:
+            return
+        self._norms = None
+        for term in self._document_terms().pop(artifact_id, set()):
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(artifact_id, None)
+            if not postings:
+                del self.postings[term]
+
+    def add(self, artifact_id: str, document: FulltextDocument, tokens: list[str]) -> None:
+        """Add a tokenized document."""
+        self._norms = None
+        document.length = len(tokens)
+        self.documents[artifact_id] = document
+        for token in tokens:
+            postings = self.postings.setdefault(token, {})
+            postings[artifact_id] = postings.get(artifact_id, 0) + 1
+        if self._terms is not None:
+            self._terms.setdefault(artifact_id, set()).update(tokens)
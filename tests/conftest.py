@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import shutil
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -15,6 +17,23 @@ def cli_runner() -> CliRunner:
     return CliRunner()
 
 
+# The research library tracked in the repository
+RESEARCH_LIBRARY = Path(__file__).parent.parent / "research-library"
+
+
+@pytest.fixture(scope="session")
+def research_library_copy(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Copy the tracked research library once per session.
+
+    Searches and queries persist indexes and caches next to the catalog, so
+    tests read the copy to keep those writes out of the repository. Tests
+    that modify a library build their own under tmp_path.
+    """
+    library = tmp_path_factory.mktemp("library") / "research-library"
+    shutil.copytree(RESEARCH_LIBRARY, library, ignore=shutil.ignore_patterns(".index"))
+    return library
+
+
 @pytest.fixture
 def context() -> dict[str, Any]:
     """Provide a context dict for BDD step communication."""
@@ -18,6 +18,20 @@ Feature: Library CLI commands
     Then the exit code should be 0
     And the output should contain "match"
 
+  Scenario: Search artifact bodies with full-text ranking
+    Given the research library exists with cataloged artifacts
+    When I run praxis library search with keyword "hexagonal" and fulltext flag
+    Then the exit code should be 0
+    And the output should contain "full-text"
+    And the output should contain "match"
+
+  Scenario: Search with a misspelled keyword using fuzzy matching
+    Given the research library exists with cataloged artifacts
+    When I run praxis library search with keyword "distilation" and fuzzy flag
+    Then the exit code should be 0
+    And the output should contain "fuzzy (trigram similarity)"
+    And the output should contain "knowledge-distillation"
+
   Scenario: Get citation for an artifact
     Given the research library exists with cataloged artifacts
     When I run praxis library cite "roles-rationale-2025-12-28"
@@ -30,17 +44,89 @@ Feature: Library CLI commands
     When I run praxis library check-orphans
     Then the exit code should be 0
 
+  Scenario: Orphan check can gate a commit
+    Given a research library whose artifacts all have valid metadata
+    And the library contains an uncataloged artifact
+    When I run praxis library check-orphans with the strict flag
+    Then the exit code should be 1
+    And the output should contain "uncataloged.md"
+
   Scenario: Check for stale artifacts
     Given the research library exists with cataloged artifacts
     When I run praxis library check-stale with days 400
     Then the exit code should be 0
     And the output should contain "stale"
 
-  Scenario: Reindex the library
+  Scenario: Check stale artifacts in a date range for one topic
     Given the research library exists with cataloged artifacts
+    When I run praxis library check-stale after "2026-01-01" before "2026-01-03" in topic "roles"
+    Then the exit code should be 0
+    And the output should contain "dated before 2026-01-03, on or after 2026-01-01, topic: roles"
+    And the output should contain "roles-"
+
+  Scenario: Reindex the library
+    Given a research library whose artifacts all have valid metadata
+    When I run praxis library reindex
+    Then the exit code should be 0
+    And the output should contain "reindexed successfully"
+
+  Scenario: Reindex refuses to drop artifacts with invalid metadata
+    Given a research library whose artifacts all have valid metadata
+    And the library contains an artifact with invalid metadata
     When I run praxis library reindex
+    Then the exit code should be 1
+    And the output should contain "CATALOG.md was not modified"
+    And the catalog should be unchanged
+
+  Scenario: Find artifacts similar to a library file
+    Given a research library whose artifacts all have valid metadata
+    And the library contains an artifact that supersedes another
+    When I run praxis library reindex
+    And I run praxis library similar "patterns/ports-v2.md"
+    Then the exit code should be 0
+    And the output should contain "patterns-ports-2026-01-02 (similarity:"
+    And the output should not contain "patterns-ports-v2-2026-01-05 (similarity:"
+
+  Scenario: Validate every artifact as NDJSON
+    Given a research library whose artifacts all have valid metadata
+    When I run praxis library validate-all with json flag
+    Then the exit code should be 0
+    And every output line should be a JSON object
+    And the validation summary should report 1 valid artifact(s)
+
+  Scenario: Catalog a batch of artifacts with one catalog write
+    Given a research library whose artifacts all have valid metadata
+    And a batch directory with 2 new artifacts
+    When I run praxis library reindex
+    And I run praxis library catalog with the batch directory
     Then the exit code should be 0
-    And the output should contain "not yet implemented"
+    And the output should contain "Cataloged 2 artifact(s)"
+
+  Scenario: Repeated query is served from the query cache
+    Given a research library whose artifacts all have valid metadata
+    When I run praxis library reindex
+    And I run praxis library query "What are ports and adapters?" with json flag
+    And I run praxis library query "Adapters and ports?" with json flag
+    Then the exit code should be 0
+    And the JSON stats should report a cache hit
+
+  Scenario: Find related artifacts and the superseding version
+    Given a research library whose artifacts all have valid metadata
+    And the library contains an artifact that supersedes another
+    When I run praxis library reindex
+    And I run praxis library related "patterns-ports-2026-01-02" with depth 2
+    Then the exit code should be 0
+    And the output should contain "Superseded by: patterns-ports-v2-2026-01-05"
+    And the output should contain "patterns-ports-v2-2026-01-05 (superseded-by, distance 1)"
+
+  Scenario: Batch cataloging rolls back when any artifact is invalid
+    Given a research library whose artifacts all have valid metadata
+    And a batch directory with 2 new artifacts
+    And the batch directory contains an artifact without metadata
+    When I run praxis library catalog with the batch directory
+    Then the exit code should be 1
+    And the output should contain "No artifacts were cataloged"
+    And the catalog should be unchanged
 
   # Edge cases
 
@@ -69,3 +155,4 @@ Feature: Library CLI commands
     Then the exit code should be 0
     And the JSON output should contain "coverage_level"
     And the JSON output should contain "sources"
+    And the JSON output should contain "stats"
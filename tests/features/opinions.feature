@@ -79,3 +79,51 @@ Feature: Opinions Resolution
     When I run "praxis opinions"
     Then the stderr contains "No praxis.yaml found"
     And the exit code is 1
+
+  Scenario: Warm the opinion bundle cache
+    Given opinions/_shared/first-principles.md exists with valid frontmatter
+    And opinions/code/principles.md exists with valid frontmatter
+    When I run "praxis opinions --warm-cache"
+    Then the output contains "Cached"
+    And the output contains ".praxis/cache/opinions"
+    And the exit code is 0
+
+  Scenario: Export the opinions matrix as prompt files
+    Given opinions/_shared/first-principles.md exists with valid frontmatter
+    And opinions/code/principles.md exists with valid frontmatter
+    When I run "praxis opinions --matrix --domain code --stage capture --output ctx"
+    Then the output contains "Wrote 7 prompt files to ctx"
+    And the exit code is 0
+
+  Scenario: Show only the opinions that changed since a stage
+    Given a praxis.yaml with domain "code" and stage "formalize"
+    And opinions/_shared/first-principles.md exists with valid frontmatter
+    And opinions/code/shape.md exists with valid frontmatter
+    And opinions/code/formalize.md exists with valid frontmatter
+    When I run "praxis opinions --delta-from shape"
+    Then the output contains "+ code/formalize.md"
+    And the output contains "- code/shape.md"
+    And the output contains "unchanged: 1"
+    And the exit code is 0
+
+  Scenario: Search opinion bodies
+    Given opinions/_shared/first-principles.md exists with valid frontmatter
+    And opinions/code/principles.md exists with valid frontmatter
+    When I run "praxis opinions search principles content"
+    Then the output contains "Found 2 match(es)"
+    And the output contains "• code/principles.md"
+    And the exit code is 0
+
+  Scenario: A subcommand name wins over a path of the same name
+    Given opinions/code/principles.md exists with valid frontmatter
+    And search/opinions/code/principles.md exists with valid frontmatter
+    When I run "praxis opinions search principles"
+    Then the output contains "• code/principles.md"
+    And the stderr contains "pass ./search"
+    And the exit code is 0
+
+  Scenario: A path named like a subcommand is passed as ./search
+    Given search/opinions/code/principles.md exists with valid frontmatter
+    When I run "praxis opinions ./search"
+    Then the stderr contains "No praxis.yaml found"
+    And the exit code is 1
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from textwrap import dedent
 from typing import Any
 
 from pytest_bdd import given, parsers, scenarios, then, when
@@ -14,17 +15,120 @@ from praxis.cli import app
 scenarios("../features/library.feature")
 
 
-# Use the actual research library from the repository
-LIBRARY_PATH = Path(__file__).parent.parent.parent / "research-library"
-
-
 @given("the research library exists with cataloged artifacts")
-def library_exists(context: dict[str, Any]) -> None:
-    """Ensure the research library exists."""
-    assert LIBRARY_PATH.exists(), f"Research library not found at {LIBRARY_PATH}"
-    catalog_path = LIBRARY_PATH / "CATALOG.md"
+def library_exists(research_library_copy: Path, context: dict[str, Any]) -> None:
+    """Use a copy of the repository's research library (read-only scenarios)."""
+    catalog_path = research_library_copy / "CATALOG.md"
     assert catalog_path.exists(), f"CATALOG.md not found at {catalog_path}"
-    context["library_path"] = LIBRARY_PATH
+    context["library_path"] = research_library_copy
+
+
+@given("a research library whose artifacts all have valid metadata")
+def valid_library(tmp_path: Path, context: dict[str, Any]) -> None:
+    """Create a small library in a temp directory."""
+    library = tmp_path / "research-library"
+    (library / "patterns").mkdir(parents=True)
+    (library / "CATALOG.md").write_text("# Research Library Catalog\n", encoding="utf-8")
+    (library / "patterns" / "ports.md").write_text(
+        dedent("""\
+            # Ports and Adapters
+
+            <!--
+            metadata:
+              id: patterns-ports-2026-01-02
+              title: Ports and Adapters
+              date: 2026-01-02
+              status: approved
+              topic: patterns
+              keywords: [ports, adapters, hexagonal]
+              consensus: high
+              sources_count: 2
+            -->
+        """),
+        encoding="utf-8",
+    )
+    context["library_path"] = library
+    context["catalog_before"] = (library / "CATALOG.md").read_text(encoding="utf-8")
+
+
+@given("the library contains an artifact with invalid metadata")
+def invalid_artifact(context: dict[str, Any]) -> None:
+    """Add an artifact whose metadata is missing required fields."""
+    (context["library_path"] / "patterns" / "broken.md").write_text(
+        dedent("""\
+            # Broken Artifact
+
+            <!--
+            metadata:
+              id: patterns-broken-2026-01-03
+              title: Broken Artifact
+            -->
+        """),
+        encoding="utf-8",
+    )
+
+
+@given("the library contains an uncataloged artifact")
+def uncataloged_artifact(context: dict[str, Any]) -> None:
+    """Add an artifact that is not in the catalog."""
+    (context["library_path"] / "patterns" / "uncataloged.md").write_text("# Uncataloged\n", encoding="utf-8")
+
+
+@given(parsers.parse("a batch directory with {count:d} new artifacts"))
+def batch_directory(tmp_path: Path, context: dict[str, Any], count: int) -> None:
+    """Create a directory of valid artifacts to catalog."""
+    batch = tmp_path / "batch"
+    batch.mkdir()
+    for n in range(1, count + 1):
+        (batch / f"batch-{n}.md").write_text(
+            dedent(f"""\
+                # Batch Artifact {n}
+
+                <!--
+                metadata:
+                  id: patterns-batch-{n}-2026-01-1{n}
+                  title: Batch Artifact {n}
+                  date: 2026-01-1{n}
+                  status: approved
+                  topic: patterns
+                  keywords: [batch, cataloging, example]
+                  consensus: medium
+                  sources_count: 1
+                -->
+            """),
+            encoding="utf-8",
+        )
+    context["batch_dir"] = batch
+
+
+@given("the batch directory contains an artifact without metadata")
+def batch_with_invalid_artifact(context: dict[str, Any]) -> None:
+    """Add an artifact that fails validation."""
+    (context["batch_dir"] / "no-metadata.md").write_text("# No Metadata\n", encoding="utf-8")
+
+
+@given("the library contains an artifact that supersedes another")
+def superseding_artifact(context: dict[str, Any]) -> None:
+    """Add a newer version of the ports artifact."""
+    (context["library_path"] / "patterns" / "ports-v2.md").write_text(
+        dedent("""\
+            # Ports and Adapters, Revisited
+
+            <!--
+            metadata:
+              id: patterns-ports-v2-2026-01-05
+              title: Ports and Adapters, Revisited
+              date: 2026-01-05
+              status: approved
+              topic: patterns
+              keywords: [ports, adapters, hexagonal]
+              consensus: high
+              sources_count: 3
+              supersedes: patterns-ports-2026-01-02
+            -->
+        """),
+        encoding="utf-8",
+    )
 
 
 @when(parsers.parse('I run praxis library query "{question}"'))
@@ -85,6 +189,36 @@ def run_library_search(cli_runner: CliRunner, context: dict[str, Any], keyword:
     context["result"] = result
 
 
+@when(parsers.parse('I run praxis library search with keyword "{keyword}" and fulltext flag'))
+def run_library_search_fulltext(cli_runner: CliRunner, context: dict[str, Any], keyword: str) -> None:
+    """Run library search command in full-text mode."""
+    library_path = context["library_path"]
+    result = cli_runner.invoke(
+        app,
+        [
+            "library",
+            "search",
+            "--keyword",
+            keyword,
+            "--fulltext",
+            "--library-path",
+            str(library_path),
+        ],
+    )
+    context["result"] = result
+
+
+@when(parsers.parse('I run praxis library search with keyword "{keyword}" and fuzzy flag'))
+def run_library_search_fuzzy(cli_runner: CliRunner, context: dict[str, Any], keyword: str) -> None:
+    """Run library search command with typo-tolerant matching."""
+    library_path = context["library_path"]
+    result = cli_runner.invoke(
+        app,
+        ["library", "search", "--keyword", keyword, "--fuzzy", "--library-path", str(library_path)],
+    )
+    context["result"] = result
+
+
 @when(parsers.parse('I run praxis library cite "{artifact_id}"'))
 def run_library_cite(cli_runner: CliRunner, context: dict[str, Any], artifact_id: str) -> None:
     """Run library cite command."""
@@ -96,6 +230,28 @@ def run_library_cite(cli_runner: CliRunner, context: dict[str, Any], artifact_id
     context["result"] = result
 
 
+@when(parsers.parse('I run praxis library related "{artifact_id}" with depth {depth:d}'))
+def run_library_related(cli_runner: CliRunner, context: dict[str, Any], artifact_id: str, depth: int) -> None:
+    """Run library related command."""
+    library_path = context["library_path"]
+    result = cli_runner.invoke(
+        app,
+        ["library", "related", artifact_id, "--depth", str(depth), "--library-path", str(library_path)],
+    )
+    context["result"] = result
+
+
+@when(parsers.parse('I run praxis library similar "{rel_path}"'))
+def run_library_similar(cli_runner: CliRunner, context: dict[str, Any], rel_path: str) -> None:
+    """Run library similar on a file in the library."""
+    library_path = context["library_path"]
+    result = cli_runner.invoke(
+        app,
+        ["library", "similar", str(library_path / rel_path), "--library-path", str(library_path)],
+    )
+    context["result"] = result
+
+
 @when("I run praxis library check-orphans")
 def run_library_check_orphans(cli_runner: CliRunner, context: dict[str, Any]) -> None:
     """Run library check-orphans command."""
@@ -107,6 +263,17 @@ def run_library_check_orphans(cli_runner: CliRunner, context: dict[str, Any]) ->
     context["result"] = result
 
 
+@when("I run praxis library check-orphans with the strict flag")
+def run_library_check_orphans_strict(cli_runner: CliRunner, context: dict[str, Any]) -> None:
+    """Run library check-orphans as a gate."""
+    library_path = context["library_path"]
+    result = cli_runner.invoke(
+        app,
+        ["library", "check-orphans", "--strict", "--library-path", str(library_path)],
+    )
+    context["result"] = result
+
+
 @when(parsers.parse("I run praxis library check-stale with days {days:d}"))
 def run_library_check_stale(cli_runner: CliRunner, context: dict[str, Any], days: int) -> None:
     """Run library check-stale command."""
@@ -125,6 +292,30 @@ def run_library_check_stale(cli_runner: CliRunner, context: dict[str, Any], days
     context["result"] = result
 
 
+@when(parsers.parse('I run praxis library check-stale after "{after}" before "{before}" in topic "{topic}"'))
+def run_library_check_stale_range(
+    cli_runner: CliRunner, context: dict[str, Any], after: str, before: str, topic: str
+) -> None:
+    """Run library check-stale with a date range and topic filter."""
+    library_path = context["library_path"]
+    result = cli_runner.invoke(
+        app,
+        [
+            "library",
+            "check-stale",
+            "--after",
+            after,
+            "--before",
+            before,
+            "--topic",
+            topic,
+            "--library-path",
+            str(library_path),
+        ],
+    )
+    context["result"] = result
+
+
 @when("I run praxis library reindex")
 def run_library_reindex(cli_runner: CliRunner, context: dict[str, Any]) -> None:
     """Run library reindex command."""
@@ -136,6 +327,70 @@ def run_library_reindex(cli_runner: CliRunner, context: dict[str, Any]) -> None:
     context["result"] = result
 
 
+@when("I run praxis library validate-all with json flag")
+def run_library_validate_all_json(cli_runner: CliRunner, context: dict[str, Any]) -> None:
+    """Run library validate-all with NDJSON output."""
+    library_path = context["library_path"]
+    result = cli_runner.invoke(
+        app,
+        ["library", "validate-all", "--workers", "1", "--json", "--library-path", str(library_path)],
+    )
+    context["result"] = result
+
+
+@when("I run praxis library catalog with the batch directory")
+def run_library_catalog_batch(cli_runner: CliRunner, context: dict[str, Any]) -> None:
+    """Run library catalog in batch mode."""
+    result = cli_runner.invoke(
+        app,
+        [
+            "library",
+            "catalog",
+            "--batch",
+            str(context["batch_dir"]),
+            "--library-path",
+            str(context["library_path"]),
+        ],
+    )
+    context["result"] = result
+
+
+@then("the catalog should be unchanged")
+def check_catalog_unchanged(context: dict[str, Any]) -> None:
+    """Verify CATALOG.md was not rewritten."""
+    catalog_path = context["library_path"] / "CATALOG.md"
+    assert catalog_path.read_text(encoding="utf-8") == context["catalog_before"]
+
+
+@then("the JSON stats should report a cache hit")
+def check_query_cache_hit(context: dict[str, Any]) -> None:
+    """Verify the query was answered from the cache."""
+    assert json.loads(context["result"].output)["stats"]["cache_hit"] is True
+
+
+@then("every output line should be a JSON object")
+def check_ndjson_output(context: dict[str, Any]) -> None:
+    """Verify the output is newline-delimited JSON."""
+    lines = context["result"].output.splitlines()
+    assert lines
+    assert all(isinstance(json.loads(line), dict) for line in lines)
+
+
+@then(parsers.parse("the validation summary should report {count:d} valid artifact(s)"))
+def check_validation_summary(context: dict[str, Any], count: int) -> None:
+    """Verify the final NDJSON line summarizes the run."""
+    summary = json.loads(context["result"].output.splitlines()[-1])["summary"]
+    assert summary["valid"] == count
+    assert summary["invalid"] == 0
+
+
+@then(parsers.parse('the output should not contain "{text}"'))
+def check_output_not_contains(context: dict[str, Any], text: str) -> None:
+    """Verify the output does not contain the text."""
+    result = context["result"]
+    assert text not in result.output, f"Did not expect '{text}' in output. Got: {result.output}"
+
+
 @then(parsers.parse('the JSON output should contain "{key}"'))
 def check_json_contains_key(context: dict[str, Any], key: str) -> None:
     """Verify the JSON output contains the specified key."""
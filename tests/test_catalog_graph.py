@@ -0,0 +1,191 @@
+"""Unit tests for the related-artifact graph."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from praxis.application.library_service import find_related, query_library_service
+from praxis.domain.catalog import CatalogEntry
+from praxis.infrastructure import librarian
+from praxis.infrastructure.catalog_graph import (
+    GRAPH_FILE,
+    build_catalog_graph,
+    load_catalog_graph,
+)
+from praxis.infrastructure.catalog_store import CatalogStore, save_catalog_store
+from praxis.infrastructure.catalog_writer import write_catalog
+from praxis.infrastructure.librarian import query_library
+from praxis.infrastructure.library_index import get_index_dir
+
+
+def _entry(
+    artifact_id: str,
+    date: str,
+    related: list[str] | None = None,
+    supersedes: str | None = None,
+    status: str = "approved",
+) -> CatalogEntry:
+    return CatalogEntry(
+        id=artifact_id,
+        title=f"Ports {artifact_id}",
+        date=date,
+        status=status,
+        topic="patterns",
+        keywords=["ports", "adapters", "hexagonal"],
+        consensus="high",
+        sources_count=1,
+        path=Path("patterns") / f"{artifact_id}.md",
+        related=related,
+        supersedes=supersedes,
+    )
+
+
+ENTRIES = [
+    _entry("a", "2026-01-01", related=["b"]),
+    _entry("b", "2026-01-02", related=["c"]),
+    _entry("c", "2026-01-03"),
+    _entry("a2", "2026-01-04", supersedes="a"),
+    _entry("a3", "2026-01-05", supersedes="a2"),
+    _entry("old", "2025-01-01", status="superseded"),
+]
+
+
+def test_related_links_are_undirected_and_walked_by_depth() -> None:
+    """Depth bounds the walk; related links work in both directions."""
+    graph = build_catalog_graph(ENTRIES)
+
+    assert graph.related["c"] == ["b"]
+    assert graph.neighbors("a") == [("b", 1, "related"), ("a2", 1, "superseded-by")]
+    assert graph.neighbors("a", depth=2) == [
+        ("b", 1, "related"),
+        ("a2", 1, "superseded-by"),
+        ("c", 2, "related"),
+        ("a3", 2, "superseded-by"),
+    ]
+
+
+def test_resolve_follows_superseded_chain() -> None:
+    """Resolution lands on the newest version; retired artifacts count as superseded."""
+    graph = build_catalog_graph(ENTRIES)
+
+    assert graph.resolve("a") == "a3"
+    assert graph.resolve("c") == "c"
+    assert graph.is_superseded("a2")
+    assert graph.is_superseded("old")
+    assert not graph.is_superseded("a3")
+
+
+def test_load_rebuilds_stale_graph(tmp_path: Path) -> None:
+    """The cached graph is keyed by the store; a changed store rebuilds it."""
+    catalog_path = tmp_path / "CATALOG.md"
+    assert load_catalog_graph(catalog_path) is None
+
+    save_catalog_store(CatalogStore(ENTRIES[:3]), catalog_path)
+    first = load_catalog_graph(catalog_path)
+    assert first is not None and first.superseded_by == {}
+    assert (get_index_dir(catalog_path) / GRAPH_FILE).exists()
+
+    save_catalog_store(CatalogStore(ENTRIES), catalog_path)
+    second = load_catalog_graph(catalog_path)
+    assert second is not None and second.superseded_by["a"] == "a2"
+
+    reloaded = load_catalog_graph(catalog_path)
+    assert reloaded == second
+
+
+def test_query_can_exclude_superseded(tmp_path: Path) -> None:
+    """Superseded matches are dropped using the graph alone."""
+    catalog_path = tmp_path / "CATALOG.md"
+    store = CatalogStore(ENTRIES)
+    write_catalog(catalog_path, store.entries)
+    save_catalog_store(store, catalog_path)
+
+    everything = query_library("ports adapters", tmp_path)
+    current = query_library("ports adapters", tmp_path, exclude_superseded=True)
+
+    assert everything.coverage.match_count == 6
+    assert current.coverage.match_count == 3
+    assert {source.artifact_id for source in current.sources} == {"a3", "b", "c"}
+
+
+def _write_artifacts(library: Path, entries: list[CatalogEntry]) -> None:
+    """Write an artifact file carrying each entry's metadata."""
+    for entry in entries:
+        lines = [
+            f"id: {entry.id}",
+            f"title: {entry.title}",
+            f"date: {entry.date}",
+            f"status: {entry.status}",
+            f"topic: {entry.topic}",
+            f"keywords: [{', '.join(entry.keywords)}]",
+            f"consensus: {entry.consensus}",
+            f"sources_count: {entry.sources_count}",
+        ]
+        if entry.related:
+            lines.append(f"related: [{', '.join(entry.related)}]")
+        if entry.supersedes:
+            lines.append(f"supersedes: {entry.supersedes}")
+        metadata = "".join(f"  {line}\n" for line in lines)
+        path = library / entry.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# {entry.title}\n\n<!--\nmetadata:\n{metadata}-->\n", encoding="utf-8")
+
+
+# Entries whose IDs pass metadata validation, for libraries with artifact files
+ON_DISK = [
+    _entry("patterns-ports-2026-01-01", "2026-01-01", related=["patterns-adapters-2026-01-02"]),
+    _entry("patterns-adapters-2026-01-02", "2026-01-02"),
+    _entry("patterns-ports-v2-2026-01-03", "2026-01-03", supersedes="patterns-ports-2026-01-01"),
+]
+
+
+def test_graph_is_built_on_demand_without_a_store(tmp_path: Path) -> None:
+    """A library never cataloged through the store gets its graph from CATALOG.md and artifact metadata."""
+    catalog_path = tmp_path / "CATALOG.md"
+    write_catalog(catalog_path, ON_DISK)
+    _write_artifacts(tmp_path, ON_DISK)
+
+    graph = load_catalog_graph(catalog_path)
+
+    assert graph is not None
+    assert graph == build_catalog_graph(ON_DISK)
+    assert graph.superseded_by == {"patterns-ports-2026-01-01": "patterns-ports-v2-2026-01-03"}
+    assert (get_index_dir(catalog_path) / GRAPH_FILE).exists()
+    assert load_catalog_graph(catalog_path) == graph
+
+    # Cataloging later creates the store, which then keys the graph
+    save_catalog_store(CatalogStore(ON_DISK[:2]), catalog_path)
+    rebuilt = load_catalog_graph(catalog_path)
+    assert rebuilt is not None and rebuilt.superseded_by == {}
+
+
+def test_related_and_exclude_superseded_work_before_reindex(tmp_path: Path) -> None:
+    """Neither related nor exclude-superseded needs a reindex first."""
+    write_catalog(tmp_path / "CATALOG.md", ON_DISK)
+    _write_artifacts(tmp_path, ON_DISK)
+
+    related = find_related("patterns-ports-2026-01-01", library_path=tmp_path)
+    current = query_library_service("ports adapters", tmp_path, exclude_superseded=True)
+
+    assert related.success
+    assert related.current_id == "patterns-ports-v2-2026-01-03"
+    assert current.success
+    assert {source["artifact_id"] for source in current.sources} == {
+        "patterns-adapters-2026-01-02",
+        "patterns-ports-v2-2026-01-03",
+    }
+
+
+def test_exclude_superseded_fails_without_a_graph(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A missing graph fails the query instead of silently keeping superseded matches."""
+    store = CatalogStore(ENTRIES)
+    write_catalog(tmp_path / "CATALOG.md", store.entries)
+    save_catalog_store(store, tmp_path / "CATALOG.md")
+    monkeypatch.setattr(librarian, "load_catalog_graph", lambda _: None)
+
+    result = query_library_service("ports adapters", tmp_path, exclude_superseded=True)
+
+    assert not result.success
+    assert "cannot exclude superseded artifacts" in result.errors[0]
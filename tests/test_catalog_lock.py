@@ -0,0 +1,33 @@
+"""Unit tests for the catalog lock."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from praxis.infrastructure.catalog_lock import CatalogLockTimeout, catalog_lock, get_lock_path
+
+
+def test_lock_excludes_second_holder(tmp_path: Path) -> None:
+    """A second acquisition retries until its timeout, then gives up."""
+    catalog_path = tmp_path / "CATALOG.md"
+
+    with catalog_lock(catalog_path):
+        assert get_lock_path(catalog_path).exists()
+        start = time.monotonic()
+        with pytest.raises(CatalogLockTimeout), catalog_lock(catalog_path, timeout=0.1):
+            pass
+        assert time.monotonic() - start >= 0.1
+
+
+def test_lock_is_released_after_block(tmp_path: Path) -> None:
+    """The lock is free again once the holder leaves the block, even on error."""
+    catalog_path = tmp_path / "CATALOG.md"
+
+    with pytest.raises(RuntimeError), catalog_lock(catalog_path):
+        raise RuntimeError("boom")
+
+    with catalog_lock(catalog_path, timeout=0):
+        pass
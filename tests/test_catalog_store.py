@@ -0,0 +1,158 @@
+"""Unit tests for the structured catalog store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from praxis.domain.catalog import CatalogEntry
+from praxis.infrastructure.catalog_store import (
+    CatalogStore,
+    get_store_path,
+    import_catalog,
+    import_is_lossless,
+    load_catalog_store,
+    save_catalog_store,
+)
+from praxis.infrastructure.catalog_writer import render_catalog
+from praxis.infrastructure.librarian import (
+    parse_catalog,
+    parse_catalog_content,
+    parse_topic_headings,
+    search_library,
+)
+
+
+def _entry(artifact_id: str, date: str, topic: str = "patterns") -> CatalogEntry:
+    return CatalogEntry(
+        id=artifact_id,
+        title=artifact_id.replace("-", " ").title(),
+        date=date,
+        status="approved",
+        topic=topic,
+        keywords=["alpha", "beta", "gamma"],
+        consensus="high",
+        sources_count=2,
+        path=Path(topic) / f"{artifact_id}.md",
+        also_relevant=["roles"],
+    )
+
+
+@pytest.fixture
+def store() -> CatalogStore:
+    """Store with three entries across two topics."""
+    return CatalogStore(
+        [
+            _entry("a-2026-01-01", "2026-01-01"),
+            _entry("c-2026-03-01", "2026-03-01", topic="roles"),
+            _entry("b-2026-02-01", "2026-02-01"),
+        ]
+    )
+
+
+def test_store_orders_and_indexes(store: CatalogStore) -> None:
+    """Entries are kept newest first with ID lookups."""
+    assert [e.id for e in store.entries] == ["c-2026-03-01", "b-2026-02-01", "a-2026-01-01"]
+    assert "b-2026-02-01" in store
+    assert store.get("b-2026-02-01") is store.entries[1]
+    assert store.get("missing") is None
+
+
+def test_insert_is_all_or_nothing(store: CatalogStore) -> None:
+    """A duplicate anywhere in the batch leaves the store unchanged."""
+    with pytest.raises(ValueError, match="duplicate ID: a-2026-01-01"):
+        store.insert([_entry("d-2026-04-01", "2026-04-01"), _entry("a-2026-01-01", "2026-01-01")])
+    assert len(store) == 3
+    assert "d-2026-04-01" not in store
+
+    store.insert([_entry("d-2026-04-01", "2026-04-01")])
+    assert store.entries[0].id == "d-2026-04-01"
+
+
+def test_save_and_load_round_trip(tmp_path: Path, store: CatalogStore) -> None:
+    """The JSON lines file restores every field."""
+    catalog_path = tmp_path / "CATALOG.md"
+    save_catalog_store(store, catalog_path)
+
+    loaded = load_catalog_store(catalog_path)
+
+    assert loaded is not None
+    assert loaded.entries == store.entries
+    assert len(get_store_path(catalog_path).read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_load_missing_and_malformed(tmp_path: Path) -> None:
+    """No store yields None; a corrupt line is reported with its location."""
+    catalog_path = tmp_path / "CATALOG.md"
+    assert load_catalog_store(catalog_path) is None
+
+    get_store_path(catalog_path).write_text("{not json\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="catalog.jsonl:1"):
+        load_catalog_store(catalog_path)
+
+
+def test_import_from_rendered_catalog(tmp_path: Path, store: CatalogStore) -> None:
+    """Importing a catalog recovers its rows."""
+    catalog_path = tmp_path / "CATALOG.md"
+    catalog_path.write_text(render_catalog(store.entries), encoding="utf-8")
+
+    imported = import_catalog(catalog_path)
+
+    assert [e.id for e in imported.entries] == [e.id for e in store.entries]
+    entry = imported.get("a-2026-01-01")
+    assert entry is not None
+    assert entry.keywords == ["alpha", "beta", "gamma"]
+
+
+def test_import_of_library_catalog_round_trips(research_library_copy: Path) -> None:
+    """Importing the hand-curated catalog keeps every row, heading and keyword."""
+    catalog_path = research_library_copy / "CATALOG.md"
+    content = catalog_path.read_text(encoding="utf-8")
+
+    imported = import_catalog(catalog_path)
+    rendered = render_catalog(imported.entries)
+
+    fields = ("id", "title", "topic", "consensus", "date", "path")
+    before = {a["id"]: tuple(a[f] for f in fields) for a in parse_catalog_content(content)}
+    after = {a["id"]: tuple(a[f] for f in fields) for a in parse_catalog_content(rendered)}
+    assert after == before
+    assert parse_topic_headings(rendered) == parse_topic_headings(content)
+    assert "### AI Guards" in rendered.splitlines()
+    # Keywords come from the artifact metadata, merged with cross-listed rows
+    design = imported.get("foundations-research-library-design-2025-12-30")
+    assert design is not None and "zettelkasten" in design.keywords
+    # Annotations and cross-listings have no place in the store
+    assert not import_is_lossless(catalog_path, imported)
+
+
+def test_import_is_lossless_for_rendered_catalog(tmp_path: Path, store: CatalogStore) -> None:
+    """A catalog the store rendered can be imported; an annotated one cannot."""
+    catalog_path = tmp_path / "CATALOG.md"
+    assert import_is_lossless(catalog_path, store)
+
+    # Without artifact files, cross-listings can't be recovered from metadata
+    for entry in store.entries:
+        entry.also_relevant = None
+    content = render_catalog(store.entries)
+    catalog_path.write_text(content, encoding="utf-8")
+    assert import_is_lossless(catalog_path, import_catalog(catalog_path))
+
+    catalog_path.write_text(
+        content.replace("— alpha, beta, gamma", "— alpha, beta, gamma _(draft)_", 1), encoding="utf-8"
+    )
+    assert not import_is_lossless(catalog_path, import_catalog(catalog_path))
+
+
+def test_librarian_reads_store(tmp_path: Path, store: CatalogStore) -> None:
+    """With a store present, the librarian ignores CATALOG.md."""
+    catalog_path = tmp_path / "CATALOG.md"
+    catalog_path.write_text("# Research Library Catalog\n", encoding="utf-8")
+    save_catalog_store(store, catalog_path)
+
+    assert [a["id"] for a in parse_catalog(catalog_path)] == ["c-2026-03-01", "b-2026-02-01", "a-2026-01-01"]
+    assert {m.id for m in search_library("alpha", catalog_path)} == {e.id for e in store.entries}
+
+    store.insert([_entry("z-2026-05-01", "2026-05-01")])
+    save_catalog_store(store, catalog_path)
+    assert "z-2026-05-01" in {m.id for m in search_library("alpha", catalog_path)}
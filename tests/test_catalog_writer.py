@@ -1,5 +1,6 @@
 """Unit tests for catalog writer."""
 
+from dataclasses import replace
 from pathlib import Path
 from textwrap import dedent
 
@@ -10,7 +11,9 @@ from praxis.infrastructure.catalog_writer import (
     _find_section_boundaries,
     _update_quick_reference,
     _update_recently_added,
+    render_catalog,
     update_catalog,
+    update_catalog_many,
 )
 
 
@@ -255,6 +258,39 @@ def test_update_catalog_full_integration(minimal_catalog: Path) -> None:
     assert "New Artifact" in recently_lines[0]
 
 
+def test_update_catalog_many_merges_batch(minimal_catalog: Path) -> None:
+    """A batch lands in every section with one write and one header per new topic."""
+    entries = [
+        CatalogEntry(
+            id=f"foundations-batch-{n}-2026-01-0{n}",
+            title=f"Batch Artifact {n}",
+            date=f"2026-01-0{n}",
+            status="approved",
+            topic="foundations",
+            keywords=["batch", f"kw{n}"],
+            consensus="high",
+            sources_count=5,
+            path=Path(f"foundations/batch-{n}.md"),
+        )
+        for n in (3, 4)
+    ]
+
+    update_catalog_many(minimal_catalog, entries)
+
+    content = minimal_catalog.read_text(encoding="utf-8")
+    assert "_Total artifacts: 4_" in content
+    assert content.count("### Foundations") == 1
+    assert content.count("### batch") == 1
+    for entry in entries:
+        # Quick Reference, By Topic, By Consensus, two keywords, Recently Added
+        assert content.count(f"]({entry.path})") == 6
+
+    # Quick Reference stays sorted newest first
+    quick_ref = content.split("## Quick Reference")[1].split("\n---\n")[0]
+    assert quick_ref.index("batch-4") < quick_ref.index("batch-3")
+    assert not list(minimal_catalog.parent.glob("*.tmp"))
+
+
 def test_update_catalog_file_not_found(tmp_path: Path) -> None:
     """Test updating non-existent catalog."""
     entry = CatalogEntry(
@@ -271,3 +307,77 @@ def test_update_catalog_file_not_found(tmp_path: Path) -> None:
 
     with pytest.raises(FileNotFoundError):
         update_catalog(tmp_path / "nonexistent.md", entry)
+
+
+def test_render_catalog_sections() -> None:
+    """Test rendering a full catalog from entries."""
+    entries = [
+        CatalogEntry(
+            id="roles-old-2026-01-01",
+            title="Old Role Research",
+            date="2026-01-01",
+            status="approved",
+            topic="roles",
+            keywords=["scrum", "roles", "team"],
+            consensus="Low",
+            sources_count=1,
+            path=Path("roles/old.md"),
+        ),
+        CatalogEntry(
+            id="patterns-new-2026-01-03",
+            title="New Pattern",
+            date="2026-01-03",
+            status="approved",
+            topic="patterns",
+            keywords=["hexagonal", "ports", "adapters"],
+            consensus="High",
+            sources_count=4,
+            path=Path("patterns/new.md"),
+            also_relevant=["roles"],
+            supersedes="roles-old-2026-01-01",
+        ),
+    ]
+
+    content = render_catalog(entries)
+
+    assert "_Last updated: 2026-01-03_" in content
+    assert "_Total artifacts: 2_" in content
+    assert content.index("[patterns-new-2026-01-03]") < content.index("[roles-old-2026-01-01]")
+    assert "| New Pattern _(cross-listed)_ | High |" in content
+    assert "- [Old Role Research](roles/old.md) — roles — scrum, roles, team" in content
+    assert "| roles-old-2026-01-01 | patterns-new-2026-01-03 | 2026-01-03 |" in content
+    assert render_catalog(list(reversed(entries))) == content
+
+
+def test_topic_display_names_are_kept(minimal_catalog: Path) -> None:
+    """An existing heading like "AI Guards" is found for topic ai-guards and rendered as is."""
+    content = minimal_catalog.read_text(encoding="utf-8")
+    minimal_catalog.write_text(
+        content.replace(
+            "## By Topic\n",
+            "## By Topic\n\n### AI Guards\n\n| ID | Title | Consensus | Keywords |\n"
+            "|----|-------|-----------|----------|\n",
+            1,
+        ),
+        encoding="utf-8",
+    )
+    entry = CatalogEntry(
+        id="ai-guards-new-2026-01-03",
+        title="Guard Research",
+        date="2026-01-03",
+        status="approved",
+        topic="ai-guards",
+        keywords=["guards", "rules", "models"],
+        consensus="high",
+        sources_count=3,
+        path=Path("ai-guards/new.md"),
+        topic_heading="AI Guards",
+    )
+
+    update_catalog(minimal_catalog, entry)
+
+    updated = minimal_catalog.read_text(encoding="utf-8")
+    assert updated.count("### AI Guards") == 1
+    assert "### Ai-Guards" not in updated
+    assert "### AI Guards" in render_catalog([entry])
+    assert "### Ai-Guards" in render_catalog([replace(entry, topic_heading=None)])
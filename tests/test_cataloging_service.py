@@ -1,16 +1,30 @@
 """Integration tests for cataloging service."""
 
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
+from praxis.application import cataloging_service
 from praxis.application.cataloging_service import (
     catalog_artifact,
+    catalog_artifacts,
     check_duplicate_id,
     find_orphans,
+    list_batch_artifacts,
+    reindex_library,
+    validate_library,
     validate_metadata,
 )
+from praxis.infrastructure.catalog_lock import catalog_lock
+from praxis.infrastructure.catalog_store import get_store_path, load_catalog_store
+from praxis.infrastructure.catalog_writer import render_catalog
+from praxis.infrastructure.librarian import parse_catalog
+from praxis.infrastructure.library_index import load_summary_cache
 
 
 @pytest.fixture
@@ -206,6 +220,22 @@ def test_catalog_artifact_success(valid_artifact: Path, research_library: Path)
     assert "_Total artifacts: 2_" in catalog_content
 
 
+def test_catalog_artifact_reports_similar_artifacts(valid_artifact: Path, research_library: Path) -> None:
+    """Existing artifacts that cover the same ground are reported, most similar first."""
+    near_copy = valid_artifact.read_text(encoding="utf-8").replace("roles-new-artifact", "roles-near-copy")
+    near_copy_path = research_library.parent / "near-copy.md"
+    near_copy_path.write_text(near_copy, encoding="utf-8")
+    first = catalog_artifact(valid_artifact, topic="roles", library_path=research_library)
+    assert [m.id for m in first.similar] == ["existing-artifact-2026-01-02"]
+
+    result = catalog_artifact(near_copy_path, topic="roles", library_path=research_library)
+
+    assert result.success is True
+    assert result.similar[0].id == "roles-new-artifact-2026-01-04"
+    assert result.similar[0].score > 0.9
+    assert result.similar[0].score > result.similar[1].score
+
+
 def test_catalog_artifact_duplicate_id(valid_artifact: Path, research_library: Path) -> None:
     """Test cataloging artifact with duplicate ID."""
     catalog_path = research_library / "CATALOG.md"
@@ -247,6 +277,203 @@ def test_catalog_artifact_creates_topic_folder(valid_artifact: Path, research_li
     assert (research_library / "roles" / "new-artifact.md").exists()
 
 
+@pytest.fixture
+def batch_dir(tmp_path: Path, valid_artifact: Path) -> Path:
+    """Directory with two valid artifacts in different topics."""
+    batch = tmp_path / "batch"
+    batch.mkdir()
+    content = valid_artifact.read_text(encoding="utf-8")
+    (batch / "first.md").write_text(content, encoding="utf-8")
+    (batch / "second.md").write_text(
+        content.replace("roles-new-artifact-2026-01-04", "patterns-second-2026-01-05").replace(
+            "topic: roles", "topic: patterns"
+        ),
+        encoding="utf-8",
+    )
+    (batch / "README.md").write_text("# Not an artifact\n", encoding="utf-8")
+    return batch
+
+
+def test_catalog_artifacts_batch(batch_dir: Path, research_library: Path) -> None:
+    """A batch is filed by metadata topic and cataloged in one update."""
+    result = catalog_artifacts(list_batch_artifacts(batch_dir), research_library)
+
+    assert result.success
+    assert [e.id for e in result.entries] == ["roles-new-artifact-2026-01-04", "patterns-second-2026-01-05"]
+    assert (research_library / "roles" / "first.md").exists()
+    assert (research_library / "patterns" / "second.md").exists()
+
+    ids = {a["id"] for a in parse_catalog(research_library / "CATALOG.md")}
+    assert {"roles-new-artifact-2026-01-04", "patterns-second-2026-01-05"} <= ids
+
+
+def test_catalog_artifacts_rolls_back_on_invalid(batch_dir: Path, research_library: Path) -> None:
+    """One invalid artifact leaves the library and catalog untouched."""
+    (batch_dir / "third.md").write_text("# No metadata\n", encoding="utf-8")
+    catalog = research_library / "CATALOG.md"
+    before = catalog.read_text(encoding="utf-8")
+
+    result = catalog_artifacts(list_batch_artifacts(batch_dir), research_library)
+
+    assert not result.success
+    assert any(e.message.startswith("third.md:") for e in result.errors)
+    assert catalog.read_text(encoding="utf-8") == before
+    assert not (research_library / "roles" / "first.md").exists()
+
+
+def test_catalog_artifacts_rejects_duplicates_within_batch(batch_dir: Path, research_library: Path) -> None:
+    """Two artifacts sharing an ID fail the whole batch."""
+    (batch_dir / "second.md").write_text((batch_dir / "first.md").read_text(encoding="utf-8"), encoding="utf-8")
+
+    result = catalog_artifacts(list_batch_artifacts(batch_dir), research_library)
+
+    assert not result.success
+    assert result.errors[0].message == "second.md: duplicate ID: roles-new-artifact-2026-01-04"
+
+
+def test_catalog_artifacts_rolls_back_copies_on_catalog_failure(
+    batch_dir: Path, research_library: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Copied files are removed and CATALOG.md restored when the store cannot be saved."""
+    catalog = research_library / "CATALOG.md"
+    before = catalog.read_text(encoding="utf-8")
+
+    def fail(*args: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cataloging_service, "save_catalog_store", fail)
+    result = catalog_artifacts(list_batch_artifacts(batch_dir), research_library)
+
+    assert not result.success
+    assert result.errors[0].field == "catalog"
+    assert not (research_library / "roles" / "first.md").exists()
+    assert not (research_library / "patterns" / "second.md").exists()
+    assert catalog.read_text(encoding="utf-8") == before
+    assert not get_store_path(catalog).exists()
+
+
+def test_parallel_catalog_workers_lose_no_entries(valid_artifact: Path, research_library: Path) -> None:
+    """Workers cataloging at the same time each add their artifact to the catalog."""
+    content = valid_artifact.read_text(encoding="utf-8")
+    artifacts = []
+    for n in range(8):
+        artifact = valid_artifact.parent / f"parallel-{n}.md"
+        artifact.write_text(content.replace("roles-new-artifact-2026-01-04", f"roles-parallel-{n}-2026-01-04"))
+        artifacts.append(artifact)
+
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(partial(catalog_artifact, topic="roles", library_path=research_library), artifacts))
+
+    assert all(result.success for result in results)
+    expected = {f"roles-parallel-{n}-2026-01-04" for n in range(8)}
+    store = load_catalog_store(research_library / "CATALOG.md")
+    assert store is not None and expected <= {entry.id for entry in store.entries}
+    assert expected <= {a["id"] for a in parse_catalog(research_library / "CATALOG.md")}
+    assert not list(research_library.glob("*.tmp"))
+
+
+def test_catalog_artifact_reports_lock_timeout(
+    valid_artifact: Path, research_library: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A catalog held by another writer fails cleanly once the retries run out."""
+    catalog = research_library / "CATALOG.md"
+    before = catalog.read_text(encoding="utf-8")
+    monkeypatch.setattr(cataloging_service, "catalog_lock", partial(catalog_lock, timeout=0.05))
+
+    with catalog_lock(catalog):
+        result = catalog_artifact(valid_artifact, "roles", research_library)
+
+    assert not result.success
+    assert result.errors[0].field == "catalog"
+    assert "locked" in result.errors[0].message
+    assert not (research_library / "roles" / "new-artifact.md").exists()
+    assert catalog.read_text(encoding="utf-8") == before
+
+
+def test_similar_artifacts_are_found_outside_the_lock(
+    batch_dir: Path, valid_artifact: Path, research_library: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Similarity search, which may tokenize the library, never holds up other writers."""
+    catalog = research_library / "CATALOG.md"
+    original = cataloging_service._find_similar
+    calls: list[int] = []
+
+    def spy(artifact_paths: list[Path], catalog_path: Path) -> object:
+        with catalog_lock(catalog, timeout=0):
+            calls.append(len(artifact_paths))
+        return original(artifact_paths, catalog_path)
+
+    monkeypatch.setattr(cataloging_service, "_find_similar", spy)
+
+    assert catalog_artifact(valid_artifact, "roles", research_library).success
+    (batch_dir / "first.md").unlink()
+    assert catalog_artifacts(list_batch_artifacts(batch_dir), research_library).success
+    assert calls == [1, 1]
+
+
+def test_catalog_artifact_imports_and_writes_store(valid_artifact: Path, research_library: Path) -> None:
+    """The first change imports CATALOG.md into the store and renders from it."""
+    catalog = research_library / "CATALOG.md"
+
+    result = catalog_artifact(valid_artifact, topic="roles", library_path=research_library)
+
+    assert result.success
+    store = load_catalog_store(catalog)
+    assert store is not None
+    assert [e.id for e in store.entries] == ["roles-new-artifact-2026-01-04", "existing-artifact-2026-01-02"]
+    # Imported entries pick up fields CATALOG.md doesn't carry from metadata
+    existing = store.get("existing-artifact-2026-01-02")
+    assert existing is not None and existing.sources_count == 3
+    assert catalog.read_text(encoding="utf-8") == render_catalog(store.entries)
+    assert check_duplicate_id("roles-new-artifact-2026-01-04", catalog)
+
+
+def test_catalog_artifact_updates_hand_curated_catalog_in_place(valid_artifact: Path, research_library: Path) -> None:
+    """Content the store can't regenerate keeps CATALOG.md out of the store."""
+    catalog = research_library / "CATALOG.md"
+    annotated = "- [Existing Artifact](patterns/existing.md) — patterns — test, example, pattern _(medium-high)_"
+    content = catalog.read_text(encoding="utf-8")
+    catalog.write_text(
+        content.replace("- [Existing Artifact](patterns/existing.md) — patterns — test, example, pattern", annotated),
+        encoding="utf-8",
+    )
+
+    result = catalog_artifact(valid_artifact, topic="roles", library_path=research_library)
+
+    assert result.success
+    assert result.warnings == [cataloging_service.IN_PLACE_WARNING]
+    assert not get_store_path(catalog).exists()
+    updated = catalog.read_text(encoding="utf-8")
+    assert annotated in updated.splitlines()
+    assert check_duplicate_id("roles-new-artifact-2026-01-04", catalog)
+
+
+def test_catalog_artifacts_import_existing_converts_catalog(batch_dir: Path, research_library: Path) -> None:
+    """import_existing converts a hand-curated catalog to the store."""
+    catalog = research_library / "CATALOG.md"
+    catalog.write_text(
+        catalog.read_text(encoding="utf-8").replace("test, example, pattern\n", "test, example, pattern _(note)_\n"),
+        encoding="utf-8",
+    )
+
+    result = catalog_artifacts(list_batch_artifacts(batch_dir), research_library, import_existing=True)
+
+    assert result.success
+    assert result.warnings == []
+    store = load_catalog_store(catalog)
+    assert store is not None
+    assert "existing-artifact-2026-01-02" in store
+    assert catalog.read_text(encoding="utf-8") == render_catalog(store.entries)
+
+
+def test_find_orphans_reads_store(research_library: Path, valid_artifact: Path) -> None:
+    """Cataloged paths come from the store once it exists."""
+    catalog_artifact(valid_artifact, topic="roles", library_path=research_library)
+    (research_library / "roles" / "orphan.md").write_text("# Orphan\n", encoding="utf-8")
+
+    assert find_orphans(research_library) == [Path("roles/orphan.md")]
+
+
 def test_find_orphans_no_orphans(research_library: Path) -> None:
     """Test finding orphans when none exist."""
     orphans = find_orphans(research_library)
@@ -276,3 +503,184 @@ def test_find_orphans_ignores_catalog_and_index(research_library: Path) -> None:
 
     # Should not include CATALOG.md or _index.md
     assert len(orphans) == 0
+
+
+def test_find_orphans_skips_hidden_directories(research_library: Path) -> None:
+    """Hidden directories such as .git and .index are never walked."""
+    hidden = research_library / ".git" / "notes"
+    hidden.mkdir(parents=True)
+    (hidden / "orphan.md").write_text("# Hidden\n", encoding="utf-8")
+
+    assert find_orphans(research_library) == []
+
+
+def test_find_orphans_since_last_run(research_library: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Incremental mode checks new files and re-reports earlier orphans."""
+    assert find_orphans(research_library) == []
+
+    new = research_library / "patterns" / "new.md"
+    new.write_text("# New\n", encoding="utf-8")
+    assert find_orphans(research_library, since_last_run=True) == [Path("patterns/new.md")]
+
+    # Record a run that ends well after the next file is added
+    with monkeypatch.context() as m:
+        later = time.time_ns() + 3600 * 10**9
+        m.setattr(time, "time_ns", lambda: later)
+        assert find_orphans(research_library, since_last_run=True) == [Path("patterns/new.md")]
+    old = research_library / "patterns" / "old.md"
+    old.write_text("# Old\n", encoding="utf-8")
+
+    # The file untouched since that run is skipped; the earlier orphan is reported again
+    assert find_orphans(research_library, since_last_run=True) == [Path("patterns/new.md")]
+    # A full run still finds everything
+    assert find_orphans(research_library) == [Path("patterns/new.md"), Path("patterns/old.md")]
+
+
+def test_find_orphans_since_last_run_finds_moved_in_files(research_library: Path) -> None:
+    """A file moved into the library keeps its old mtime but is still checked."""
+    find_orphans(research_library)
+    incoming = research_library.parent / "incoming.md"
+    incoming.write_text("# Incoming\n", encoding="utf-8")
+    os.utime(incoming, (time.time() - 3600, time.time() - 3600))
+
+    os.replace(incoming, research_library / "patterns" / "moved.md")
+
+    assert find_orphans(research_library, since_last_run=True) == [Path("patterns/moved.md")]
+
+
+def test_find_orphans_since_last_run_after_catalog_change(research_library: Path, valid_artifact: Path) -> None:
+    """A changed catalog forces a full walk."""
+    find_orphans(research_library)
+    old = research_library / "patterns" / "old.md"
+    old.write_text("# Old\n", encoding="utf-8")
+    os.utime(old, (time.time() - 3600, time.time() - 3600))
+
+    catalog_artifact(valid_artifact, topic="roles", library_path=research_library)
+
+    assert find_orphans(research_library, since_last_run=True) == [Path("patterns/old.md")]
+
+
+@pytest.fixture
+def reindexable_library(research_library: Path, valid_artifact: Path) -> Path:
+    """Library with two valid artifacts in different topics."""
+    roles_dir = research_library / "roles"
+    roles_dir.mkdir()
+    (roles_dir / "new-artifact.md").write_text(valid_artifact.read_text(encoding="utf-8"), encoding="utf-8")
+    return research_library
+
+
+def test_reindex_rebuilds_catalog(reindexable_library: Path) -> None:
+    """Reindex writes every valid artifact, newest first."""
+    result = reindex_library(reindexable_library, max_workers=1)
+
+    assert result.success is True
+    assert [e.id for e in result.entries] == ["roles-new-artifact-2026-01-04", "existing-artifact-2026-01-02"]
+    artifacts = parse_catalog(reindexable_library / "CATALOG.md")
+    assert [a["id"] for a in artifacts] == ["roles-new-artifact-2026-01-04", "existing-artifact-2026-01-02"]
+    assert artifacts[0]["keywords"] == ["new", "test", "research"]
+    assert artifacts[0]["path"] == "roles/new-artifact.md"
+    store = load_catalog_store(reindexable_library / "CATALOG.md")
+    assert store is not None and len(store) == 2
+
+
+def test_reindex_fills_summary_cache(reindexable_library: Path) -> None:
+    """Artifacts read during reindex have their summaries cached."""
+    reindex_library(reindexable_library, max_workers=1)
+
+    cache = load_summary_cache(reindexable_library)
+    assert set(cache.entries) == {"patterns/existing.md", "roles/new-artifact.md"}
+
+
+def test_reindex_is_deterministic(reindexable_library: Path) -> None:
+    """Rebuilding an unchanged library produces identical output."""
+    catalog_path = reindexable_library / "CATALOG.md"
+    reindex_library(reindexable_library, max_workers=1)
+    first = catalog_path.read_text(encoding="utf-8")
+
+    reindex_library(reindexable_library, max_workers=1)
+
+    assert catalog_path.read_text(encoding="utf-8") == first
+    assert "_Last updated: 2026-01-04_" in first
+
+
+def test_reindex_only_reparses_changed_files(reindexable_library: Path) -> None:
+    """The manifest lets later runs skip unchanged artifacts."""
+    first = reindex_library(reindexable_library, max_workers=1)
+    assert (first.parsed, first.reused) == (2, 0)
+
+    second = reindex_library(reindexable_library, max_workers=1)
+    assert (second.parsed, second.reused) == (0, 2)
+
+    artifact = reindexable_library / "roles" / "new-artifact.md"
+    artifact.write_text(artifact.read_text(encoding="utf-8").replace("New Artifact Title", "Renamed"), encoding="utf-8")
+    third = reindex_library(reindexable_library, max_workers=1)
+
+    assert (third.parsed, third.reused) == (1, 1)
+    assert "Renamed" in (reindexable_library / "CATALOG.md").read_text(encoding="utf-8")
+
+
+def test_reindex_in_process_pool(reindexable_library: Path) -> None:
+    """Parsing in worker processes yields the same catalog as in-process parsing."""
+    catalog_path = reindexable_library / "CATALOG.md"
+    reindex_library(reindexable_library, max_workers=1)
+    expected = catalog_path.read_text(encoding="utf-8")
+    (reindexable_library / ".index" / "reindex-manifest.json").unlink()
+
+    result = reindex_library(reindexable_library, max_workers=2)
+
+    assert result.success is True
+    assert result.parsed == 2
+    assert catalog_path.read_text(encoding="utf-8") == expected
+
+
+def test_reindex_invalid_artifact_leaves_catalog_untouched(research_library: Path) -> None:
+    """A single invalid artifact aborts the rebuild."""
+    catalog_path = research_library / "CATALOG.md"
+    before = catalog_path.read_text(encoding="utf-8")
+    (research_library / "patterns" / "draft.md").write_text("# Draft\n\nNo metadata.", encoding="utf-8")
+
+    result = reindex_library(research_library, max_workers=1)
+
+    assert result.success is False
+    assert any("patterns/draft.md" in e.message for e in result.errors)
+    assert catalog_path.read_text(encoding="utf-8") == before
+
+
+def test_reindex_reports_unreadable_artifacts(research_library: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Binary files and files deleted mid-scan are invalid artifacts, not crashes."""
+    (research_library / "patterns" / "binary.md").write_bytes(b"\xff\xfe\x00\x9c<!-- metadata")
+    listed = cataloging_service._list_artifacts(research_library)
+    monkeypatch.setattr(cataloging_service, "_list_artifacts", lambda _: [*listed, Path("patterns/gone.md")])
+
+    for workers in (2, 1):
+        result = reindex_library(research_library, max_workers=workers)
+
+        assert result.success is False
+        messages = [e.message for e in result.errors]
+        assert any(m.startswith("patterns/binary.md: ") for m in messages)
+        assert any(m.startswith("patterns/gone.md: Cannot read artifact") for m in messages)
+
+
+def test_validate_library_reports_each_artifact(research_library: Path) -> None:
+    """Every artifact gets a result; invalid ones carry their errors."""
+    (research_library / "patterns" / "draft.md").write_text("# Draft\n\nNo metadata.", encoding="utf-8")
+
+    results = {r.path: r for r in validate_library(research_library, max_workers=1)}
+
+    assert set(results) == {"patterns/draft.md", "patterns/existing.md"}
+    assert results["patterns/existing.md"].success
+    assert results["patterns/existing.md"].artifact_id == "existing-artifact-2026-01-02"
+    assert not results["patterns/draft.md"].success
+    assert results["patterns/draft.md"].errors
+
+
+def test_validate_library_shares_cache_with_reindex(reindexable_library: Path) -> None:
+    """Only artifacts whose content changed are validated again."""
+    assert not any(r.cached for r in validate_library(reindexable_library, max_workers=1))
+    assert reindex_library(reindexable_library, max_workers=1).reused == 2
+
+    artifact = reindexable_library / "roles" / "new-artifact.md"
+    artifact.write_text(artifact.read_text(encoding="utf-8").replace("New Artifact Title", "Renamed"), encoding="utf-8")
+    results = {r.path: r.cached for r in validate_library(reindexable_library, max_workers=2)}
+
+    assert results == {"patterns/existing.md": True, "roles/new-artifact.md": False}
@@ -8,6 +8,7 @@ from praxis.infrastructure.librarian import (
     Citation,
     CoverageAssessment,
     LibraryResponse,
+    LibraryStats,
     assess_coverage,
     extract_keywords,
     get_artifact_summary,
@@ -15,10 +16,6 @@ from praxis.infrastructure.librarian import (
     query_library,
 )
 
-# Project root for accessing research-library
-PROJECT_ROOT = Path(__file__).parent.parent
-RESEARCH_LIBRARY = PROJECT_ROOT / "research-library"
-
 
 class TestExtractKeywords:
     """Tests for extract_keywords function."""
@@ -67,24 +64,24 @@ class TestExtractKeywords:
 class TestGetArtifactSummary:
     """Tests for get_artifact_summary function."""
 
-    def test_existing_artifact_with_summary(self) -> None:
+    def test_existing_artifact_with_summary(self, research_library_copy: Path) -> None:
         """Returns summary for existing artifact with Executive Summary section."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         summary = get_artifact_summary("roles-rationale-2025-12-28", library_path)
 
         assert summary != ""
         assert "Praxis Roles" in summary or "normative control" in summary
 
-    def test_nonexistent_artifact(self) -> None:
+    def test_nonexistent_artifact(self, research_library_copy: Path) -> None:
         """Returns empty string for non-existent artifact."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         summary = get_artifact_summary("non-existent-id", library_path)
         assert summary == ""
 
-    def test_artifact_without_summary(self) -> None:
+    def test_artifact_without_summary(self, research_library_copy: Path) -> None:
         """Returns empty string when artifact has no Executive Summary section."""
         # This is a hypothetical test case - all current artifacts have summaries
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         # For now, we test with a non-existent artifact
         summary = get_artifact_summary("test-artifact-no-summary", library_path)
         assert summary == ""
@@ -93,9 +90,9 @@ class TestGetArtifactSummary:
 class TestAssessCoverage:
     """Tests for assess_coverage function."""
 
-    def test_good_coverage(self) -> None:
+    def test_good_coverage(self, research_library_copy: Path) -> None:
         """Returns 'good' or 'partial' coverage for well-covered topics."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         assessment = assess_coverage("roles", library_path)
 
         # Roles is a well-covered topic with many artifacts
@@ -104,18 +101,18 @@ class TestAssessCoverage:
         assert assessment.avg_relevance > 0.0
         assert assessment.reasoning != ""
 
-    def test_limited_coverage(self) -> None:
+    def test_limited_coverage(self, research_library_copy: Path) -> None:
         """Returns 'limited' or 'none' coverage for obscure topics."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         assessment = assess_coverage("quantum computing", library_path)
 
         assert assessment.level in ["limited", "none"]
         assert assessment.match_count >= 0
         assert assessment.reasoning != ""
 
-    def test_no_coverage(self) -> None:
+    def test_no_coverage(self, research_library_copy: Path) -> None:
         """Returns 'limited' or 'none' coverage for obscure topics."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         # Use a very specific non-existent topic that won't match anything
         assessment = assess_coverage("zzzqwertynonsense123", library_path)
 
@@ -123,9 +120,9 @@ class TestAssessCoverage:
         assert assessment.level in ["limited", "none", "partial"]
         assert assessment.reasoning != ""
 
-    def test_empty_query(self) -> None:
+    def test_empty_query(self, research_library_copy: Path) -> None:
         """Handles empty query gracefully."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         assessment = assess_coverage("", library_path)
 
         assert assessment.level == "none"
@@ -135,9 +132,9 @@ class TestAssessCoverage:
 class TestGetCitations:
     """Tests for get_citations function."""
 
-    def test_existing_artifact(self) -> None:
+    def test_existing_artifact(self, research_library_copy: Path) -> None:
         """Returns citation for existing artifact."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         citations = get_citations("roles-rationale-2025-12-28", library_path)
 
         assert len(citations) == 1
@@ -148,9 +145,9 @@ class TestGetCitations:
         assert citation.date == "2025-12-28"
         assert citation.path == Path("roles/rationale.md")
 
-    def test_nonexistent_artifact(self) -> None:
+    def test_nonexistent_artifact(self, research_library_copy: Path) -> None:
         """Returns empty list for non-existent artifact."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         citations = get_citations("non-existent-id", library_path)
         assert citations == []
 
@@ -158,9 +155,9 @@ class TestGetCitations:
 class TestQueryLibrary:
     """Tests for query_library function."""
 
-    def test_query_with_matching_artifacts(self) -> None:
+    def test_query_with_matching_artifacts(self, research_library_copy: Path) -> None:
         """Returns response with sources for matching query."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         response = query_library("What are praxis roles?", library_path)
 
         assert response.query == "What are praxis roles?"
@@ -168,9 +165,9 @@ class TestQueryLibrary:
         assert len(response.sources) >= 1
         assert response.summary != ""
 
-    def test_query_with_no_matches(self) -> None:
+    def test_query_with_no_matches(self, research_library_copy: Path) -> None:
         """Returns response with no sources for non-matching query."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         response = query_library("quantum computing breakthroughs", library_path)
 
         assert response.query == "quantum computing breakthroughs"
@@ -178,9 +175,9 @@ class TestQueryLibrary:
         # May have sources with low relevance or none
         assert response.summary == "" or len(response.sources) >= 0
 
-    def test_empty_query(self) -> None:
+    def test_empty_query(self, research_library_copy: Path) -> None:
         """Handles empty query gracefully."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         response = query_library("", library_path)
 
         assert response.query == ""
@@ -188,9 +185,9 @@ class TestQueryLibrary:
         assert response.summary == ""
         assert response.sources == []
 
-    def test_query_response_structure(self) -> None:
+    def test_query_response_structure(self, research_library_copy: Path) -> None:
         """Response has all required fields."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         response = query_library("roles", library_path)
 
         assert isinstance(response, LibraryResponse)
@@ -200,9 +197,9 @@ class TestQueryLibrary:
         assert isinstance(response.sources, list)
         assert isinstance(response.gaps, list)
 
-    def test_sources_are_citations(self) -> None:
+    def test_sources_are_citations(self, research_library_copy: Path) -> None:
         """Sources are Citation objects."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         response = query_library("praxis roles", library_path)
 
         for source in response.sources:
@@ -212,20 +209,47 @@ class TestQueryLibrary:
             assert isinstance(source.consensus, str)
             assert isinstance(source.date, str)
 
+    def test_query_parses_catalog_once(self, research_library_copy: Path) -> None:
+        """One catalog load per query; artifact reads bounded by the top matches."""
+        library_path = research_library_copy
+        response = query_library("What are praxis roles?", library_path)
+
+        assert isinstance(response.stats, LibraryStats)
+        assert response.stats.catalog_parses == 1
+        assert response.stats.file_reads <= len(response.sources) <= 3
+
+    def test_repeated_query_reads_no_files(self, research_library_copy: Path) -> None:
+        """Summaries of the cited artifacts come from the summary cache the second time."""
+        library_path = research_library_copy
+        first = query_library("What are praxis roles?", library_path)
+        second = query_library("What are praxis roles?", library_path, use_cache=False)
+
+        assert second.stats.file_reads == 0
+        assert not second.stats.cache_hit
+        assert second.summary == first.summary
+
+    def test_query_with_no_matches_reads_no_files(self, research_library_copy: Path) -> None:
+        """A query with no coverage never opens an artifact."""
+        library_path = research_library_copy
+        response = query_library("zzzqwertynonsense123", library_path)
+
+        assert response.stats.catalog_parses == 1
+        assert response.stats.file_reads == 0
+
 
 class TestCoverageThresholds:
     """Tests for coverage level thresholds."""
 
-    def test_coverage_level_type(self) -> None:
+    def test_coverage_level_type(self, research_library_copy: Path) -> None:
         """Coverage level is one of the allowed values."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         assessment = assess_coverage("roles", library_path)
 
         assert assessment.level in ["good", "partial", "limited", "none"]
 
-    def test_good_coverage_criteria(self) -> None:
+    def test_good_coverage_criteria(self, research_library_copy: Path) -> None:
         """Good coverage requires 3+ matches with avg relevance >= 0.6."""
-        library_path = RESEARCH_LIBRARY
+        library_path = research_library_copy
         # "roles" should have good coverage
         assessment = assess_coverage("roles scrum praxis", library_path)
 
@@ -0,0 +1,35 @@
+"""Smoke tests for the library benchmark suite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from benchmarks.library import compare_results, generate_library, run_benchmarks
+from praxis.application.cataloging_service import find_orphans, validate_metadata
+from praxis.infrastructure.librarian import parse_catalog
+
+
+def test_generated_library_is_valid(tmp_path: Path) -> None:
+    """Synthetic artifacts validate and match the rendered catalog."""
+    entries = generate_library(tmp_path, 20)
+
+    assert [a["id"] for a in parse_catalog(tmp_path / "CATALOG.md")] == [e.id for e in entries]
+    assert all(validate_metadata(tmp_path / e.path).success for e in entries[:5])
+    assert find_orphans(tmp_path) == []
+
+
+def test_run_benchmarks_times_every_operation(tmp_path: Path) -> None:
+    """Results cover each operation and compare against themselves."""
+    results = run_benchmarks([10], repeat=1, workdir=tmp_path)
+
+    operations = results["sizes"]["10"]["operations"]
+    assert set(operations) == {
+        "search_library",
+        "query_library",
+        "query_library_cached",
+        "update_catalog",
+        "find_orphans",
+        "check_stale",
+    }
+    assert all(timing["warm_median_s"] >= 0 for timing in operations.values())
+    assert len(compare_results(results, results)) == 6
@@ -0,0 +1,452 @@
+"""Unit tests for the persistent library index."""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from textwrap import dedent
+from typing import Any
+
+import pytest
+
+from praxis.infrastructure.librarian import (
+    find_similar_artifacts,
+    get_citations,
+    parse_catalog,
+    query_library,
+    search_library,
+    search_library_fulltext,
+    search_library_fuzzy,
+)
+from praxis.infrastructure.library_index import (
+    CATALOG_INDEX_FILE,
+    TOPIC_SHARD_DIR,
+    QueryCache,
+    SummaryCache,
+    get_index_dir,
+    load_fulltext_index,
+    load_library_index,
+    load_summary_cache,
+    load_topic_index,
+    query_cache_key,
+    save_library_index,
+    save_summary_cache,
+)
+from praxis.infrastructure.text_index import FulltextDocument, FulltextIndex
+
+CATALOG = dedent("""\
+    # Research Library Catalog
+
+    _Last updated: 2026-01-02_
+    _Total artifacts: 2_
+
+    ---
+
+    ## Quick Reference
+
+    | ID | Title | Topic | Consensus | Date |
+    |----|-------|-------|-----------|------|
+    | [patterns-hexagonal-2026-01-02](patterns/hexagonal.md) | Hexagonal Architecture | patterns | High | 2026-01-02 |
+    | [roles-scrum-2026-01-01](roles/scrum.md) | Scrum Master Role | roles | Medium | 2026-01-01 |
+
+    ---
+
+    ## By Topic
+
+    ### Patterns
+
+    | ID | Title | Consensus | Keywords |
+    |----|-------|-----------|----------|
+    | [patterns-hexagonal-2026-01-02](patterns/hexagonal.md) | Hexagonal Architecture | High | ports, adapters, ddd |
+
+    ### Roles
+
+    | ID | Title | Consensus | Keywords |
+    |----|-------|-----------|----------|
+    | [roles-scrum-2026-01-01](roles/scrum.md) | Scrum Master Role | Medium | scrum-master, facilitation |
+
+    ---
+""")
+
+
+@pytest.fixture
+def catalog_path(tmp_path: Path) -> Path:
+    """Create a small CATALOG.md."""
+    path = tmp_path / "CATALOG.md"
+    path.write_text(CATALOG, encoding="utf-8")
+    return path
+
+
+def test_parse_catalog_ignores_by_topic_rows(catalog_path: Path) -> None:
+    """Only Quick Reference rows become artifacts; keywords come from every topic."""
+    artifacts = parse_catalog(catalog_path)
+
+    assert [a["id"] for a in artifacts] == ["patterns-hexagonal-2026-01-02", "roles-scrum-2026-01-01"]
+    assert artifacts[0]["keywords"] == ["ports", "adapters", "ddd"]
+    assert artifacts[1]["keywords"] == ["scrum-master", "facilitation"]
+
+
+def test_load_builds_and_persists_index(catalog_path: Path) -> None:
+    """First load writes the index next to the catalog."""
+    index = load_library_index(catalog_path)
+
+    assert index is not None
+    assert (get_index_dir(catalog_path) / CATALOG_INDEX_FILE).exists()
+    assert index.get("roles-scrum-2026-01-01")["title"] == "Scrum Master Role"
+    assert index.terms["ports"] == [index.by_id["patterns-hexagonal-2026-01-02"]]
+
+
+def test_concurrent_saves_never_share_a_temp_file(catalog_path: Path) -> None:
+    """Parallel writers each rename their own complete file into place."""
+    index = load_library_index(catalog_path)
+    assert index is not None
+    index_path = get_index_dir(catalog_path) / CATALOG_INDEX_FILE
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: save_library_index(index, index_path), range(32)))
+
+    assert json.loads(index_path.read_text(encoding="utf-8"))["version"]
+    assert not [p for p in index_path.parent.iterdir() if p.name.endswith(".tmp")]
+
+
+def test_load_reuses_persisted_index(catalog_path: Path) -> None:
+    """An unchanged catalog is served from the index without parsing."""
+    load_library_index(catalog_path)
+    index_file = get_index_dir(catalog_path) / CATALOG_INDEX_FILE
+    before = index_file.stat().st_mtime_ns
+
+    index = load_library_index(catalog_path)
+
+    assert index is not None
+    assert index_file.stat().st_mtime_ns == before
+
+
+def test_load_rebuilds_when_catalog_changes(catalog_path: Path) -> None:
+    """Editing the catalog invalidates the index."""
+    load_library_index(catalog_path)
+    catalog_path.write_text(CATALOG.replace("Scrum Master Role", "Product Owner Role"), encoding="utf-8")
+
+    index = load_library_index(catalog_path)
+
+    assert index is not None
+    assert index.get("roles-scrum-2026-01-01")["title"] == "Product Owner Role"
+    assert "owner" in index.terms
+
+
+def test_touched_catalog_keeps_index_by_hash(catalog_path: Path) -> None:
+    """A catalog whose mtime changed but content didn't only refreshes the fingerprint."""
+    first = load_library_index(catalog_path)
+    stat = catalog_path.stat()
+    os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+    second = load_library_index(catalog_path)
+
+    assert first is not None and second is not None
+    assert second.fingerprint.sha256 == first.fingerprint.sha256
+    assert second.fingerprint.mtime_ns != first.fingerprint.mtime_ns
+
+
+def test_load_missing_catalog(tmp_path: Path) -> None:
+    """Missing catalog yields no index."""
+    assert load_library_index(tmp_path / "CATALOG.md") is None
+
+
+def test_search_uses_index_candidates(catalog_path: Path) -> None:
+    """Search matches exact and partial terms through the index."""
+    assert [m.id for m in search_library("ports", catalog_path)] == ["patterns-hexagonal-2026-01-02"]
+    assert [m.id for m in search_library("scrum", catalog_path)] == ["roles-scrum-2026-01-01"]
+    assert search_library("zzznothing", catalog_path) == []
+
+
+def test_candidates_match_vocabulary_scan_without_scanning(catalog_path: Path) -> None:
+    """Partial matches either way round are found through term grams, not by iterating the terms.
+
+    Short terms only match indexed terms inside them.
+    """
+
+    class NoScan(dict[str, list[int]]):
+        def items(self) -> Any:
+            raise AssertionError("vocabulary scanned")
+
+    index = load_library_index(catalog_path)
+    assert index is not None
+    expected = {
+        term: {
+            position
+            for indexed_term, postings in index.terms.items()
+            if (len(term) > 2 and term in indexed_term) or indexed_term in term
+            for position in postings
+        }
+        for term in ["ports", "dapt", "sc", "d", "hexagonal-architecture", "scrum-master-role", "zzz"]
+    }
+    index.terms = NoScan(index.terms)
+
+    assert {term: index.candidates(term) for term in expected} == expected
+    assert index.candidates("DAPT") == expected["dapt"]
+    assert index.candidates("dapt") == {0}
+    assert index.candidates("sc") == set()
+
+
+@pytest.fixture
+def library_with_bodies(catalog_path: Path) -> Path:
+    """Add artifact bodies to the catalog fixture."""
+    library = catalog_path.parent
+    (library / "patterns").mkdir()
+    (library / "roles").mkdir()
+    (library / "patterns" / "hexagonal.md").write_text(
+        "# Hexagonal\n\nPorts isolate the domain. Ports and adapters keep infrastructure outside.\n",
+        encoding="utf-8",
+    )
+    (library / "roles" / "scrum.md").write_text(
+        "# Scrum Master\n\nThe scrum master coaches the team. Adapters are not discussed.\n",
+        encoding="utf-8",
+    )
+    return library
+
+
+def test_fulltext_search_ranks_bodies(catalog_path: Path, library_with_bodies: Path) -> None:
+    """Body terms are matched and ranked, best match normalized to 1.0."""
+    matches = search_library_fulltext("ports adapters", catalog_path)
+
+    assert [m.id for m in matches] == ["patterns-hexagonal-2026-01-02", "roles-scrum-2026-01-01"]
+    assert matches[0].relevance_score == 1.0
+    assert matches[1].relevance_score < 1.0
+
+
+def test_fulltext_search_topic_filter(catalog_path: Path, library_with_bodies: Path) -> None:
+    """Topic filter applies to full-text results."""
+    matches = search_library_fulltext("adapters", catalog_path, topic_filter="roles")
+    assert [m.id for m in matches] == ["roles-scrum-2026-01-01"]
+
+
+def test_fulltext_index_retokenizes_only_changed_files(catalog_path: Path, library_with_bodies: Path) -> None:
+    """Unchanged artifacts keep their stored statistics; edited ones are refreshed."""
+    index = load_library_index(catalog_path)
+    assert index is not None
+    first = load_fulltext_index(library_with_bodies, index)
+    assert "coaches" in first.postings
+
+    scrum = library_with_bodies / "roles" / "scrum.md"
+    scrum.write_text("# Scrum Master\n\nFacilitates retrospectives.\n", encoding="utf-8")
+    second = load_fulltext_index(library_with_bodies, index)
+
+    assert "coaches" not in second.postings
+    assert second.postings["retrospectives"] == {"roles-scrum-2026-01-01": 1}
+    assert second.postings["ports"] == first.postings["ports"]
+
+
+def test_dated_range_and_topic(catalog_path: Path) -> None:
+    """Date queries are half-open ranges over the date-ordered list."""
+    index = load_library_index(catalog_path)
+    assert index is not None
+
+    assert [a["id"] for a in index.dated()] == ["roles-scrum-2026-01-01", "patterns-hexagonal-2026-01-02"]
+    assert [a["id"] for a in index.dated(before="2026-01-02")] == ["roles-scrum-2026-01-01"]
+    assert [a["id"] for a in index.dated(after="2026-01-02")] == ["patterns-hexagonal-2026-01-02"]
+    assert [a["id"] for a in index.dated(topic="Patterns")] == ["patterns-hexagonal-2026-01-02"]
+    assert index.dated(after="2026-01-02", before="2026-01-02") == []
+    assert index.dated(topic="missing") == []
+
+    # The date order survives persistence
+    reloaded = load_library_index(catalog_path)
+    assert reloaded is not None and reloaded.by_date == index.by_date
+
+
+def test_summary_cache_lru_and_stat_validation() -> None:
+    """Entries are only served for a matching stat; the least recently used is evicted."""
+    cache = SummaryCache(max_entries=2)
+    cache.put("a.md", 1, 10, "A")
+    cache.put("b.md", 1, 10, "B")
+
+    assert cache.get("a.md", 1, 10) == "A"
+    assert cache.get("a.md", 2, 10) is None
+
+    cache.put("c.md", 1, 10, "C")
+    assert list(cache.entries) == ["a.md", "c.md"]
+
+
+def test_summary_cache_persists(tmp_path: Path) -> None:
+    """A saved cache is loaded back in LRU order."""
+    cache = SummaryCache()
+    cache.put("b.md", 1, 10, "B")
+    cache.put("a.md", 1, 10, "A")
+    save_summary_cache(cache, tmp_path)
+
+    loaded = load_summary_cache(tmp_path)
+
+    assert list(loaded.entries) == ["b.md", "a.md"]
+    assert loaded.get("a.md", 1, 10) == "A"
+    assert not loaded.changed
+
+
+def test_get_citations_uses_summary_cache(catalog_path: Path, library_with_bodies: Path) -> None:
+    """Citing reads the artifact once, then serves the cached summary until it changes."""
+    hexagonal = library_with_bodies / "patterns" / "hexagonal.md"
+    hexagonal.write_text("# Hexagonal\n\n## Executive Summary\n\nPorts first.\n", encoding="utf-8")
+
+    assert get_citations("patterns-hexagonal-2026-01-02", library_with_bodies)[0].key_finding == "Ports first."
+    cached = load_summary_cache(library_with_bodies)
+    assert cached.entries["patterns/hexagonal.md"][2] == "Ports first."
+
+    hexagonal.write_text("# Hexagonal\n\n## Executive Summary\n\nAdapters second.\n", encoding="utf-8")
+    assert get_citations("patterns-hexagonal-2026-01-02", library_with_bodies)[0].key_finding == "Adapters second."
+
+
+def test_fuzzy_search_tolerates_typos(catalog_path: Path) -> None:
+    """Misspelled terms find artifacts through trigram similarity."""
+    assert search_library("hexagnal", catalog_path) == []
+
+    matches = search_library_fuzzy("hexagnal", catalog_path)
+
+    assert [m.id for m in matches] == ["patterns-hexagonal-2026-01-02"]
+    assert 0.3 <= matches[0].relevance_score < 1.0
+    assert search_library_fuzzy("facilitaton", catalog_path, topic_filter="patterns") == []
+
+
+def test_similar_words_only_scores_trigram_neighbours(catalog_path: Path) -> None:
+    """Candidates come from trigram postings, not a scan of every word."""
+    index = load_library_index(catalog_path)
+    assert index is not None
+
+    similar = index.similar_words("adaptors")
+
+    assert set(similar) == {"adapters"}
+    assert index.similar_words("zzzz") == {}
+    assert all(word in index.words for postings in index.trigrams.values() for word in postings)
+
+
+def test_tfidf_similarity_ranks_by_cosine() -> None:
+    """Identical texts score 1.0; texts sharing only common terms score lower."""
+    index = FulltextIndex()
+    index.add("a", FulltextDocument("a.md", 0, 0, 0), ["ports", "adapters", "domain", "domain"])
+    index.add("b", FulltextDocument("b.md", 0, 0, 0), ["scrum", "master", "domain"])
+    index.add("c", FulltextDocument("c.md", 0, 0, 0), ["kanban", "flow"])
+
+    similar = index.similar(["ports", "adapters", "domain", "domain"])
+
+    assert [artifact_id for artifact_id, _ in similar] == ["a", "b"]
+    assert similar[0][1] == pytest.approx(1.0)
+    assert 0 < similar[1][1] < 0.5
+    assert index.similar(["ports"], exclude={"a"}) == []
+
+    # Norms are recomputed after the corpus changes
+    index.remove("a")
+    assert [artifact_id for artifact_id, _ in index.similar(["ports", "domain"])] == ["b"]
+
+
+def test_fulltext_remove_touches_only_document_terms() -> None:
+    """Removing a document drops its postings, for loaded and freshly built indexes alike."""
+    loaded = FulltextIndex(
+        documents={"a": FulltextDocument("a.md", 0, 0, 2), "b": FulltextDocument("b.md", 0, 0, 2)},
+        postings={"ports": {"a": 1, "b": 1}, "domain": {"a": 1}, "flow": {"b": 1}},
+    )
+    loaded.remove("a")
+    assert loaded.postings == {"ports": {"b": 1}, "flow": {"b": 1}}
+
+    loaded.add("a", FulltextDocument("a.md", 1, 0, 0), ["kanban", "ports"])
+    loaded.remove("b")
+    assert loaded.postings == {"ports": {"a": 1}, "kanban": {"a": 1}}
+
+    loaded.remove("missing")
+    assert set(loaded.documents) == {"a"}
+
+
+def test_find_similar_artifacts_excludes_own_file(catalog_path: Path, library_with_bodies: Path) -> None:
+    """A cataloged artifact is compared against the others, not itself."""
+    text = (library_with_bodies / "patterns" / "hexagonal.md").read_text(encoding="utf-8")
+
+    assert find_similar_artifacts(text, catalog_path)[0].id == "patterns-hexagonal-2026-01-02"
+    others = find_similar_artifacts(text, catalog_path, exclude_path=Path("patterns/hexagonal.md"), min_score=0.0)
+    assert [m.id for m in others] == ["roles-scrum-2026-01-01"]
+
+
+def test_query_cache_lru_and_ttl() -> None:
+    """Expired entries are dropped on lookup; the least recently used is evicted."""
+    cache = QueryCache("sha", max_entries=2, ttl=60)
+    cache.put("a", {"n": 1}, now=0)
+    cache.put("b", {"n": 2}, now=30)
+
+    assert cache.get("a", now=59) == {"n": 1}
+    assert cache.get("a", now=61) is None
+    assert "a" not in cache.entries
+
+    cache.put("c", {"n": 3}, now=30)
+    cache.put("d", {"n": 4}, now=30)
+    assert list(cache.entries) == ["c", "d"]
+
+
+def test_query_cache_key_normalizes_keywords() -> None:
+    """Word order and repetition don't matter; options do."""
+    assert query_cache_key(["ports", "adapters", "ports"], fuzzy=False) == query_cache_key(
+        ["adapters", "ports"], fuzzy=False
+    )
+    assert query_cache_key(["ports"], fuzzy=True) != query_cache_key(["ports"], fuzzy=False)
+
+
+def test_query_cache_hits_until_catalog_changes(catalog_path: Path, library_with_bodies: Path) -> None:
+    """Rephrased questions with the same keywords hit; a catalog edit invalidates."""
+    first = query_library("What about ports?", library_with_bodies)
+    second = query_library("Ports - what about?", library_with_bodies)
+
+    assert not first.stats.cache_hit
+    assert second.stats.cache_hit
+    assert second.stats.file_reads == 0
+    assert second.query == "Ports - what about?"
+    assert [s.artifact_id for s in second.sources] == [s.artifact_id for s in first.sources]
+    assert second.sources[0].path == first.sources[0].path
+
+    catalog_path.write_text(CATALOG.replace("Hexagonal Architecture", "Hexagonal Design"), encoding="utf-8")
+    third = query_library("What about ports?", library_with_bodies)
+
+    assert not third.stats.cache_hit
+    assert third.sources[0].title == "Hexagonal Design"
+
+
+def test_query_cache_misses_when_a_cited_artifact_changes(library_with_bodies: Path) -> None:
+    """Editing a cited body refreshes the answer though the catalog is unchanged."""
+    first = query_library("What about ports?", library_with_bodies)
+    (library_with_bodies / "patterns" / "hexagonal.md").write_text(
+        "# Hexagonal\n\n## Executive Summary\n\nPorts now come first.\n",
+        encoding="utf-8",
+    )
+
+    second = query_library("What about ports?", library_with_bodies)
+    third = query_library("What about ports?", library_with_bodies)
+
+    assert not first.stats.cache_hit
+    assert not second.stats.cache_hit
+    assert "Ports now come first." in second.summary
+    assert third.stats.cache_hit
+    assert third.summary == second.summary
+
+
+def test_topic_search_loads_only_its_shard(catalog_path: Path) -> None:
+    """With current shards, a topic search never reads the catalog index."""
+    load_library_index(catalog_path)
+    shard_dir = get_index_dir(catalog_path) / TOPIC_SHARD_DIR
+    assert sorted(p.name for p in shard_dir.iterdir()) == ["patterns.json", "roles.json"]
+    (get_index_dir(catalog_path) / CATALOG_INDEX_FILE).unlink()
+
+    matches = search_library("scrum facilitation", catalog_path, topic_filter="roles")
+
+    assert [m.id for m in matches] == ["roles-scrum-2026-01-01"]
+    assert not (get_index_dir(catalog_path) / CATALOG_INDEX_FILE).exists()
+    assert search_library("ports", catalog_path, topic_filter="roles") == []
+
+
+def test_topic_shards_follow_catalog_changes(catalog_path: Path) -> None:
+    """A changed catalog rebuilds the shards; topics that disappear lose theirs."""
+    load_library_index(catalog_path)
+    catalog_path.write_text(
+        CATALOG.replace("| roles |", "| patterns |").replace("### Roles", "### Patterns"), encoding="utf-8"
+    )
+
+    patterns = load_topic_index(catalog_path, "Patterns")
+
+    assert patterns is not None
+    assert sorted(patterns.by_id) == ["patterns-hexagonal-2026-01-02", "roles-scrum-2026-01-01"]
+    assert [p.name for p in (get_index_dir(catalog_path) / TOPIC_SHARD_DIR).iterdir()] == ["patterns.json"]
+    empty = load_topic_index(catalog_path, "roles")
+    assert empty is not None and empty.artifacts == []
@@ -0,0 +1,446 @@
+"""Unit tests for opinions resolution."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from praxis.application import opinions_service
+from praxis.application.opinions_service import (
+    compute_opinions_delta,
+    compute_resolution_chain,
+    format_delta_prompt,
+    format_matrix_json,
+    opinion_combinations,
+    opinion_content_hash,
+    resolve_opinions,
+    resolve_opinions_many,
+    search_opinions,
+    warm_opinions_cache,
+    write_matrix_prompts,
+)
+from praxis.domain.opinions import OpinionFile
+from praxis.domain.workspace import ExtensionContributions, ExtensionManifest, OpinionContribution
+from praxis.infrastructure import opinions_index, opinions_loader
+from praxis.infrastructure.opinions_cache import get_opinions_cache_dir
+from praxis.infrastructure.opinions_loader import (
+    build_opinions_tree,
+    build_opinions_tree_with_extensions,
+    discover_opinions,
+    merge_opinions_with_extensions,
+    opinion_sources,
+    parse_frontmatter,
+    read_opinion,
+)
+
+FRONTMATTER = "---\nversion: '1.0'\nstatus: active\n---\n"
+
+
+def _write(root: Path, relative: str, body: str = "Guidance.") -> None:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{FRONTMATTER}\n# {relative}\n\n{body}\n", encoding="utf-8")
+
+
+@pytest.fixture
+def opinions_root(tmp_path: Path) -> Path:
+    """Opinions tree with a code chain plus unrelated domains and stages."""
+    root = tmp_path / "opinions"
+    for relative in [
+        "_shared/first-principles.md",
+        "code/README.md",
+        "code/principles.md",
+        "code/capture.md",
+        "code/execute.md",
+        "code/subtypes/cli/README.md",
+        "write/README.md",
+        "write/principles.md",
+        "_templates/domain.md",
+    ]:
+        _write(root, relative)
+    return root
+
+
+def _manifest(name: str, *targets: str) -> ExtensionManifest:
+    return ExtensionManifest(
+        manifest_version="0.1",
+        name=name,
+        contributions=ExtensionContributions(
+            opinions=[OpinionContribution(source=f"opinions/{t}", target=t) for t in targets]
+        ),
+    )
+
+
+def test_resolve_loads_only_chain_files(opinions_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Files off the resolution chain are never opened."""
+    monkeypatch.delenv("PRAXIS_HOME", raising=False)
+    loaded: list[str] = []
+    original = opinions_loader.load_opinion_file
+
+    def spy(root: Path, relative_path: str, *args: Any) -> OpinionFile:
+        loaded.append(relative_path)
+        return original(root, relative_path, *args)
+
+    monkeypatch.setattr(opinions_loader, "load_opinion_file", spy)
+    resolved = resolve_opinions("code", "capture", "cli", opinions_root=opinions_root)
+
+    assert resolved.file_paths == [
+        "_shared/first-principles.md",
+        "code/README.md",
+        "code/principles.md",
+        "code/capture.md",
+        "code/subtypes/cli/README.md",
+    ]
+    assert set(loaded) <= set(compute_resolution_chain("code", "capture", "cli"))
+
+
+def test_merge_for_paths_reads_only_matching_contributions(opinions_root: Path, tmp_path: Path) -> None:
+    """Contributions that target other paths are skipped; core still wins conflicts."""
+    extension = tmp_path / "mobile-pack"
+    _write(extension, "opinions/code/subtypes/mobile/README.md", "Mobile.")
+    _write(extension, "opinions/code/principles.md", "Override.")
+    manifest = _manifest(
+        "mobile-pack",
+        "code/subtypes/mobile/README.md",
+        "code/principles.md",
+        "write/missing.md",
+    )
+
+    merged, warnings = merge_opinions_with_extensions(
+        opinions_root,
+        [(extension, manifest)],
+        paths={"code/principles.md", "code/subtypes/mobile/README.md"},
+    )
+
+    assert set(merged) == {"code/principles.md", "code/subtypes/mobile/README.md"}
+    assert merged["code/principles.md"].source == "core"
+    assert merged["code/subtypes/mobile/README.md"].source == "mobile-pack"
+    assert warnings == [
+        "Extension 'mobile-pack' attempted to contribute 'code/principles.md' but core version takes precedence"
+    ]
+
+
+def test_merge_for_paths_matches_full_merge(opinions_root: Path, tmp_path: Path) -> None:
+    """Restricting to the chain gives the same files as merging the whole tree."""
+    extension = tmp_path / "cli-pack"
+    _write(extension, "opinions/code/subtypes/cli/principles.md", "CLI.")
+    manifests = [(extension, _manifest("cli-pack", "code/subtypes/cli/principles.md"))]
+    chain = compute_resolution_chain("code", "execute", "cli")
+
+    full, _ = merge_opinions_with_extensions(opinions_root, manifests)
+    partial, _ = merge_opinions_with_extensions(opinions_root, manifests, paths=set(chain))
+
+    assert partial == {path: full[path] for path in chain if path in full}
+
+
+@pytest.fixture
+def project(opinions_root: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Project directory containing the opinions tree, without a workspace."""
+    monkeypatch.delenv("PRAXIS_HOME", raising=False)
+    return opinions_root.parent
+
+
+def _count_merges(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    original = opinions_service.merge_opinions_with_extensions
+
+    def spy(*args: Any, **kwargs: Any) -> Any:
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(opinions_service, "merge_opinions_with_extensions", spy)
+    return calls
+
+
+def test_resolved_bundle_is_cached(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A second resolution is served from .praxis/cache/opinions without loading files."""
+    first = resolve_opinions("code", "capture", "cli", start_path=project, use_cache=True)
+    merges = _count_merges(monkeypatch)
+    second = resolve_opinions("code", "capture", "cli", start_path=project, use_cache=True)
+
+    assert merges == []
+    assert second == first
+    assert len(list(get_opinions_cache_dir(project).glob("*.json"))) == 1
+    assert (project / ".praxis" / "cache" / ".gitignore").read_text() == "*\n"
+
+
+def test_cached_bundle_tracks_source_changes(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Edits and new chain files invalidate a bundle; touching a file does not."""
+    resolve_opinions("code", "capture", "cli", start_path=project, use_cache=True)
+    merges = _count_merges(monkeypatch)
+
+    readme = project / "opinions" / "code" / "README.md"
+    os.utime(readme, ns=(0, 0))
+    resolve_opinions("code", "capture", "cli", start_path=project, use_cache=True)
+    assert merges == []
+
+    _write(project / "opinions", "code/README.md", "Edited.")
+    edited = resolve_opinions("code", "capture", "cli", start_path=project, use_cache=True)
+    assert merges == [1]
+    assert edited.files[1].content is not None and "Edited." in edited.files[1].content
+
+    _write(project / "opinions", "code/subtypes/cli/capture.md")
+    added = resolve_opinions("code", "capture", "cli", start_path=project, use_cache=True)
+    assert merges == [1, 1]
+    assert added.file_paths[-1] == "code/subtypes/cli/capture.md"
+
+
+def test_resolution_does_not_cache_by_default(project: Path) -> None:
+    """Library callers don't write a cache into the project they resolve for."""
+    resolve_opinions("code", "capture", "cli", start_path=project)
+
+    assert not (project / ".praxis").exists()
+
+
+def test_warm_cache_covers_every_combination(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Warming resolves every combination once; later resolutions hit the cache."""
+    count, cache_dir = warm_opinions_cache(project)
+
+    assert cache_dir == get_opinions_cache_dir(project)
+    assert count == len(list(cache_dir.glob("*.json")))
+    assert ("code", "execute", "cli") in opinion_combinations(project / "opinions", [])
+
+    merges = _count_merges(monkeypatch)
+    resolve_opinions("code", "execute", "library", start_path=project, use_cache=True)
+    resolve_opinions("write", None, None, start_path=project, use_cache=True)
+    assert merges == []
+
+
+def test_read_opinion_stops_at_frontmatter(tmp_path: Path) -> None:
+    """Metadata-only reads never touch the body."""
+    path = tmp_path / "opinion.md"
+    body = b"\n# Title\n\n" + b"Guidance.\n" * 10_000 + b"\xff not utf-8\n"
+    path.write_bytes(FRONTMATTER.encode() + body)
+
+    frontmatter, content, error = read_opinion(path, with_content=False)
+
+    assert frontmatter is not None and frontmatter.version == "1.0"
+    assert content is None and error is None
+    with pytest.raises(UnicodeDecodeError):
+        read_opinion(path)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        FRONTMATTER + "\n# Body\n",
+        "---\nversion: '1.0'\n---\nbody\n",
+        "---\nversion: [unclosed\n---\nbody\n",
+        "---\n- not a mapping\n---\nbody\n",
+        "---\nversion: '1.0'\nstatus: active\n---",
+        "# No frontmatter\n\n---\n",
+    ],
+)
+def test_read_opinion_matches_parse_frontmatter(tmp_path: Path, text: str) -> None:
+    """The streaming reader agrees with parsing the whole file."""
+    path = tmp_path / "opinion.md"
+    path.write_text(text, encoding="utf-8")
+    frontmatter, body, error = parse_frontmatter(text)
+
+    assert read_opinion(path) == (frontmatter, body.strip() if body else None, error)
+
+
+def test_tree_with_extensions_reads_metadata_only(opinions_root: Path, tmp_path: Path) -> None:
+    """Listing an extension-augmented tree does not load opinion bodies."""
+    extension = tmp_path / "mobile-pack"
+    _write(extension, "opinions/code/subtypes/mobile/README.md", "Mobile.")
+    manifest = _manifest("mobile-pack", "code/subtypes/mobile/README.md")
+
+    tree = build_opinions_tree_with_extensions(opinions_root, [(extension, manifest)])
+    merged, _ = merge_opinions_with_extensions(opinions_root, [(extension, manifest)], with_content=False)
+
+    assert tree.provenance["code/subtypes/mobile/README.md"] == "mobile-pack"
+    assert all(opinion.content is None and opinion.frontmatter is not None for opinion in merged.values())
+
+
+def test_inventory_prunes_skipped_directories(opinions_root: Path) -> None:
+    """Templates and other underscore directories are never listed."""
+    _write(opinions_root, "code/_templates/stage.md")
+    _write(opinions_root, "_drafts/idea.md")
+
+    inventory = discover_opinions(opinions_root)
+
+    assert "code/_templates/stage.md" not in inventory.paths
+    assert not any(path.startswith(("_templates/", "_drafts/")) for path in inventory.paths)
+    assert inventory.paths == tuple(sorted(inventory.paths))
+    assert build_opinions_tree(opinions_root).total_files == len(inventory.paths) == 8
+
+
+def test_inventory_is_walked_once_per_process(opinions_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tree and merge share one walk until a directory changes."""
+    scans: list[Path] = []
+    original = opinions_loader._scan_opinions
+
+    def spy(root: Path) -> Any:
+        scans.append(root)
+        return original(root)
+
+    monkeypatch.setattr(opinions_loader, "_scan_opinions", spy)
+    build_opinions_tree(opinions_root)
+    merged, _ = merge_opinions_with_extensions(opinions_root, [])
+    assert len(scans) == 1
+    assert set(merged) == set(discover_opinions(opinions_root).paths)
+
+    new_dir = opinions_root / "code" / "subtypes" / "api"
+    _write(opinions_root, "code/subtypes/api/README.md")
+    # Pin the changed directory's mtime so coarse timestamps cannot hide it
+    os.utime(new_dir.parent, ns=(1, 1))
+    assert "code/subtypes/api/README.md" in discover_opinions(opinions_root).paths
+    assert len(scans) == 2
+
+
+def test_resolve_many_reads_each_file_once(opinions_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A batch matches one-by-one resolution while opening each file at most once."""
+    monkeypatch.delenv("PRAXIS_HOME", raising=False)
+    combinations = [("code", stage, subtype) for stage in (None, "capture", "execute") for subtype in (None, "cli")]
+    expected = [resolve_opinions(*c, opinions_root=opinions_root, use_cache=False) for c in combinations]
+
+    opened: list[str] = []
+    original = opinions_loader._read_header
+
+    def spy(handle: Any) -> Any:
+        opened.append(handle.name)
+        return original(handle)
+
+    monkeypatch.setattr(opinions_loader, "_read_header", spy)
+    bundles = resolve_opinions_many(combinations, opinions_root=opinions_root)
+
+    assert bundles == expected
+    assert len(opened) == len(set(opened)) == 6
+
+
+def test_matrix_exports(opinions_root: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A matrix is written as one JSON document or one prompt file per bundle."""
+    monkeypatch.delenv("PRAXIS_HOME", raising=False)
+    bundles = resolve_opinions_many([("code", "capture", None), ("write", None, "technical")], opinions_root)
+
+    document = format_matrix_json(bundles)
+    written = write_matrix_prompts(bundles, tmp_path / "ctx")
+
+    assert document["count"] == 2
+    assert document["bundles"][0]["files"][0]["path"] == "_shared/first-principles.md"
+    assert "# Praxis Opinions Context" in document["bundles"][1]["prompt"]
+    assert [p.name for p in written] == ["code-capture-_.md", "write-_-technical.md"]
+    assert written[1].read_text(encoding="utf-8") == document["bundles"][1]["prompt"]
+
+
+def test_delta_between_stages(opinions_root: Path) -> None:
+    """Only files that differ between the chains carry content."""
+    _write(opinions_root, "code/subtypes/cli/execute.md", "Ship it.")
+    capture, execute = resolve_opinions_many([("code", "capture", "cli"), ("code", "execute", "cli")], opinions_root)
+
+    delta = compute_opinions_delta(capture, execute)
+
+    assert [(f.path, f.change) for f in delta.files] == [
+        ("_shared/first-principles.md", "unchanged"),
+        ("code/README.md", "unchanged"),
+        ("code/principles.md", "unchanged"),
+        ("code/execute.md", "added"),
+        ("code/subtypes/cli/README.md", "unchanged"),
+        ("code/subtypes/cli/execute.md", "added"),
+        ("code/capture.md", "removed"),
+    ]
+    assert all(f.content is None for f in delta.with_change("unchanged"))
+    assert delta.files[0].sha256 == opinion_content_hash(capture.files[0])
+
+    prompt, _ = format_delta_prompt(delta)
+    assert "Ship it." in prompt
+    assert "- `code/capture.md`" in prompt
+    assert "code/README.md` (sha256" in prompt
+    assert prompt.count("# code/README.md") == 0
+
+
+def test_delta_detects_changed_content(opinions_root: Path) -> None:
+    """A file on both chains whose content differs is reported as changed."""
+    before = resolve_opinions("code", "capture", opinions_root=opinions_root, use_cache=False)
+    _write(opinions_root, "code/principles.md", "Revised.")
+    after = resolve_opinions("code", "execute", opinions_root=opinions_root, use_cache=False)
+
+    changed = compute_opinions_delta(before, after).with_change("changed")
+
+    assert [f.path for f in changed] == ["code/principles.md"]
+    assert changed[0].previous_sha256 != changed[0].sha256
+    assert changed[0].content is not None and "Revised." in changed[0].content
+
+
+def test_opinion_sources_follow_merge_precedence(opinions_root: Path, tmp_path: Path) -> None:
+    """Core beats extensions, and the alphabetically later extension wins."""
+    manifests = []
+    for name in ["alpha-pack", "beta-pack"]:
+        extension = tmp_path / name
+        for target in ["code/principles.md", "code/subtypes/mobile/README.md"]:
+            _write(extension, f"opinions/{target}", name)
+        manifests.append((extension, _manifest(name, "code/principles.md", "code/subtypes/mobile/README.md")))
+
+    sources = opinion_sources(opinions_root, manifests)
+    merged, _ = merge_opinions_with_extensions(opinions_root, manifests)
+
+    assert {path: source for path, (source, _) in sources.items()} == {
+        path: opinion.source for path, opinion in merged.items()
+    }
+    assert sources["code/principles.md"] == ("core", opinions_root / "code/principles.md")
+    assert sources["code/subtypes/mobile/README.md"][0] == "beta-pack"
+
+
+def test_search_finds_core_and_extension_opinions(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Hits carry provenance; a core file shadows an extension contribution."""
+    opinions_root = project / "opinions"
+    _write(opinions_root, "code/principles.md", "Prefer hexagonal architecture.")
+    extension = project / "ext"
+    _write(extension, "opinions/code/subtypes/mobile/README.md", "Hexagonal architecture on mobile.")
+    _write(extension, "opinions/code/principles.md", "Hexagonal architecture everywhere.")
+    manifests = [(extension, _manifest("mobile-pack", "code/subtypes/mobile/README.md", "code/principles.md"))]
+    monkeypatch.setattr(opinions_service, "_get_extension_manifests", lambda _: manifests)
+
+    hits, warning = search_opinions("hexagonal architecture", start_path=project)
+
+    assert warning is None
+    assert sorted((hit.path, hit.source) for hit in hits) == [
+        ("code/principles.md", "core"),
+        ("code/subtypes/mobile/README.md", "mobile-pack"),
+    ]
+    principles = next(hit for hit in hits if hit.path == "code/principles.md")
+    assert principles.lines == ["Prefer hexagonal architecture."]
+    assert search_opinions("hexagonal missing", start_path=project)[0] == []
+
+
+def test_search_index_rereads_only_changed_files(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The persisted index is reused; an edited file is re-tokenized on its own."""
+    search_opinions("guidance", start_path=project)
+    assert (project / ".praxis" / "cache" / "opinions-index.json").exists()
+
+    reads: list[Path] = []
+    original = opinions_index.read_opinion
+
+    def spy(path: Path, *args: Any) -> Any:
+        reads.append(path)
+        return original(path, *args)
+
+    monkeypatch.setattr(opinions_index, "read_opinion", spy)
+    search_opinions("guidance", start_path=project)
+    assert reads == []
+
+    principles = project / "opinions" / "code" / "principles.md"
+    _write(project / "opinions", "code/principles.md", "Coverage matters.")
+    os.utime(principles, ns=(1, 1))
+    hits, _ = search_opinions("coverage", start_path=project)
+
+    assert reads == [principles]
+    assert [hit.path for hit in hits] == ["code/principles.md"]
+
+
+def test_opinions_do_not_load_the_library_stack() -> None:
+    """Opinions search shares the text index module, not the research library code."""
+    code = (
+        "import sys; import praxis.application.opinions_service; "
+        "print(sorted(m for m in sys.modules if m.startswith(('praxis.infrastructure.librar', "
+        "'praxis.infrastructure.catalog'))))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
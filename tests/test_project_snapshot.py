@@ -0,0 +1,81 @@
+"""Unit tests for the per-invocation project snapshot."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from praxis.application.context_service import get_context
+from praxis.application.status_service import get_status
+from praxis.application.validate_service import validate
+from praxis.infrastructure import yaml_loader
+from praxis.infrastructure.project_snapshot import take_project_snapshot
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Code project at Commit with its SOD in place."""
+    (tmp_path / "praxis.yaml").write_text(
+        "domain: code\nstage: commit\nprivacy_level: personal\nenvironment: Home\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "sod.md").write_text("# SOD\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_snapshot_answers_existence_from_listing(project: Path) -> None:
+    """Paths in listed directories are looked up; others fall back to the filesystem."""
+    (project / "src" / "app").mkdir(parents=True)
+    snapshot = take_project_snapshot(project)
+    (project / "docs" / "sod.md").unlink()
+
+    assert snapshot.config is not None
+    assert snapshot.exists("praxis.yaml")
+    assert snapshot.exists(Path("docs/sod.md"))
+    assert not snapshot.exists("docs/capture.md")
+    assert snapshot.exists("src/app")
+    assert not snapshot.exists("src/missing")
+
+
+def test_snapshot_of_project_without_docs(tmp_path: Path) -> None:
+    """A missing docs/ directory is known to be empty and an invalid config has no config."""
+    snapshot = take_project_snapshot(tmp_path)
+
+    assert snapshot.config is None
+    assert "docs" in snapshot.listed
+    assert not snapshot.exists("docs/sod.md")
+
+
+def test_status_parses_praxis_yaml_once(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Status, validation and next steps share a single load of praxis.yaml."""
+    loads: list[Any] = []
+    original = yaml_loader.yaml.safe_load
+
+    def spy(stream: Any) -> Any:
+        loads.append(stream)
+        return original(stream)
+
+    monkeypatch.setattr(yaml_loader.yaml, "safe_load", spy)
+    status = get_status(project)
+
+    assert len(loads) == 1
+    assert status.artifact_exists
+    assert status.validation.valid
+
+
+def test_services_accept_a_shared_snapshot(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Validate and context reuse the caller's snapshot instead of reloading."""
+    monkeypatch.delenv("PRAXIS_HOME", raising=False)
+    snapshot = take_project_snapshot(project)
+    monkeypatch.setattr(
+        yaml_loader.yaml,
+        "safe_load",
+        lambda _: pytest.fail("praxis.yaml loaded again"),
+    )
+
+    assert validate(project, snapshot).valid
+    bundle = get_context(project, snapshot)
+    assert bundle.formalize_artifact["path"] == "docs/sod.md"